@@ -5,11 +5,13 @@ CMD="../src/clients/py/clustermgr-cli.py"
 kern_params="console=ttyS1,115200 console=tty0 syslog=172.22.16.94"
 
 # Load a few hosts
-${CMD} host_add dcswitch61 00:11:22:33:44:61
-${CMD} host_add dcswitch62 00:11:22:33:44:62
-${CMD} host_add dcswitch63 00:11:22:33:44:63
-${CMD} host_add dcswitch64 00:11:22:33:44:64
-${CMD} host_add dcswitch65 00:11:22:33:44:65
+${CMD} host_add_batch - <<EOF
+dcswitch61 00:11:22:33:44:61
+dcswitch62 00:11:22:33:44:62
+dcswitch63 00:11:22:33:44:63
+dcswitch64 00:11:22:33:44:64
+dcswitch65 00:11:22:33:44:65
+EOF
 
 # Create a few projects
 ${CMD} project_add --params "console=ttyS1,115200 console=tty0 syslog=172.22.16.94" proj1 nfs.ucsd.edu /mnt/root/proj1 2.6.32 2.6.32
@@ -22,14 +24,18 @@ ${CMD} user_add bob "Bob User"
 ${CMD} user_add oscar "Oscar User"
 
 # Assign some hosts
-${CMD} host_assign --user alice dcswitch61 proj1
-${CMD} host_assign --user alice dcswitch62 proj1
-${CMD} host_assign --user bob dcswitch63 proj2
-${CMD} host_assign --user bob dcswitch64 proj3
+${CMD} host_assign_batch - <<EOF
+dcswitch61 proj1 alice
+dcswitch62 proj1 alice
+dcswitch63 proj2 bob
+dcswitch64 proj3 bob
+EOF
 
 # and some tags
-${CMD} tag_add dcswitch61 client
-${CMD} tag_add dcswitch62 server
-${CMD} tag_add dcswitch63 t1
-${CMD} tag_add dcswitch63 t2
-${CMD} tag_add dcswitch63 t3
+${CMD} tag_add_batch - <<EOF
+dcswitch61 client
+dcswitch62 server
+dcswitch63 t1
+dcswitch63 t2
+dcswitch63 t3
+EOF
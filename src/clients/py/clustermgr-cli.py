@@ -1,17 +1,18 @@
 #!/usr/bin/env python3
 
-import sys, unittest, argparse, getpass, os
+import sys, unittest, argparse, getpass, os, time
 from urlparse import urlparse
 dir = os.path.dirname(__file__)
 sys.path.append(os.path.join(dir, '../../managerd/gen-py'))
+sys.path.append(os.path.join(dir, '../../managerd'))
 
 from thrift.transport import TTransport
-from thrift.transport import TSocket
 from thrift.transport import THttpClient
-from thrift.protocol import TBinaryProtocol
+import thrift_stack
 
 from ucsd import ClusterManager
 from ucsd.ttypes import *
+from ucsd.constants import NAMES_ONLY, MAPPING_FIELDS
 
 
 #
@@ -21,9 +22,62 @@ from ucsd.ttypes import *
 def ping(client, args):
   client.ping()
 
+def pool_stats(client, args):
+  stats = client.get_pool_stats()
+  for name in sorted(stats):
+    print('%s: %g' % (name, stats[name]))
+
+def cache_stats(client, args):
+  stats = client.get_cache_stats()
+  for name in sorted(stats):
+    print('%s: %g' % (name, stats[name]))
+
+def cache_bypass(client, args):
+  client.set_cache_bypass(args.state == 'on')
+
+def stats(client, args):
+  # busiest first: the RPCs that have taken the most time in all
+  stats = client.get_stats(args.reset)
+  print('%-24s %9s %7s %9s %9s %9s %9s %9s %7s' %
+        ('rpc', 'calls', 'errors', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms',
+         'max_ms', 'redis'))
+  for name in sorted(stats, key=lambda n: -stats[n].calls * stats[n].mean_ms):
+    s = stats[name]
+    print('%-24s %9d %7d %9.2f %9.2f %9.2f %9.2f %9.2f %7.1f' %
+          (name, s.calls, s.errors, s.mean_ms, s.p50_ms, s.p95_ms, s.p99_ms,
+           s.max_ms, s.redis_round_trips))
+
 def host_add(client, args):
   return client.host_add(args.hostname, args.macaddr)
 
+def read_batch(path, min_fields, max_fields):
+  # the whitespace separated fields of each line of path ('-' for stdin),
+  # skipping blank lines and # comments
+  f = sys.stdin if path == '-' else open(path)
+  items = []
+  for (lineno, line) in enumerate(f, 1):
+    fields = line.split('#', 1)[0].split()
+    if not fields:
+      continue
+    if not min_fields <= len(fields) <= max_fields:
+      print('%s:%d: expected %d to %d fields' %
+            (path, lineno, min_fields, max_fields))
+      sys.exit(1)
+    items.append(fields)
+  return items
+
+def report_batch(items, results):
+  # one line per item the server turned down
+  for (item, ok) in zip(items, results):
+    if not ok:
+      print('failed: %s' % ' '.join(item))
+  print('%d of %d succeeded' % (results.count(True), len(results)))
+
+def host_add_batch(client, args):
+  items = read_batch(args.file, 2, 2)
+  report_batch(items, client.host_add_batch(
+    [HostSpec(host=host, macaddr=macaddr) for (host, macaddr) in items]))
+
 def host_remove(client, args):
   return client.host_remove(args.hostname)
 
@@ -41,18 +95,40 @@ def user_remove(client, args):
   return client.user_remove(args.user)
 
 def get_projects(client, args):
+  if args.counts:
+    counts = client.get_project_host_counts()
+    for project in sorted(counts):
+      print('%s: %d' % (project, counts[project]))
+    return
+
   for project in client.get_projects():
     print(project)
 
+def iter_hosts(client, project, tag, page_size, fields=None):
+  # the hosts get_hosts() would return, fetched a page at a time so that
+  # the first can be used before the last has been read
+  cursor = ''
+  while True:
+    page = client.get_hosts_page(HostFilter(project=project, tag=tag),
+                                 cursor, page_size, fields)
+    for host in page.hosts:
+      yield host
+    cursor = page.cursor
+    if not cursor:
+      break
+
 def get_hosts(client, args):
+  if args.query:
+    for host in client.get_hosts_query(args.query, NAMES_ONLY):
+      print(host.name)
+    return
+
   pairs = args.projspec.split(":")
 
   project = pairs[0]
   tag = pairs[1] if len(pairs) > 1 else ''
 
-  hosts = client.get_hosts(project, tag)
-
-  for host in hosts:
+  for host in iter_hosts(client, project, tag, args.page_size, NAMES_ONLY):
     print(host.name)
 
 def get_tags(client, args):
@@ -61,21 +137,92 @@ def get_tags(client, args):
   for tag in tags:
     print(tag)
 
-def mapping(client, args):
-  hosts = client.get_hosts(None, None)
-
+def print_mapping(hosts):
   for host in hosts:
     print('%s: <%s> %s' % (host.name, host.assigned_project, host.tags))
 
+def mapping(client, args):
+  if not args.poll:
+    print_mapping(iter_hosts(client, '', '', args.page_size,
+                             MAPPING_FIELDS))
+    return
+
+  # reprint the mapping whenever it changes; between changes we sit in
+  # watch(), which answers as soon as one is made and otherwise every
+  # --poll seconds
+  generation = -1
+  while True:
+    update = client.get_hosts_if_changed(generation, None, None,
+                                         MAPPING_FIELDS)
+    if update.hosts is not None:
+      print('# generation %d' % update.generation)
+      print_mapping(update.hosts)
+      sys.stdout.flush()
+    generation = update.generation
+    watch(client, generation, args.poll, None)
+
+def watch(client, since_version, timeout, change_filter):
+  # client.watch(), sleeping out the rest of timeout if it answers early
+  # with nothing: managerd does that when too many watches are waiting
+  # already, and asking again straight away would only add to its load
+  start = time.time()
+  page = client.watch(since_version, int(timeout * 1000), change_filter)
+  if not page.changes and not page.resync_required:
+    time.sleep(max(0, start + timeout - time.time()))
+  return page
+
+def generation(client, args):
+  print(client.get_generation())
+
+def changes(client, args):
+  version = args.since
+  change_filter = ChangeFilter(ops=args.op, names=args.name)
+  while True:
+    if args.op or args.name or args.follow:
+      # the server skips what doesn't match; with --follow it waits for
+      # the next change, and we ask again if none comes in time
+      page = watch(client, version, args.follow or 0, change_filter)
+    else:
+      page = client.get_changes(version, args.limit)
+    if page.resync_required:
+      print('# change log no longer reaches back to %d, resync from %d' %
+            (version, page.version))
+    for change in page.changes:
+      fields = [str(change.version), change.op, change.name]
+      fields += ['%s=%s' % (k, change.args[k]) for k in sorted(change.args)]
+      print(' '.join(fields))
+    sys.stdout.flush()
+    version = page.version
+
+    if not page.more and not args.follow:
+      break
+
 def host_assign(client, args):
   client.host_assign(args.host, args.project, args.user)
 
+def host_allocate(client, args):
+  for host in client.host_allocate(args.project, args.count, args.where,
+                                   args.user):
+    print(host.name)
+
+def host_assign_batch(client, args):
+  items = read_batch(args.file, 2, 3)
+  report_batch(items, client.host_assign_batch(
+    [Assignment(host=item[0], project=item[1],
+                user=item[2] if len(item) > 2 else args.user)
+     for item in items]))
+
 def host_release(client, args):
   client.host_release(args.host)
 
 def tag_add(client, args):
   client.tag_add(args.host, args.tag)
 
+def tag_add_batch(client, args):
+  items = read_batch(args.file, 2, 2)
+  report_batch(items, client.tag_add_batch(
+    [HostTag(host=host, tag=tag) for (host, tag) in items]))
+
 def tag_removeAll(client, args):
   client.tag_removeAll(args.host)
 
@@ -83,11 +230,8 @@ def tag_removeAll(client, args):
 # connection handling
 #
 
-def connect_to_managerd(host, port):
-  socket = TSocket.TSocket(host, port)
-  transport = TTransport.TBufferedTransport(socket)
-  protocol = TBinaryProtocol.TBinaryProtocol(transport)
-  client = ClusterManager.Client(protocol)
+def connect_to_managerd(host, port, protocol="binary", transport="buffered"):
+  (transport, client) = thrift_stack.client(host, port, protocol, transport)
 
   try:
     transport.open()
@@ -114,18 +258,51 @@ def main():
                       default="localhost")
   parser.add_argument("-p", "--port", help="manager port",
                       type=int, default=9090)
+  thrift_stack.add_arguments(parser)
   subparsers = parser.add_subparsers(help='sub-command help')
 
   # ping
   parser_ping = subparsers.add_parser('ping', help='ping the managerd server')
   parser_ping.set_defaults(func=ping)
 
+  # pool_stats
+  parser_poolstats = subparsers.add_parser('pool_stats',
+                            help="show managerd's redis connection pool stats")
+  parser_poolstats.set_defaults(func=pool_stats)
+
+  # cache_stats
+  parser_cachestats = subparsers.add_parser('cache_stats',
+                            help="show managerd's read cache stats")
+  parser_cachestats.set_defaults(func=cache_stats)
+
+  # cache_bypass
+  parser_cachebypass = subparsers.add_parser('cache_bypass',
+                            help="bypass managerd's read cache, or stop")
+  parser_cachebypass.add_argument('state', choices=['on', 'off'])
+  parser_cachebypass.set_defaults(func=cache_bypass)
+
+  # stats
+  parser_stats = subparsers.add_parser('stats',
+                            help="show managerd's per-RPC call counts and "
+                                 "latencies")
+  parser_stats.add_argument('--reset', action='store_true',
+                            help='start the counts afresh afterwards')
+  parser_stats.set_defaults(func=stats)
+
   # host_add
   parser_hostadd = subparsers.add_parser('host_add', help='add a new host')
   parser_hostadd.add_argument('hostname', help='name of the host to add')
   parser_hostadd.add_argument('macaddr', help='macaddr of host')
   parser_hostadd.set_defaults(func=host_add)
 
+  # host_add_batch
+  parser_hostaddbatch = subparsers.add_parser('host_add_batch',
+                            help='add many hosts in one call')
+  parser_hostaddbatch.add_argument('file',
+                            help="file of 'hostname macaddr' lines, "
+                                 "or - for stdin")
+  parser_hostaddbatch.set_defaults(func=host_add_batch)
+
   # host_remove
   parser_hostrem = subparsers.add_parser('host_remove', help='remove a host')
   parser_hostrem.add_argument('hostname', help='name of the host to remove')
@@ -164,6 +341,8 @@ def main():
   # get_projects
   parser_getproj = subparsers.add_parser('get_projects',
                                          help='query projects')
+  parser_getproj.add_argument('-c', '--counts', action='store_true',
+                              help='show the number of hosts in each project')
   parser_getproj.set_defaults(func=get_projects)
 
   # get_hosts
@@ -171,6 +350,12 @@ def main():
                                           help='query hosts')
   parser_gethosts.add_argument('projspec', help='project[:tag] specification',
                                default="", nargs='?')
+  parser_gethosts.add_argument('--page-size', type=int, default=500,
+                               help='hosts fetched per call')
+  parser_gethosts.add_argument('-q', '--query',
+                               help='hosts matching a tag expression instead, '
+                                    'e.g. "project:p1 & (rack12 | rack13) '
+                                    '& !degraded"')
   parser_gethosts.set_defaults(func=get_hosts)
 
   # get_tags
@@ -180,8 +365,37 @@ def main():
   
   # mapping
   parser_mapping = subparsers.add_parser('mapping', help='host mapping')
+  parser_mapping.add_argument('--poll', type=float, metavar='SECONDS',
+                              help='keep checking, and reprint the mapping '
+                                   'whenever it changes')
+  parser_mapping.add_argument('--page-size', type=int, default=500,
+                              help='hosts fetched per call, without --poll')
   parser_mapping.set_defaults(func=mapping)
 
+  # generation
+  parser_generation = subparsers.add_parser('generation',
+                            help='show the inventory generation, which '
+                                 'every change bumps')
+  parser_generation.set_defaults(func=generation)
+
+  # changes
+  parser_changes = subparsers.add_parser('changes',
+                            help='show the changes made after a version')
+  parser_changes.add_argument('since', type=int, nargs='?', default=0,
+                              help='version to start after')
+  parser_changes.add_argument('--limit', type=int, default=100,
+                              help='changes fetched per call')
+  parser_changes.add_argument('--follow', type=float, metavar='SECONDS',
+                              help='keep waiting for new changes, asking '
+                                   'again every SECONDS')
+  parser_changes.add_argument('--op', action='append',
+                              help='only changes of this kind, e.g. '
+                                   'host_assign (may be repeated)')
+  parser_changes.add_argument('--name', action='append',
+                              help='only changes to this host, project or '
+                                   'user (may be repeated)')
+  parser_changes.set_defaults(func=changes)
+
   # host_assign
   parser_hostassign = subparsers.add_parser('host_assign',
                                             help='assign a host to a project')
@@ -191,6 +405,30 @@ def main():
                                  default=getpass.getuser())
   parser_hostassign.set_defaults(func=host_assign)
 
+  # host_allocate
+  parser_hostallocate = subparsers.add_parser('host_allocate',
+                            help='assign some available hosts to a project')
+  parser_hostallocate.add_argument('project', help='project to assign them to')
+  parser_hostallocate.add_argument('count', type=int,
+                            help='how many hosts; all or none are assigned')
+  parser_hostallocate.add_argument('--where',
+                            help='tag expression the hosts must match, '
+                                 'e.g. "rack12 & !degraded"')
+  parser_hostallocate.add_argument('--user', help='user who should own them',
+                            default=getpass.getuser())
+  parser_hostallocate.set_defaults(func=host_allocate)
+
+  # host_assign_batch
+  parser_hostassignbatch = subparsers.add_parser('host_assign_batch',
+                            help='assign many hosts in one call')
+  parser_hostassignbatch.add_argument('file',
+                            help="file of 'host project [user]' lines, "
+                                 "or - for stdin")
+  parser_hostassignbatch.add_argument('--user',
+                            help='owner of hosts whose line names none',
+                            default=getpass.getuser())
+  parser_hostassignbatch.set_defaults(func=host_assign_batch)
+
   # host_release
   parser_hostrelease = \
     subparsers.add_parser('host_release', help='unassign a host from a project')
@@ -203,6 +441,13 @@ def main():
   parser_tagadd.add_argument('tag', help='tag')
   parser_tagadd.set_defaults(func=tag_add)
 
+  # tag_add_batch
+  parser_tagaddbatch = subparsers.add_parser('tag_add_batch',
+                            help='add many tags in one call')
+  parser_tagaddbatch.add_argument('file',
+                            help="file of 'host tag' lines, or - for stdin")
+  parser_tagaddbatch.set_defaults(func=tag_add_batch)
+
   # tag_removeAll
   parser_tagRemAll = subparsers.add_parser('tag_removeAll',
                                              help='remove tags from a host')
@@ -211,7 +456,8 @@ def main():
 
   args = parser.parse_args()
 
-  (transport,client) = connect_to_managerd(args.server, args.port)
+  (transport,client) = connect_to_managerd(args.server, args.port,
+                                           args.protocol, args.transport)
   args.func(client, args)
   close_managerd(transport)
 
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+# Tests of tftpd's handling of pxelinux config requests, with the managerd
+# lookups stubbed out.  Run with python -m unittest test_tftpd from this
+# directory.
+
+import os, struct, sys, unittest
+dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(dir, '../../managerd/gen-py'))
+sys.path.append(os.path.join(dir, '../../managerd'))
+
+from twisted.internet import defer
+from twisted.python import failure
+
+import tftpd
+from ucsd.ttypes import *
+
+MAC = "02:00:00:00:00:01"
+ADDRESS = ("10.0.0.1", 2000)
+
+def rrq(fname):
+    return struct.pack('!H', tftpd.OP_RRQ) + fname + '\0octet\0'
+
+class StubBatcher(object):
+    # hands out Deferreds for the test to fire
+    def __init__(self):
+        self.lookups = []
+
+    def lookup(self, mac):
+        d = defer.Deferred()
+        self.lookups.append((mac, d))
+        return d
+
+class StubTransport(object):
+    def __init__(self):
+        self.sent = []
+
+    def write(self, datagram, address):
+        self.sent.append((datagram, address))
+
+class PxeConfigTest(unittest.TestCase):
+    def setUp(self):
+        tftpd.verbose = False
+        tftpd.batcher = self.batcher = StubBatcher()
+        self.protocol = tftpd.TFTP()
+        self.protocol.transport = self.transport = StubTransport()
+        self.fname = '/pxelinux.cfg/01-' + MAC.replace(':', '-')
+
+    def tearDown(self):
+        # the retransmission and timeout timers of sessions still sending
+        for session in self.protocol.sessions.values():
+            session.clearTimers()
+            try:
+                session.timeout_timer.cancel()
+            except:
+                pass
+
+    def opcode(self, datagram):
+        return struct.unpack('!H', datagram[0:2])[0]
+
+    def test_known_mac(self):
+        self.protocol.datagramReceived(rrq(self.fname), ADDRESS)
+        self.assertEqual([mac for (mac, d) in self.batcher.lookups], [MAC])
+        self.assertEqual(self.transport.sent, [])
+
+        self.batcher.lookups[0][1].callback(BootConfig(
+            project="proj", kernel="k", initrd="i", nfsserver="nfs",
+            nfsroot="/root/proj", parameters="console=ttyS0"))
+        [(datagram, address)] = self.transport.sent
+        self.assertEqual(address, ADDRESS)
+        self.assertEqual(self.opcode(datagram), tftpd.OP_DATA)
+        self.assertTrue("nfsroot/vmlinuz-k" in datagram)
+        self.assertEqual(self.protocol.sessions[ADDRESS].state, tftpd.S_ACK)
+
+    def check_not_found(self):
+        [(datagram, address)] = self.transport.sent
+        self.assertEqual(self.opcode(datagram), tftpd.OP_ERROR)
+        self.assertEqual(struct.unpack('!H', datagram[2:4])[0],
+                         tftpd.ERR_NOTFOUND)
+        # the session is gone, so a retry is looked up afresh
+        self.assertFalse(ADDRESS in self.protocol.sessions)
+        self.protocol.datagramReceived(rrq(self.fname), ADDRESS)
+        self.assertEqual(len(self.batcher.lookups), 2)
+
+    def test_unknown_mac(self):
+        self.protocol.datagramReceived(rrq(self.fname), ADDRESS)
+        self.batcher.lookups[0][1].callback(None)
+        self.check_not_found()
+
+    def test_lookup_failed(self):
+        self.protocol.datagramReceived(rrq(self.fname), ADDRESS)
+        self.batcher.lookups[0][1].errback(failure.Failure(
+            Exception("managerd went away")))
+        self.check_not_found()
+
+    def test_retransmitted_rrq_while_looking_up(self):
+        self.protocol.datagramReceived(rrq(self.fname), ADDRESS)
+        self.protocol.datagramReceived(rrq(self.fname), ADDRESS)
+        self.assertEqual(len(self.batcher.lookups), 1)
+        self.assertEqual(self.transport.sent, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,12 +8,12 @@ warnings.filterwarnings('ignore','.*',UserWarning,'zope')
 
 import sys
 sys.path.append('../../managerd/gen-py')
+sys.path.append('../../managerd')
 
 from thrift.transport import TTransport
-from thrift.transport import TSocket
 from thrift.transport import THttpClient
-from thrift.protocol import TBinaryProtocol
 from ucsd import ClusterManager
+import thrift_stack
 from ucsd.ttypes import *
 
 from string import Template
@@ -21,14 +21,15 @@ from string import Template
 from datetime import datetime, timedelta
 
 from twisted.internet.protocol import DatagramProtocol, ServerFactory
-from twisted.internet import reactor, task, defer
+from twisted.internet import reactor, task, defer, threads
+from twisted.python.threadpool import ThreadPool
 import logging, logging.handlers
-import struct, re, daemon, argparse, os
+import struct, re, daemon, argparse, os, threading
 
 (OP_RRQ, OP_WRQ, OP_DATA, OP_ACK, OP_ERROR, OP_OACK) = range(1,7)
 (ERR_UNDEF, ERR_NOTFOUND, ERR_ACCESS, ERR_DISKFULL, ERR_ILLEGAL,
         ERR_UNKNOWN_TID, ERR_EXISTS, ERR_USER) = range(0,8)
-(S_RRQ, S_ACK) = range(0,2)
+(S_RRQ, S_LOOKUP, S_ACK) = range(0,3)
 
 mac_str = "-".join(['[0-9a-fA-F]{2}' for nil in range(0,6)])
 pxe_mac_re = re.compile('/pxelinux.cfg/01-(' + mac_str + ')$')
@@ -40,11 +41,10 @@ SESSION_TIMEOUT = 30
 
 logger = logging.getLogger('')
 
-def connect_to_managerd(host, port):
-  socket = TSocket.TSocket(host, port)
-  transport = TTransport.TBufferedTransport(socket)
-  protocol = TBinaryProtocol.TBinaryProtocol(transport)
-  client = ClusterManager.Client(protocol)
+def connect_to_managerd(host, port, protocol="binary", transport="buffered",
+                        timeout=None):
+  (transport, client) = thrift_stack.client(host, port, protocol, transport,
+                                            timeout)
 
   try:
     transport.open()
@@ -59,56 +59,158 @@ def close_managerd(transport):
   if transport:
     transport.close()
 
+class ManagerdConnections(object):
+    # connections to managerd for the lookup threads.  A thrift client
+    # can't be shared between threads, so each call takes an idle
+    # connection to itself, or opens another if there is none; there are
+    # never more than there are threads.
+    def __init__(self, host, port, protocol, transport, timeout):
+        self.connect_args = (host, port, protocol, transport, timeout)
+        self.lock = threading.Lock()
+        # (transport, client) pairs not in use
+        self.idle = []
+
+    def add(self, transport, client):
+        with self.lock:
+            self.idle.append((transport, client))
+
+    def call(self, api, *args):
+        # client.api(*args) on one of the connections; blocks, so is run
+        # in a thread
+        with self.lock:
+            connection = self.idle.pop() if self.idle else None
+        if connection is None:
+            connection = thrift_stack.client(*self.connect_args)
+            connection[0].open()
+        (transport, client) = connection
+        try:
+            result = getattr(client, api)(*args)
+        except:
+            # it may be half way through a reply; the next call connects
+            # afresh
+            close_managerd(transport)
+            raise
+        self.add(transport, client)
+        return result
+
+    def close(self):
+        with self.lock:
+            (idle, self.idle) = (self.idle, [])
+        for (transport, client) in idle:
+            close_managerd(transport)
+
+class LookupBatcher(object):
+    # gathers the lookups made within window seconds of each other into a
+    # single lookup_batch() call, so that a rack booting at once costs one
+    # round trip to managerd rather than one per host.  The calls are made
+    # from threadpool, leaving the reactor to carry on with the transfers
+    # in progress however long managerd takes.
+    def __init__(self, connections, threadpool, window, max_batch=256):
+        self.connections = connections
+        self.threadpool = threadpool
+        self.window = window
+        self.max_batch = max_batch
+        # mac -> Deferreds waiting for its BootConfig
+        self.pending = {}
+        self.flush_timer = None
+
+    def lookup(self, mac):
+        # a Deferred firing with the mac's BootConfig, or None if it has
+        # none
+        d = defer.Deferred()
+        self.pending.setdefault(mac, []).append(d)
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.flush_timer is None:
+            self.flush_timer = reactor.callLater(self.window, self.flush)
+        return d
+
+    def flush(self):
+        if self.flush_timer is not None and self.flush_timer.active():
+            self.flush_timer.cancel()
+        self.flush_timer = None
+
+        (pending, self.pending) = (self.pending, {})
+        if not pending:
+            return
+
+        logger.info('looking up %d mac addresses' % len(pending))
+        d = threads.deferToThreadPool(reactor, self.threadpool,
+                                      self.connections.call, "lookup_batch",
+                                      pending.keys())
+        d.addCallbacks(self.looked_up, self.lookup_failed,
+                       callbackArgs=(pending,), errbackArgs=(pending,))
+        return d
+
+    def looked_up(self, bootconfigs, pending):
+        for (mac, waiting) in pending.items():
+            for d in waiting:
+                d.callback(bootconfigs.get(mac))
+
+    def lookup_failed(self, failure, pending):
+        for waiting in pending.values():
+            for d in waiting:
+                d.errback(failure)
+
+def pxe_config(fname, mac, bootconfig):
+    logger.info('got host record: %s' % str(bootconfig))
+    if bootconfig is None:
+        logger.debug('Error looking up mac in %s (no bootconfig)' % fname)
+        return None
+
+    kernel = 'nfsroot/vmlinuz-%s' % (bootconfig.kernel,)
+    if bootconfig.initrd != '':
+        initrd = 'initrd=nfsroot/initrd.img-%s' % (bootconfig.initrd,)
+    else:
+        initrd = 'noinitrd'
+    root = '%s:%s' % (bootconfig.nfsserver,bootconfig.nfsroot,)
+
+    parameters = bootconfig.parameters
+
+    pxeconfig = {
+                  'project': bootconfig.project,
+                  'kernel': kernel,
+                  'root': root,
+                  'initrd': initrd,
+                  'parameters': parameters,
+                }
+
+    template_file = os.path.join(os.path.dirname(__file__),
+                                 'pxelinux.conf')
+    template = Template(open(template_file,'r').read())
+    cfg = template.safe_substitute(pxeconfig)
+
+    logger.info('Serving project %s to %s' % (bootconfig.project, mac))
+
+    logger.debug(cfg)
+
+    return cfg
+
+def lookup_failed(failure, fname):
+    logger.debug('Error looking up mac in %s (%s)' %
+                 (fname, failure.getErrorMessage()))
+    return None
+
 def lookup_file(fname):
+    # the contents of fname, or None if there's no such file.  pxelinux
+    # configs are looked up in managerd, so for those this returns a
+    # Deferred firing with them.
     global verbose
-    global client
+    global batcher
 
     if verbose:
         logger.info("Received request from %s" % fname)
 
-    try:
-        pxe_match = pxe_mac_re.match(fname)
-        if pxe_match:
-            inmac = pxe_match.group(1)
-            outmac = ":".join(inmac.split("-"))
-
-            logger.info('looking up mac address %s' % outmac)
-            bootconfig = client.lookup(outmac)
-            logger.info('got host record: %s' % str(bootconfig))
-
-            kernel = 'nfsroot/vmlinuz-%s' % (bootconfig.kernel,)
-            if bootconfig.initrd != '':
-                initrd = 'initrd=nfsroot/initrd.img-%s' % (bootconfig.initrd,)
-            else:
-                initrd = 'noinitrd'
-            root = '%s:%s' % (bootconfig.nfsserver,bootconfig.nfsroot,)
-
-            parameters = bootconfig.parameters
-
-            pxeconfig = {
-                          'project': bootconfig.project,
-                          'kernel': kernel,
-                          'root': root,
-                          'initrd': initrd,
-                          'parameters': parameters,
-                        }
-
-            template_file = os.path.join(os.path.dirname(__file__),
-                                         'pxelinux.conf')
-            template = Template(open(template_file,'r').read())
-            cfg = template.safe_substitute(pxeconfig)
-
-            logger.info('Serving project %s to %s' % (bootconfig.project, outmac))
-
-            logger.debug(cfg)
-
-            return cfg
-    except IndexError:
-        logger.debug('Error looking up host for mac in %s' % fname)
-        pass
-    except Exception, e:
-        logger.debug('Error looking up mac in %s (%s)' % (fname, str(e)))
-        return None
+    pxe_match = pxe_mac_re.match(fname)
+    if pxe_match:
+        inmac = pxe_match.group(1)
+        outmac = ":".join(inmac.split("-"))
+
+        logger.info('looking up mac address %s' % outmac)
+        d = batcher.lookup(outmac)
+        d.addCallback(lambda bootconfig: pxe_config(fname, outmac, bootconfig))
+        d.addErrback(lookup_failed, fname)
+        return d
 
     # This is to work around a bug(?) in the OpenSolaris booter
     if fname == "//pxegrub.0":
@@ -148,6 +250,9 @@ class TFTPSession(object):
             self.retry_timer.cancel()
         except:
             pass
+        # as the first of timeout_event's callbacks, passes the session on
+        # to the protocol's removeSession
+        return self
 
     def handle_datagram(self, dg, send_func):
         (opcode,) = struct.unpack('!H', dg[0:2])
@@ -158,6 +263,9 @@ class TFTPSession(object):
             if opcode != OP_RRQ:
                 return False
             return self.handle_rrq(dg[2:], send_func)
+        elif self.state == S_LOOKUP:
+            # a retransmitted RRQ while its data is still being looked up
+            return True
         elif self.state == S_ACK:
             if opcode != OP_ACK:
                 return False
@@ -169,6 +277,19 @@ class TFTPSession(object):
     def handle_rrq(self, dg, send_func):
         args = (dg.split('\0'))[:-1]
 
+        data = lookup_file(args[0])
+        if isinstance(data, defer.Deferred):
+            self.state = S_LOOKUP
+            data.addCallback(self.rrq_looked_up, args, send_func)
+            return True
+        return self.finish_rrq(data, args, send_func)
+
+    def rrq_looked_up(self, data, args, send_func):
+        if not self.finish_rrq(data, args, send_func):
+            # removes the session
+            self.timeout_event.callback(self)
+
+    def finish_rrq(self, data, args, send_func):
         fname_str = args[0]
         mode_str = args[1]
 
@@ -176,7 +297,7 @@ class TFTPSession(object):
 
         ack_args = []
 
-        self.data = lookup_file(fname_str)
+        self.data = data
         if self.data is None:
             self.send_error(ERR_NOTFOUND, fname_str + " not found", send_func)
             return False
@@ -281,11 +402,11 @@ class TFTP(DatagramProtocol):
                 del self.sessions[addr]
 
     def removeSession(self, session):
-        try:
-            session.clearTimers()
+        session.clearTimers()
+        # a session's timeout can fire after a new one has taken its
+        # address
+        if self.sessions.get(session.address) is session:
             del self.sessions[session.address]
-        except:
-            pass
 
     def datagramReceived(self, datagram, address):
         if self.sessions.has_key(address):
@@ -299,6 +420,10 @@ class TFTP(DatagramProtocol):
         if not res:
             self.removeSession(session)
 
+def start_threadpool(threadpool):
+    reactor.callWhenRunning(threadpool.start)
+    reactor.addSystemEventTrigger('during', 'shutdown', threadpool.stop)
+
 def run_reactor():
     logger.info('SEED TFTP Starting')
     reactor.listenUDP(TFTP_PORT, TFTP())
@@ -306,7 +431,7 @@ def run_reactor():
 
 def main():
     global verbose
-    global client
+    global batcher
     global tftp_path
 
     parser = argparse.ArgumentParser(description="Cluster manager tftp server",
@@ -327,6 +452,18 @@ def main():
                         nargs=1)
     parser.add_argument("-r", "--rootpath",
                         help="tftp root path", default="/tftproot")
+    parser.add_argument("-w", "--lookup_window",
+                        help="seconds to gather mac lookups for one "
+                             "lookup_batch call",
+                        default=0.05, type=float)
+    parser.add_argument("--lookup_threads",
+                        help="most lookup_batch calls to managerd at once",
+                        default=4, type=int)
+    parser.add_argument("--lookup_timeout",
+                        help="seconds to wait for managerd before failing a "
+                             "lookup",
+                        default=10, type=float)
+    thrift_stack.add_arguments(parser)
 
     args = parser.parse_args()
     verbose = args.verbose
@@ -340,11 +477,26 @@ def main():
 
     tftp_path = args.rootpath
 
-    (transport, client) = connect_to_managerd(args.server, args.port)
+    if args.lookup_threads < 1:
+        parser.error("--lookup_threads must be at least 1")
+
+    # fail now if managerd isn't there, rather than at the first boot
+    (transport, client) = connect_to_managerd(args.server, args.port,
+                                              args.protocol, args.transport,
+                                              args.lookup_timeout)
+    connections = ManagerdConnections(args.server, args.port, args.protocol,
+                                      args.transport, args.lookup_timeout)
+    connections.add(transport, client)
+    threadpool = ThreadPool(0, args.lookup_threads, "managerd lookups")
+    start_threadpool(threadpool)
+    batcher = LookupBatcher(connections, threadpool, args.lookup_window)
 
     if args.test:
-      lookup_file('/pxelinux.cfg/01-' + args.test[0].replace(':','-'))
-      close_managerd(transport)
+      d = lookup_file('/pxelinux.cfg/01-' + args.test[0].replace(':','-'))
+      batcher.flush()
+      d.addBoth(lambda result: reactor.stop())
+      reactor.run()
+      connections.close()
       sys.exit(0)
 
     try:
@@ -372,7 +524,7 @@ def main():
     except Exception, e:
         logger.error(str(e))
     finally:
-        close_managerd(transport)
+        connections.close()
 
 if __name__ == '__main__':
     main()
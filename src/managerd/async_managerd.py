@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+#
+# An asyncio managerd, for Python 3, to put in front of the ordinary ones
+# when thousands of clients connect at once: every tftpd during a boot
+# storm, CLIs and dashboards waiting in watch().  One process holds all of
+# their connections, and an RPC waiting on redis holds up nothing else.
+#
+# It answers the RPCs those clients make -- ping, lookup, lookup_batch,
+# get_generation, get_changes and watch -- itself, straight from the
+# redis database.  The lookups of concurrent calls share pipelined round
+# trips, and the watch()es wait on one redis subscription.
+# Every other call is passed on to an ordinary managerd (--backend_server,
+# --backend_port) over a small pool of connections, so that writes still
+# go through the one implementation that checks them, records the changes
+# and invalidates the caches.  Those changes come back to us over redis
+# pub/sub to wake our watch()es.
+#
+# The backend must be a managerd with --storage redis on the same
+# database; it upgrades the database as it starts.  Clients need no
+# changes: the wire format is managerd's, with the same --protocol and
+# --transport choices except json.
+# get_stats() gives our own figures for the RPCs answered here and the
+# backend's for the rest.
+#
+# Needs Python 3, redis-py 4.2 or later (for redis.asyncio) and thriftpy2,
+# which reads the service from the IDL rather than from the Python 2
+# generated code.
+#
+
+import argparse, asyncio, contextvars, io, logging, os, re, sys, time
+
+import redis.asyncio
+import redis.exceptions
+import thriftpy2
+from thriftpy2.contrib.aio.protocol.binary import TAsyncBinaryProtocolFactory
+from thriftpy2.contrib.aio.protocol.compact import TAsyncCompactProtocolFactory
+from thriftpy2.contrib.aio.rpc import make_client, make_server
+from thriftpy2.contrib.aio.transport.buffered import (
+  TAsyncBufferedTransportFactory)
+from thriftpy2.contrib.aio.transport.framed import TAsyncFramedTransportFactory
+from thriftpy2.thrift import TException
+from thriftpy2.transport import TTransportException
+
+import queued_logging
+import redis_scripts
+import rpc_stats
+from redis_keys import *
+
+log = logging.getLogger("async_managerd")
+
+IDL = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                   "../../thrift/ucsd-cluster-mgr.thrift")
+
+# thrift_stack.py's choices that thriftpy2 can speak asynchronously;
+# accelerated is binary on the wire
+PROTOCOLS = {
+  "binary": TAsyncBinaryProtocolFactory,
+  "accelerated": TAsyncBinaryProtocolFactory,
+  "compact": TAsyncCompactProtocolFactory,
+}
+TRANSPORTS = {
+  "buffered": TAsyncBufferedTransportFactory,
+  "framed": TAsyncFramedTransportFactory,
+}
+
+# as in managerd.py
+MAX_CHANGES_PAGE = 1000
+MAX_WATCH_MS = 60000
+
+# the RPCs answered here rather than by the backend
+NATIVE_RPCS = ("ping", "lookup", "lookup_batch", "get_generation",
+               "get_changes", "watch", "get_stats")
+
+# (RPC name, call number) of the call each task is serving, for the log;
+# rpc_stats.current is per thread, and every task shares the one thread
+current_call = contextvars.ContextVar("current_call", default=(None, None))
+
+def load_service():
+  # thriftpy2 reserves "args" for itself, but field names never go over
+  # the wire, so Change.args can be loaded as args_
+  with open(IDL) as idl:
+    source = re.sub(r'map<string,string> args\b', 'map<string,string> args_',
+                    idl.read())
+  return thriftpy2.load_fp(io.StringIO(source), module_name="ucsd_thrift")
+
+ucsd = load_service()
+
+# storage.py's, which can't be imported here since it needs the Python 2
+# thrift code
+def canonical_mac(macaddr):
+  return macaddr.strip().lower()
+
+def log_covers(since_version, generation, oldest_version):
+  if since_version > generation:
+    return False
+  elif since_version == generation:
+    return True
+  return oldest_version is not None and oldest_version <= since_version + 1
+
+class AsyncChangeNotifier(object):
+  # change_notifier.ChangeNotifier for coroutines: wait() until there has
+  # been a notification since sequence was read
+  def __init__(self):
+    self.sequence = 0
+    self.event = asyncio.Event()
+
+  def notify(self):
+    self.sequence += 1
+    self.event.set()
+    self.event = asyncio.Event()
+
+  async def wait(self, sequence, timeout):
+    if self.sequence != sequence:
+      return True
+    try:
+      await asyncio.wait_for(self.event.wait(), timeout)
+      return True
+    except asyncio.TimeoutError:
+      return False
+
+class LookupCoalescer(object):
+  # the LOOKUP scripts of every lookup() and lookup_batch() in progress
+  # are sent together, one pipeline per turn of the event loop (or per
+  # max_batch lookups), so that a boot storm costs a few round trips and
+  # redis connections rather than one of each per tftp request
+  def __init__(self, r_server, max_batch=256):
+    self.r_server = r_server
+    self.max_batch = max_batch
+    self.script = r_server.register_script(redis_scripts.LOOKUP)
+    # (macaddr, future for the script's reply) waiting to be sent
+    self.pending = []
+    # the pipelines in flight, since the loop only holds its tasks weakly
+    self.sending = set()
+
+  def lookup(self, macaddr):
+    future = asyncio.get_running_loop().create_future()
+    self.pending.append((macaddr, future))
+    if len(self.pending) >= self.max_batch:
+      self.flush()
+    elif len(self.pending) == 1:
+      asyncio.get_running_loop().call_soon(self.flush)
+    return future
+
+  def flush(self):
+    if not self.pending:
+      return
+    (batch, self.pending) = (self.pending, [])
+    task = asyncio.ensure_future(self.send(batch))
+    self.sending.add(task)
+    task.add_done_callback(self.sending.discard)
+
+  async def send(self, batch):
+    try:
+      try:
+        replies = await self.evalsha(batch)
+      except redis.exceptions.NoScriptError:
+        # redis restarted since we loaded it
+        await self.r_server.script_load(redis_scripts.LOOKUP)
+        replies = await self.evalsha(batch)
+    except Exception as e:
+      for (macaddr, future) in batch:
+        if not future.done():
+          future.set_exception(e)
+      return
+    for ((macaddr, future), reply) in zip(batch, replies):
+      if not future.done():
+        future.set_result(reply)
+
+  async def evalsha(self, batch):
+    # plain EVALSHAs rather than the Script object, which would check
+    # that the script is loaded with a round trip of its own every time
+    pipe = self.r_server.pipeline(transaction=False)
+    for (macaddr, future) in batch:
+      pipe.evalsha(self.script.sha, 1, MACADDR_INDEX, canonical_mac(macaddr),
+                   "host_", "project_", ucsd.HostStatus.ASSIGNED)
+    return await pipe.execute()
+
+class Backend(object):
+  # connections to the managerd behind us, opened as needed, at most size
+  # of them at once; one that fails is dropped rather than reused
+  def __init__(self, host, port, size, timeout, proto_factory,
+               trans_factory):
+    self.host = host
+    self.port = port
+    self.timeout = timeout
+    self.proto_factory = proto_factory
+    self.trans_factory = trans_factory
+    self.slots = asyncio.Semaphore(size)
+    self.idle = []
+
+  async def call(self, api, args):
+    async with self.slots:
+      if self.idle:
+        client = self.idle.pop()
+      else:
+        client = await make_client(ucsd.ClusterManager, self.host, self.port,
+                                   proto_factory=self.proto_factory,
+                                   trans_factory=self.trans_factory,
+                                   timeout=self.timeout)
+      reusable = False
+      try:
+        result = await getattr(client, api)(*args)
+        reusable = True
+        return result
+      except TTransportException:
+        raise
+      except TException:
+        # one the RPC declares, or the backend's own TApplicationException;
+        # either way the connection is still in step
+        reusable = True
+        raise
+      finally:
+        if reusable:
+          self.idle.append(client)
+        else:
+          client.close()
+
+def numbered(name, method, stats=None):
+  # method, run as a numbered call of the RPC name, and timed into stats
+  # (an rpc_stats.MethodStats) if given.  No redis round trips are charged
+  # to the calls: LookupCoalescer shares them between calls.
+  async def call(*args):
+    token = current_call.set((name, next(rpc_stats.call_numbers)))
+    start = time.time()
+    error = True
+    try:
+      result = await method(*args)
+      error = False
+      return result
+    finally:
+      current_call.reset(token)
+      if stats is not None:
+        stats.record(time.time() - start, error, 0)
+  return call
+
+def rpc_stats_struct(summary):
+  # an RpcStats from an rpc_stats summary, as managerd's get_stats() makes
+  (calls, errors, mean, p50, p95, p99, longest, round_trips) = summary
+  return ucsd.RpcStats(calls=calls, errors=errors, mean_ms=1000 * mean,
+                       p50_ms=1000 * p50, p95_ms=1000 * p95,
+                       p99_ms=1000 * p99, max_ms=1000 * longest,
+                       redis_round_trips=round_trips)
+
+class AsyncClusterManagerHandler(object):
+  def __init__(self, r_server, backend):
+    self.r_server = r_server
+    self.backend = backend
+    self.notifier = AsyncChangeNotifier()
+    self.lookups = LookupCoalescer(r_server)
+    # the RPCs answered here are timed here; the backend times the rest
+    self.recorder = rpc_stats.RpcRecorder()
+    for name in NATIVE_RPCS:
+      self.recorder.methods[name] = rpc_stats.MethodStats()
+      setattr(self, name, numbered(name, getattr(self, name),
+                                   self.recorder.methods[name]))
+
+  def __getattr__(self, api):
+    # every RPC not answered below is the backend's
+    if api not in ucsd.ClusterManager.thrift_services:
+      raise AttributeError(api)
+    async def forward(*args):
+      log.debug("%s: passed to the backend", api)
+      return await self.backend.call(api, args)
+    return numbered(api, forward)
+
+  async def ping(self):
+    log.debug('ping()')
+    return True
+
+  async def lookup(self, macaddr):
+    log.debug("lookup %s", macaddr)
+
+    return self.__boot_config(await self.lookups.lookup(macaddr))
+
+  async def lookup_batch(self, macaddrs):
+    log.debug("lookup_batch(%d macaddrs)", len(macaddrs))
+
+    replies = await asyncio.gather(*[self.lookups.lookup(macaddr)
+                                     for macaddr in macaddrs])
+    configs = {}
+    for (macaddr, reply) in zip(macaddrs, replies):
+      bc = self.__boot_config(reply)
+      if bc is not None:
+        configs[macaddr] = bc
+
+    log.debug("  found %d bootconfigs", len(configs))
+    return configs
+
+  def __boot_config(self, reply):
+    # the script's reply is the host, then its project, then the project's
+    # boot configuration, as far as each exists
+    if reply is None or len(reply) < 3:
+      log.debug("  no bootconfig: %s", reply)
+      return None
+    (host, project, kernel, initrd, nfsserver, nfsroot, parameters) = reply
+    log.debug("  host %s assigned to project %s", host, project)
+    return ucsd.BootConfig(project=project, kernel=kernel, initrd=initrd,
+                           nfsserver=nfsserver, nfsroot=nfsroot,
+                           parameters=parameters)
+
+  async def get_stats(self, reset):
+    log.debug("get_stats %s", reset)
+
+    # ours for the RPCs answered here, the backend's for the rest.  The
+    # backend's own figures for RPCs we answer too (from clients connected
+    # to it directly) are kept as backend:NAME.
+    stats = {}
+    try:
+      for (name, backend_stats) in (
+          await self.backend.call("get_stats", (reset,))).items():
+        if name in self.recorder.methods:
+          name = "backend:" + name
+        stats[name] = backend_stats
+    except (TException, OSError) as e:
+      log.warning("no stats from the backend: %s", e)
+    for (name, summary) in self.recorder.summaries(reset).items():
+      stats[name] = rpc_stats_struct(summary)
+    return stats
+
+  async def get_generation(self):
+    log.debug("get_generation")
+
+    return int(await self.r_server.get(GENERATION) or 0)
+
+  async def get_changes(self, since_version, limit):
+    log.debug("get_changes %d %s", since_version, limit)
+
+    if limit is not None and limit < 0:
+      raise ucsd.ClientError(why="negative limit %d" % limit)
+    return await self.__changes_page(since_version, limit, None, None)
+
+  async def watch(self, since_version, timeout_ms, filter):
+    ops = set(filter.ops) if filter and filter.ops else None
+    names = set(filter.names) if filter and filter.names else None
+    log.debug("watch %d %s %s %s", since_version, timeout_ms, ops, names)
+
+    timeout = min(max(timeout_ms or 0, 0), MAX_WATCH_MS) / 1000.0
+    deadline = time.time() + timeout
+    while True:
+      sequence = self.notifier.sequence
+      page = await self.__changes_page(since_version, MAX_CHANGES_PAGE, ops,
+                                       names)
+      if page.changes or page.resync_required:
+        return page
+
+      # nothing we want up to page.version; skip past it
+      since_version = page.version
+      if page.more:
+        continue
+      remaining = deadline - time.time()
+      if remaining <= 0 or not await self.notifier.wait(sequence, remaining):
+        return page
+
+  async def __changes_page(self, since_version, limit, ops, names):
+    # managerd's ClusterManagerHandler.__changes_page(), reading the log
+    # as RedisStorage.changes() does
+    if not limit or limit > MAX_CHANGES_PAGE:
+      limit = MAX_CHANGES_PAGE
+
+    pipe = self.r_server.pipeline(transaction=False)
+    pipe.get(GENERATION)
+    pipe.xrange(CHANGES, "-", "+", count=1)
+    # one extra tells us whether there's another page
+    pipe.xrange(CHANGES, "%d-0" % max(since_version + 1, 0), "+",
+                count=limit + 1)
+    (generation, oldest, entries) = await pipe.execute()
+    generation = int(generation or 0)
+    oldest = stream_version(oldest[0][0]) if oldest else None
+
+    page = ucsd.ChangesPage(changes=[], more=False)
+    page.resync_required = not log_covers(since_version, generation, oldest)
+    if page.resync_required:
+      log.debug("  log doesn't reach back to %d", since_version)
+      page.version = generation
+      return page
+
+    page.more = len(entries) > limit
+    page.version = since_version
+    for (entry_id, fields) in entries[:limit]:
+      page.version = stream_version(entry_id)
+      args = dict(fields)
+      (op, name) = (args.pop("op"), args.pop("name"))
+      if ops is not None and op not in ops:
+        continue
+      if names is not None and name not in names:
+        continue
+      page.changes.append(ucsd.Change(version=page.version, op=op, name=name,
+                                      args_=args))
+    return page
+
+  async def listen_changes(self, r_server):
+    # wake watch() callers whenever any managerd records a change.  After
+    # losing the subscription wake them anyway, since changes may have
+    # been missed meanwhile.
+    while True:
+      try:
+        async with r_server.pubsub() as pubsub:
+          await pubsub.subscribe(CHANGE_VERSIONS)
+          self.notifier.notify()
+          async for message in pubsub.listen():
+            if message["type"] == "message":
+              self.notifier.notify()
+      except (redis.exceptions.ConnectionError,
+              redis.exceptions.TimeoutError) as e:
+        log.warning("lost the change notifications from redis: %s", e)
+      await asyncio.sleep(1)
+
+async def start(args, proto_factory, trans_factory):
+  pool = redis.asyncio.BlockingConnectionPool(
+    host=args.redis_server, db=args.redis_db,
+    max_connections=args.redis_max_connections,
+    timeout=args.redis_pool_timeout,
+    socket_timeout=args.redis_socket_timeout,
+    socket_connect_timeout=args.redis_connect_timeout,
+    health_check_interval=args.redis_health_check_interval,
+    decode_responses=True)
+  r_server = redis.asyncio.Redis(connection_pool=pool)
+  try:
+    await r_server.ping()
+  except redis.exceptions.ConnectionError as ce:
+    log.error("Error connecting to redis server: %s", ce)
+    log.error("Are you running a redis server on host %s?",
+              args.redis_server)
+    sys.exit(1)
+  # so that the first lookups are already plain EVALSHAs
+  await r_server.script_load(redis_scripts.LOOKUP)
+
+  backend = Backend(args.backend_server, args.backend_port,
+                    args.backend_connections, int(args.backend_timeout * 1000),
+                    proto_factory, trans_factory)
+  handler = AsyncClusterManagerHandler(r_server, backend)
+
+  # its own connection, without the pool's socket timeout: it sits idle
+  # until there's a change
+  listener = redis.asyncio.Redis(
+    host=args.redis_server, db=args.redis_db,
+    socket_connect_timeout=args.redis_connect_timeout,
+    health_check_interval=args.redis_health_check_interval,
+    decode_responses=True)
+  # the loop only holds its tasks weakly
+  handler.listener = asyncio.ensure_future(handler.listen_changes(listener))
+  return handler
+
+def main():
+  parser = argparse.ArgumentParser(
+    description="Cluster manager daemon, asyncio front end")
+
+  parser.add_argument("-d", "--debug", action='store_true',
+                      help="log every RPC")
+  parser.add_argument("--log_file",
+                      help="where to log, rather than stdout")
+  parser.add_argument("--log_sample", default="",
+                      help="log only one in N calls of the RPCs given as "
+                           "RPC=N,..., e.g. lookup=100")
+  parser.add_argument("--log_queue", type=int, default=10000,
+                      help="log records waiting to be written before more "
+                           "are dropped")
+  parser.add_argument("-p", "--port", type=int, default=9090,
+                      help="port to serve thrift on")
+  parser.add_argument("--protocol", choices=sorted(PROTOCOLS),
+                      default="binary",
+                      help="thrift protocol, for clients and the backend")
+  parser.add_argument("--transport", choices=sorted(TRANSPORTS),
+                      default="buffered",
+                      help="thrift transport, for clients and the backend")
+  parser.add_argument("--backend_server", default="localhost",
+                      help="managerd to pass the other RPCs to")
+  parser.add_argument("--backend_port", type=int, default=9091,
+                      help="its port")
+  parser.add_argument("--backend_connections", type=int, default=8,
+                      help="most connections open to it at once")
+  parser.add_argument("--backend_timeout", type=float, default=60,
+                      help="seconds to wait for its reply")
+  parser.add_argument("--redis_server",
+                      help="redis server hostname", default="localhost")
+  parser.add_argument("--redis_db", type=int, default=0,
+                      help="redis database number")
+  parser.add_argument("--redis_max_connections", type=int, default=50,
+                      help="redis connections shared by all RPCs")
+  parser.add_argument("--redis_pool_timeout", type=float, default=5,
+                      help="seconds an RPC waits for a free redis connection "
+                           "before failing")
+  parser.add_argument("--redis_socket_timeout", type=float, default=10,
+                      help="seconds to wait for a redis reply")
+  parser.add_argument("--redis_connect_timeout", type=float, default=5,
+                      help="seconds to wait when connecting to redis")
+  parser.add_argument("--redis_health_check_interval", type=float,
+                      default=30,
+                      help="PING redis connections idle longer than this "
+                           "many seconds before reusing them (0 disables)")
+  args = parser.parse_args()
+  try:
+    sample_rates = queued_logging.parse_sample_rates(args.log_sample)
+  except ValueError as ve:
+    parser.error("--log_sample: %s" % ve)
+  queued_logging.configure(logging.DEBUG if args.debug else logging.INFO,
+                           args.log_file, sample_rates, args.log_queue,
+                           current_call.get)
+
+  log.info("Starting async managerd...")
+  proto_factory = PROTOCOLS[args.protocol]()
+  trans_factory = TRANSPORTS[args.transport]()
+
+  loop = asyncio.new_event_loop()
+  asyncio.set_event_loop(loop)
+  handler = loop.run_until_complete(start(args, proto_factory,
+                                          trans_factory))
+  # client_timeout=None: tftpds keep their connections open between boots
+  server = make_server(ucsd.ClusterManager, handler, host="0.0.0.0",
+                       port=args.port, proto_factory=proto_factory,
+                       trans_factory=trans_factory, client_timeout=None,
+                       loop=loop)
+  try:
+    server.serve()
+  except KeyboardInterrupt:
+    pass
+  log.info("done")
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+# Time to onboard a rack over thrift: one host_add/host_assign/tag_add RPC
+# per host versus one host_add_batch/host_assign_batch/tag_add_batch each.
+#
+# Runs its own managerd (a TThreadedServer on --port, in this process)
+# against a scratch redis database, which it FLUSHes; db 15 by default.
+
+import sys, argparse, os, time, threading
+dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(dir, '..'))
+sys.path.append(os.path.join(dir, '../gen-py'))
+
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+from thrift.server import TServer
+
+import managerd
+from redis_storage import RedisStorage
+from ucsd import ClusterManager
+from ucsd.ttypes import *
+
+def macaddr(i):
+  return "02:00:%02x:%02x:%02x:%02x" % (
+    (i >> 24) & 0xff, (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff)
+
+def serve(handler, port):
+  server = TServer.TThreadedServer(ClusterManager.Processor(handler),
+                                   TSocket.TServerSocket(port=port),
+                                   TTransport.TBufferedTransportFactory(),
+                                   TBinaryProtocol.TBinaryProtocolFactory())
+  thread = threading.Thread(target=server.serve)
+  thread.daemon = True
+  thread.start()
+
+def connect(port):
+  transport = TTransport.TBufferedTransport(TSocket.TSocket("localhost", port))
+  client = ClusterManager.Client(TBinaryProtocol.TBinaryProtocol(transport))
+  for attempt in range(50):
+    try:
+      transport.open()
+      return client
+    except TTransport.TTransportException:
+      time.sleep(0.1)
+  raise Exception("managerd didn't start on port %d" % port)
+
+def timed(label, hosts, func):
+  start = time.time()
+  ok = func()
+  elapsed = time.time() - start
+  assert ok == hosts, "%s: %d of %d succeeded" % (label, ok, hosts)
+  print("%-24s %8d hosts %10.3fs" % (label, hosts, elapsed))
+
+def main():
+  parser = argparse.ArgumentParser(description="batch RPC benchmark",
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("--redis_server", help="redis server hostname",
+                      default="localhost")
+  parser.add_argument("--db", help="scratch redis database (flushed!)",
+                      type=int, default=15)
+  parser.add_argument("--port", type=int, default=9191,
+                      help="port for the benchmark's own managerd")
+  parser.add_argument("--hosts", type=int, default=2000,
+                      help="hosts to onboard")
+  args = parser.parse_args()
+
+  store = RedisStorage(args.redis_server, db=args.db)
+  serve(managerd.ClusterManagerHandler(store), args.port)
+  client = connect(args.port)
+
+  n = args.hosts
+  names = ["node%d" % i for i in range(n)]
+
+  def one_at_a_time():
+    timed("host_add", n, lambda: sum(
+      client.host_add(names[i], macaddr(i)) for i in range(n)))
+    timed("host_assign", n, lambda: sum(
+      client.host_assign(names[i], "bench", "bench") is None
+      for i in range(n)))
+    timed("tag_add", n, lambda: sum(
+      client.tag_add(names[i], "rack%d" % (i / 40)) is None
+      for i in range(n)))
+
+  def batched():
+    timed("host_add_batch", n, lambda: sum(client.host_add_batch(
+      [HostSpec(host=names[i], macaddr=macaddr(i)) for i in range(n)])))
+    timed("host_assign_batch", n, lambda: sum(client.host_assign_batch(
+      [Assignment(host=names[i], project="bench", user="bench")
+       for i in range(n)])))
+    timed("tag_add_batch", n, lambda: sum(client.tag_add_batch(
+      [HostTag(host=names[i], tag="rack%d" % (i / 40)) for i in range(n)])))
+
+  for run in (one_at_a_time, batched):
+    store.r_server.flushdb()
+    store.upgrade()
+    run()
+
+  store.r_server.flushdb()
+
+if __name__ == "__main__":
+  sys.exit(main())
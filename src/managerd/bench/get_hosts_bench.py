@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+# Round trips and wall time of get_hosts(None, None) against a live redis
+# server, for the pipelined __materialize_hosts versus the old one-HGET-
+# per-field approach, and for a NAMES_ONLY projection.
+#
+# The benchmark FLUSHes the redis database it is pointed at, so it uses
+# db 15 by default.
+
+import sys, argparse, os, time
+dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(dir, '..'))
+sys.path.append(os.path.join(dir, '../gen-py'))
+
+import redis
+
+import managerd
+from redis_storage import (RedisStorage, HOST_TAGS, HOSTS, TAGS_MIGRATED,
+                           INDEXES_BUILT)
+from ucsd.ttypes import *
+from ucsd.constants import NAMES_ONLY
+
+class CountingConnection(redis.Connection):
+  # every packed command sent is one round trip, whether it carries a
+  # single command or a whole pipeline
+  round_trips = 0
+
+  def send_packed_command(self, command):
+    CountingConnection.round_trips += 1
+    return redis.Connection.send_packed_command(self, command)
+
+def populate(r, count):
+  r.flushdb()
+  pipe = r.pipeline(transaction=False)
+  for i in xrange(count):
+    name = "node%d" % i
+    project = "proj%d" % (i % 10) if i % 2 else ''
+    pipe.hmset("host_" + name, {
+      "name": name,
+      "status": HostStatus.ASSIGNED if project else HostStatus.AVAILABLE,
+      "owner": "bench" if project else '',
+      "assigned_project": project,
+      "netboot_enabled": True,
+      "macaddr": "02:00:%02x:%02x:%02x:%02x" % (
+        (i >> 24) & 0xff, (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff),
+    })
+    pipe.sadd(HOST_TAGS % name, "rack%d" % (i % 40), "bench")
+    pipe.sadd(HOSTS, name)
+    if i % 1000 == 999:
+      pipe.execute()
+  pipe.set(TAGS_MIGRATED, 1)
+  pipe.set(INDEXES_BUILT, 1)
+  pipe.execute()
+
+def per_field_hosts(r):
+  # what get_hosts used to do
+  hosts = []
+  for hkey in r.keys("host_*"):
+    host = Host()
+    host.name = r.hget(hkey, "name")
+    host.status = int(r.hget(hkey, "status"))
+    host.owner = r.hget(hkey, "owner")
+    host.assigned_project = r.hget(hkey, "assigned_project")
+    host.netboot_enabled = r.hget(hkey, "netboot_enabled")
+    host.macaddr = r.hget(hkey, "macaddr")
+    host.tags = r.hget(hkey, "tags")
+    hosts.append(host)
+  return hosts
+
+def measure(label, count, func):
+  CountingConnection.round_trips = 0
+  start = time.time()
+  hosts = func()
+  elapsed = time.time() - start
+  assert len(hosts) == count
+  print("%-24s %8d %12d %10.3f" % (label, count,
+                                   CountingConnection.round_trips, elapsed))
+
+def main():
+  parser = argparse.ArgumentParser(description="get_hosts benchmark",
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("--redis_server", help="redis server hostname",
+                      default="localhost")
+  parser.add_argument("--db", help="scratch redis database (flushed!)",
+                      type=int, default=15)
+  parser.add_argument("--sizes", help="comma separated host counts",
+                      default="1000,10000,50000")
+  parser.add_argument("--materialize_chunk", type=int, default=500,
+                      help="host records fetched per pipelined round trip")
+  parser.add_argument("--skip_per_field", action='store_true',
+                      help="don't time the old per-field HGET approach")
+  args = parser.parse_args()
+
+  pool = redis.ConnectionPool(connection_class=CountingConnection,
+                              host=args.redis_server, db=args.db)
+  r = redis.Redis(connection_pool=pool)
+
+  store = RedisStorage(args.redis_server,
+                       materialize_chunk=args.materialize_chunk)
+  store.r_server = r
+  handler = managerd.ClusterManagerHandler(store)
+
+  print("%-24s %8s %12s %10s" % ("method", "hosts", "round trips", "seconds"))
+  for count in [int(n) for n in args.sizes.split(",")]:
+    populate(r, count)
+    if not args.skip_per_field:
+      measure("per-field HGET", count, lambda: per_field_hosts(r))
+    measure("pipelined (chunk %d)" % args.materialize_chunk, count,
+            lambda: handler.get_hosts(None, None))
+    measure("names only (chunk %d)" % args.materialize_chunk, count,
+            lambda: handler.get_hosts(None, None, NAMES_ONLY))
+
+  r.flushdb()
+
+if __name__ == "__main__":
+  sys.exit(main())
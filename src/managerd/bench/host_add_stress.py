@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# Concurrent-writer stress test for host_add against a live redis server.
+#
+# Several writer threads race to add the same set of hosts through one
+# shared ClusterManagerHandler (as TThreadedServer does), while a reader
+# thread keeps fetching host records and checks that it never sees one
+# half written.  At the end every host must have been added exactly once
+# and the registry and macaddr index must agree with the records.
+#
+# --legacy runs the old EXISTS + one-HSET-per-field sequence instead, to
+# show the races the scripted host_add closes.
+#
+# The test FLUSHes the redis database it is pointed at, so it uses db 15
+# by default.
+
+import sys, argparse, os, time, random, threading
+dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(dir, '..'))
+sys.path.append(os.path.join(dir, '../gen-py'))
+
+import managerd
+from redis_storage import RedisStorage, MACADDR_INDEX, HOSTS
+from storage import canonical_mac
+from ucsd.ttypes import *
+
+FIELDS = set(["name", "status", "owner", "assigned_project",
+              "netboot_enabled", "macaddr"])
+
+def macaddr(i):
+  return "02:00:%02x:%02x:%02x:%02x" % (
+    (i >> 24) & 0xff, (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff)
+
+def legacy_host_add(r, hostname, mac):
+  # what host_add used to do
+  key = "host_%s" % hostname
+  if r.exists(key):
+    return False
+  r.hset(key, "name", hostname)
+  r.hset(key, "status", HostStatus.AVAILABLE)
+  r.hset(key, "owner", '')
+  r.hset(key, "assigned_project", '')
+  r.hset(key, "netboot_enabled", True)
+  r.hset(key, "macaddr", mac)
+  r.hset(MACADDR_INDEX, canonical_mac(mac), hostname)
+  r.sadd(HOSTS, hostname)
+  return True
+
+def main():
+  parser = argparse.ArgumentParser(description="host_add stress test",
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("--redis_server", help="redis server hostname",
+                      default="localhost")
+  parser.add_argument("--db", help="scratch redis database (flushed!)",
+                      type=int, default=15)
+  parser.add_argument("--hosts", type=int, default=2000,
+                      help="distinct hosts to add")
+  parser.add_argument("--writers", type=int, default=8,
+                      help="concurrent writer threads")
+  parser.add_argument("--legacy", action='store_true',
+                      help="use the old non-atomic host_add sequence")
+  args = parser.parse_args()
+
+  store = RedisStorage(args.redis_server, db=args.db)
+  handler = managerd.ClusterManagerHandler(store)
+  r = store.r_server
+  r.flushdb()
+
+  if args.legacy:
+    add = lambda i: legacy_host_add(r, "node%d" % i, macaddr(i))
+  else:
+    add = lambda i: handler.host_add("node%d" % i, macaddr(i))
+
+  successes = [0] * args.writers
+  partial = []
+  done = threading.Event()
+
+  def writer(n):
+    order = range(args.hosts)
+    random.shuffle(order)
+    for i in order:
+      if add(i):
+        successes[n] += 1
+
+  def reader():
+    while not done.is_set():
+      key = "host_node%d" % random.randrange(args.hosts)
+      record = r.hgetall(key)
+      if record and set(record) != FIELDS:
+        partial.append((key, record))
+
+  writers = [threading.Thread(target=writer, args=(n,))
+             for n in range(args.writers)]
+  check = threading.Thread(target=reader)
+  check.start()
+
+  start = time.time()
+  for t in writers:
+    t.start()
+  for t in writers:
+    t.join()
+  elapsed = time.time() - start
+
+  done.set()
+  check.join()
+
+  attempts = args.hosts * args.writers
+  print("%d writers, %d attempts in %.3fs (%.0f host_add/s)" %
+        (args.writers, attempts, elapsed, attempts / elapsed))
+
+  failures = []
+  if sum(successes) != args.hosts:
+    failures.append("%d successful adds for %d hosts" %
+                    (sum(successes), args.hosts))
+  if partial:
+    failures.append("reader saw %d partial records, e.g. %s" %
+                    (len(partial), partial[0]))
+  for i in range(args.hosts):
+    if set(r.hgetall("host_node%d" % i)) != FIELDS:
+      failures.append("host_node%d is incomplete" % i)
+      break
+  if r.scard(HOSTS) != args.hosts:
+    failures.append("hosts registry has %d entries" %
+                    r.scard(HOSTS))
+  if r.hlen(MACADDR_INDEX) != args.hosts:
+    failures.append("macaddr index has %d entries" %
+                    r.hlen(MACADDR_INDEX))
+
+  r.flushdb()
+
+  for failure in failures:
+    print("FAIL: " + failure)
+  if not failures:
+    print("OK")
+  return 1 if failures else 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+# What recording get_stats()' per-RPC counts and latencies costs: times
+# handler RPCs, called directly, with and without the instrumentation,
+# over the same store.  ping() is all overhead; the others show it next
+# to real work.  The redis engine goes through managerd's connection pool,
+# so that its round trips are counted too.
+#
+# The redis engine FLUSHes the database it is pointed at, so it uses db 15
+# by default.
+
+import sys, argparse, os, time
+dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(dir, '..'))
+sys.path.append(os.path.join(dir, '../gen-py'))
+
+import managerd
+from memory_storage import MemoryStorage
+from ucsd.ttypes import *
+
+def macaddr(i):
+  return "02:00:%02x:%02x:%02x:%02x" % (
+    (i >> 24) & 0xff, (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff)
+
+def populate(handler, hosts):
+  handler.upgrade_database()
+  handler.project_add("proj", "nfs", "/root/proj", "vmlinuz", "initrd",
+                      "console=ttyS0")
+  handler.host_add_batch([HostSpec(host="node%d" % i, macaddr=macaddr(i))
+                          for i in xrange(hosts)])
+  handler.host_assign_batch([Assignment(host="node%d" % i, project="proj",
+                                        user="bench")
+                             for i in xrange(hosts)])
+  handler.tag_add_batch([HostTag(host="node%d" % i, tag="rack%d" % (i % 40))
+                         for i in xrange(hosts)])
+
+def best_of(runs, count, func):
+  # the fastest of runs timings of count calls, in us per call
+  best = None
+  for run in xrange(runs):
+    start = time.time()
+    for i in xrange(count):
+      func(i)
+    elapsed = time.time() - start
+    best = elapsed if best is None else min(best, elapsed)
+  return 1e6 * best / count
+
+def run(store, args):
+  plain = managerd.ClusterManagerHandler(store, record_stats=False)
+  recorded = managerd.ClusterManagerHandler(store)
+  populate(plain, args.hosts)
+
+  calls = [
+    ("ping", lambda h: lambda i: h.ping()),
+    ("lookup", lambda h: lambda i: h.lookup(macaddr(i % args.hosts))),
+    ("get_tags", lambda h: lambda i: h.get_tags("node%d" % (i % args.hosts))),
+  ]
+  for (label, make) in calls:
+    bare = best_of(args.runs, args.calls, make(plain))
+    timed = best_of(args.runs, args.calls, make(recorded))
+    print("  %-10s %8.2f us/call bare %8.2f us/call recorded %+8.2f us" %
+          (label, bare, timed, timed - bare))
+
+def main():
+  parser = argparse.ArgumentParser(description="RPC stats overhead benchmark",
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("--engines", default="memory,redis",
+                      help="comma separated storage engines to time")
+  parser.add_argument("--redis_server", help="redis server hostname",
+                      default="localhost")
+  parser.add_argument("--db", help="scratch redis database (flushed!)",
+                      type=int, default=15)
+  parser.add_argument("--hosts", type=int, default=1000,
+                      help="hosts to create")
+  parser.add_argument("--calls", type=int, default=20000,
+                      help="calls per timing")
+  parser.add_argument("--runs", type=int, default=3,
+                      help="timings of each, keeping the fastest")
+  args = parser.parse_args()
+
+  for engine in args.engines.split(","):
+    print(engine)
+    if engine == "memory":
+      run(MemoryStorage(), args)
+    elif engine == "redis":
+      from redis_pool import MonitoredConnectionPool
+      from redis_storage import RedisStorage
+      pool = MonitoredConnectionPool(host=args.redis_server, db=args.db)
+      store = RedisStorage(args.redis_server, db=args.db, pool=pool)
+      store.r_server.flushdb()
+      try:
+        run(store, args)
+      finally:
+        store.r_server.flushdb()
+    else:
+      print("  unknown engine")
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+# Throughput and latency of lookup() under concurrent load for each of
+# managerd's server models (see server_models.py).
+#
+# Starts a managerd with each model in turn, on --port against a scratch
+# redis database, which it FLUSHes; db 15 by default.  The clients are
+# separate processes so that they don't share a GIL with each other.  Each
+# keeps one connection open, as tftpd does, or with --reconnect opens a new
+# one for every call, as a burst of CLI runs would.
+
+import sys, argparse, os, time, subprocess, multiprocessing
+dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(dir, '..'))
+sys.path.append(os.path.join(dir, '../gen-py'))
+
+import redis
+from thrift.transport import TTransport
+
+import thrift_stack
+import server_models
+from ucsd.ttypes import *
+
+def macaddr(i):
+  return "02:00:%02x:%02x:%02x:%02x" % (
+    (i >> 24) & 0xff, (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff)
+
+def connect(args):
+  (transport, client) = thrift_stack.client("localhost", args.port,
+                                            transport="framed")
+  transport.open()
+  return (transport, client)
+
+def wait_for_managerd(args):
+  for attempt in range(100):
+    try:
+      (transport, client) = connect(args)
+      return (transport, client)
+    except TTransport.TTransportException:
+      time.sleep(0.1)
+  raise Exception("managerd didn't start on port %d" % args.port)
+
+def run_client(args, seed, results):
+  # puts the latency of each of args.calls lookups, in seconds
+  latencies = []
+  if not args.reconnect:
+    (transport, client) = connect(args)
+  for i in xrange(args.calls):
+    start = time.time()
+    if args.reconnect:
+      (transport, client) = connect(args)
+    client.lookup(macaddr((seed * args.calls + i) % args.hosts))
+    if args.reconnect:
+      transport.close()
+    latencies.append(time.time() - start)
+  if not args.reconnect:
+    transport.close()
+  results.put(latencies)
+
+def run(args, model):
+  r_server = redis.Redis(args.redis_server, db=args.db)
+  r_server.flushdb()
+  command = [sys.executable, "managerd.py", "--storage", "redis",
+             "--redis_server", args.redis_server,
+             "--redis_db", str(args.db), "--port", str(args.port),
+             "--transport", "framed", "--server_model", model]
+  if args.workers:
+    command += ["--workers", str(args.workers)]
+  managerd = subprocess.Popen(command, cwd=os.path.join(dir, '..'),
+                              stdout=open(os.devnull, "w"))
+  try:
+    (transport, client) = wait_for_managerd(args)
+    client.project_add("bench", "nfs", "/root/bench", "vmlinuz", "initrd",
+                       "console=ttyS0")
+    for first in xrange(0, args.hosts, 1000):
+      batch = range(first, min(first + 1000, args.hosts))
+      client.host_add_batch([HostSpec(host="node%d" % i, macaddr=macaddr(i))
+                             for i in batch])
+      client.host_assign_batch([Assignment(host="node%d" % i,
+                                           project="bench", user="bench")
+                                for i in batch])
+    transport.close()
+
+    results = multiprocessing.Queue()
+    clients = [multiprocessing.Process(target=run_client,
+                                       args=(args, seed, results))
+               for seed in range(args.clients)]
+    start = time.time()
+    for process in clients:
+      process.start()
+    latencies = []
+    for process in clients:
+      latencies.extend(results.get())
+    elapsed = time.time() - start
+    for process in clients:
+      process.join()
+  finally:
+    managerd.terminate()
+    managerd.wait()
+    r_server.flushdb()
+
+  latencies.sort()
+  def percentile(p):
+    return 1e3 * latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+  print("  %-12s %8d calls %10.1f calls/s %8.2f ms p50 %8.2f ms p99" %
+        (model, len(latencies), len(latencies) / elapsed,
+         percentile(0.5), percentile(0.99)))
+
+def main():
+  parser = argparse.ArgumentParser(description="server model benchmark",
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("--models", default=",".join(server_models.SERVER_MODELS),
+                      help="comma separated server models to time")
+  parser.add_argument("--workers", type=int,
+                      help="managerd's --workers (its default if not given)")
+  parser.add_argument("--redis_server", help="redis server hostname",
+                      default="localhost")
+  parser.add_argument("--db", help="scratch redis database (flushed!)",
+                      type=int, default=15)
+  parser.add_argument("--port", type=int, default=9191,
+                      help="port for the benchmark's managerd")
+  parser.add_argument("--hosts", type=int, default=2000,
+                      help="hosts to look up")
+  parser.add_argument("--clients", type=int, default=16,
+                      help="concurrent client processes")
+  parser.add_argument("--calls", type=int, default=500,
+                      help="lookups per client")
+  parser.add_argument("--reconnect", action='store_true',
+                      help="connect afresh for every call")
+  args = parser.parse_args()
+
+  print("%d clients%s" % (args.clients,
+                          ", reconnecting" if args.reconnect else ""))
+  for model in args.models.split(","):
+    if model not in server_models.SERVER_MODELS:
+      print("  %-12s unknown model" % model)
+      continue
+    run(args, model)
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+# Times the handler's RPCs against each storage engine, called directly
+# (no thrift, no sockets) so that the numbers are the RPC logic plus the
+# engine.  The memory engine gives the cost of the RPC layer alone.
+#
+# The redis engine FLUSHes the database it is pointed at, so it uses db 15
+# by default; sqlite uses a scratch file that is removed afterwards.
+
+import sys, argparse, os, time, tempfile
+dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(dir, '..'))
+sys.path.append(os.path.join(dir, '../gen-py'))
+
+import managerd
+from cached_storage import CachedStorage
+from memory_storage import MemoryStorage
+from sqlite_storage import SqliteStorage
+from ucsd.ttypes import *
+
+def macaddr(i):
+  return "02:00:%02x:%02x:%02x:%02x" % (
+    (i >> 24) & 0xff, (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff)
+
+def timed(label, count, func):
+  start = time.time()
+  for i in xrange(count):
+    func(i)
+  elapsed = time.time() - start
+  print("  %-22s %8d calls %10.3fs %10.1f us/call" %
+        (label, count, elapsed, 1e6 * elapsed / count))
+
+def run(handler, hosts, projects):
+  # as managerd does at startup; marks a fresh redis database as current
+  handler.upgrade_database()
+
+  timed("host_add", hosts,
+        lambda i: handler.host_add("node%d" % i, macaddr(i)))
+  timed("project_add", projects,
+        lambda i: handler.project_add("proj%d" % i, "nfs", "/root/%d" % i,
+                                      "vmlinuz", "initrd", "console=ttyS0"))
+  timed("host_assign", hosts,
+        lambda i: handler.host_assign("node%d" % i, "proj%d" % (i % projects),
+                                      "bench"))
+  timed("tag_add", hosts,
+        lambda i: handler.tag_add("node%d" % i, "rack%d" % (i % 40)))
+  timed("lookup", hosts, lambda i: handler.lookup(macaddr(i)))
+  timed("lookup (again)", hosts, lambda i: handler.lookup(macaddr(i)))
+  timed("get_tags", hosts, lambda i: handler.get_tags("node%d" % i))
+  timed("get_hosts(project)", projects,
+        lambda i: handler.get_hosts("proj%d" % i, None))
+  timed("get_hosts(tag)", 40, lambda i: handler.get_hosts(None, "rack%d" % i))
+  timed("get_hosts_query", 40,
+        lambda i: handler.get_hosts_query(
+          "project:proj%d & (rack%d | rack%d) & !rack%d" %
+          (i % projects, i, (i + 10) % 40, (i + 20) % 40)))
+  timed("get_hosts(all)", 3, lambda i: handler.get_hosts(None, None))
+  timed("get_project_host_counts", 10,
+        lambda i: handler.get_project_host_counts())
+  timed("host_release", hosts,
+        lambda i: handler.host_release("node%d" % i))
+  timed("host_allocate(10)", hosts / 20,
+        lambda i: handler.host_allocate("proj%d" % (i % projects), 10, None,
+                                        "bench"))
+
+def main():
+  parser = argparse.ArgumentParser(description="storage engine benchmark",
+                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("--engines", default="memory,sqlite,redis",
+                      help="comma separated storage engines to time")
+  parser.add_argument("--redis_server", help="redis server hostname",
+                      default="localhost")
+  parser.add_argument("--db", help="scratch redis database (flushed!)",
+                      type=int, default=15)
+  parser.add_argument("--hosts", type=int, default=5000,
+                      help="hosts to create")
+  parser.add_argument("--projects", type=int, default=50,
+                      help="projects to spread them over")
+  parser.add_argument("--cache_size", type=int, default=0,
+                      help="put a read cache of this many entries in front "
+                           "of each engine")
+  args = parser.parse_args()
+
+  def make_handler(store):
+    if args.cache_size:
+      store = CachedStorage(store, max_entries=args.cache_size)
+    return managerd.ClusterManagerHandler(store)
+
+  for engine in args.engines.split(","):
+    print(engine)
+    if engine == "memory":
+      run(make_handler(MemoryStorage()),
+          args.hosts, args.projects)
+    elif engine == "sqlite":
+      (fd, path) = tempfile.mkstemp(suffix=".db")
+      os.close(fd)
+      try:
+        run(make_handler(SqliteStorage(path)),
+            args.hosts, args.projects)
+      finally:
+        for suffix in ("", "-wal", "-shm"):
+          if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    elif engine == "redis":
+      from redis_storage import RedisStorage
+      store = RedisStorage(args.redis_server, db=args.db)
+      store.r_server.flushdb()
+      try:
+        run(make_handler(store),
+            args.hosts, args.projects)
+      finally:
+        store.r_server.flushdb()
+    else:
+      print("  unknown engine")
+
+if __name__ == "__main__":
+  sys.exit(main())
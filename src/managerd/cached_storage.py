@@ -0,0 +1,406 @@
+#
+# A read cache in front of another storage engine.
+#
+# During a boot storm every node's tftp request turns into a lookup() and
+# the CLI and dashboards poll get_hosts(), while the inventory itself only
+# changes a few times an hour.  CachedStorage keeps the answers to those
+# reads in a bounded LRU and drops them the moment the data under them
+# changes.
+#
+# Writes made through this managerd invalidate the entries they affect
+# directly.  They are also announced through the engine's invalidation
+# channel (redis pub/sub for the redis engine), so that every other
+# managerd sharing the database drops its copies too.  If the channel
+# drops out, messages may have been missed and the whole cache is flushed.
+#
+
+import logging, threading, uuid
+from collections import OrderedDict
+
+from storage import *
+
+log = logging.getLogger(__name__)
+
+# invalidation targets: one host or project, every host query, or the
+# project list
+HOST = "host:%s"
+PROJECT = "project:%s"
+ANY_HOST = "hosts"
+ANY_PROJECT = "projects"
+
+# flush everything, e.g. after a migration rewrote records in bulk
+EVERYTHING = "*"
+
+def lookup_targets(result):
+  # which changes would alter a lookup() depends on its answer
+  (host, project, config) = result
+  if host is None:
+    # any new host could claim the macaddr
+    return [ANY_HOST]
+  elif project is None:
+    return [HOST % host]
+  return [HOST % host, PROJECT % project]
+
+class CachedStorage(Storage):
+  def __init__(self, inner, max_entries=10000, bypass=False):
+    self.inner = inner
+    self.max_entries = max_entries
+    # serve every read from the engine; for debugging a suspected stale
+    # cache without restarting
+    self.bypass = bypass or max_entries <= 0
+
+    # tells our own messages apart when they come back over the channel
+    self.instance = uuid.uuid4().hex
+
+    self.lock = threading.Lock()
+    # key -> (value, targets it depends on), least recently used first
+    self.entries = OrderedDict()
+    # target -> keys of the entries depending on it
+    self.dependents = {}
+    # bumped by every invalidation, so that a read which raced with one
+    # doesn't put what it read into the cache
+    self.epoch = 0
+
+    self.hits = 0
+    self.misses = 0
+    self.bypassed = 0
+    self.evictions = 0
+    self.invalidations = 0
+    self.flushes = 0
+
+    inner.listen_invalidations(self.__received)
+
+  #
+  # cache bookkeeping
+  #
+
+  def set_bypass(self, bypass):
+    with self.lock:
+      self.bypass = bypass or self.max_entries <= 0
+      # nothing was cached while bypassed
+      self.__flush()
+
+  def stats(self):
+    with self.lock:
+      lookups = self.hits + self.misses
+      return {
+        'entries': float(len(self.entries)),
+        'max_entries': float(self.max_entries),
+        'bypass': float(self.bypass),
+        'hits': float(self.hits),
+        'misses': float(self.misses),
+        'hit_ratio': float(self.hits) / lookups if lookups else 0.0,
+        'bypassed_reads': float(self.bypassed),
+        'evictions': float(self.evictions),
+        'invalidations': float(self.invalidations),
+        'flushes': float(self.flushes),
+      }
+
+  def __cached(self, key, targets, fetch):
+    # the cached value of key, or fetch() it and cache the result.
+    # targets lists what the value depends on, or is a function giving
+    # that from the value
+    if self.bypass:
+      self.bypassed += 1
+      return fetch()
+
+    with self.lock:
+      entry = self.entries.pop(key, None)
+      if entry is not None:
+        self.entries[key] = entry
+        self.hits += 1
+        return entry[0]
+      self.misses += 1
+      epoch = self.epoch
+
+    value = fetch()
+    if callable(targets):
+      targets = targets(value)
+
+    with self.lock:
+      if epoch == self.epoch and not self.bypass:
+        self.__store(key, value, targets)
+    return value
+
+  def __store(self, key, value, targets):
+    # expects self.lock to be held
+    self.__drop(key)
+    self.entries[key] = (value, targets)
+    for target in targets:
+      self.dependents.setdefault(target, set()).add(key)
+
+    while len(self.entries) > self.max_entries:
+      self.__drop(next(iter(self.entries)))
+      self.evictions += 1
+
+  def __drop(self, key):
+    # expects self.lock to be held
+    entry = self.entries.pop(key, None)
+    if entry is None:
+      return
+    for target in entry[1]:
+      keys = self.dependents.get(target)
+      if keys is not None:
+        keys.discard(key)
+        if not keys:
+          del self.dependents[target]
+
+  def __flush(self):
+    # expects self.lock to be held
+    self.entries.clear()
+    self.dependents.clear()
+    self.epoch += 1
+    self.flushes += 1
+
+  def __invalidate(self, targets):
+    with self.lock:
+      self.epoch += 1
+      self.invalidations += 1
+      if EVERYTHING in targets:
+        self.__flush()
+        return
+      for target in targets:
+        for key in list(self.dependents.get(target, ())):
+          self.__drop(key)
+
+  def __changed(self, *targets):
+    # after a write: drop our own entries, then tell everyone else
+    self.__invalidate(targets)
+    self.inner.publish_invalidation(" ".join((self.instance,) + targets))
+
+  def __received(self, message):
+    # an invalidation from the channel, or None if some may have been lost
+    if message is None:
+      log.debug("invalidation channel (re)connected, flushing cache")
+      with self.lock:
+        self.__flush()
+      return
+
+    fields = message.split(" ")
+    if fields[0] != self.instance:
+      self.__invalidate(fields[1:])
+
+  #
+  # reads
+  #
+
+  def project_names(self):
+    return self.__cached(("projects",), [ANY_PROJECT],
+                         lambda: list(self.inner.project_names()))
+
+  def project_host_counts(self):
+    return self.__cached(("counts",), [ANY_HOST, ANY_PROJECT],
+                         self.inner.project_host_counts)
+
+  def host_names(self, project=None, tag=None):
+    return self.__cached(("names", project, tag), [ANY_HOST],
+                         lambda: list(self.inner.host_names(project, tag)))
+
+  def host_names_query(self, query):
+    # the parsed query is a tuple, so it can be part of the key
+    return self.__cached(("query", query), [ANY_HOST],
+                         lambda: list(self.inner.host_names_query(query)))
+
+  def host_names_page(self, project, tag, cursor, limit):
+    # a page is only read once, so there's nothing to gain by caching it;
+    # the records on it come through hosts()
+    return self.inner.host_names_page(project, tag, cursor, limit)
+
+  def hosts(self, hostnames, fields=None):
+    # per host, so that one change doesn't throw away every record; the
+    # Host objects are shared between callers and must not be modified.
+    # Only whole records are cached: a projection is cut from the cached
+    # ones, and what's missing is read with the projection and not kept.
+    hostnames = list(hostnames)
+    if self.bypass:
+      self.bypassed += 1
+      return self.inner.hosts(hostnames, fields)
+
+    found = {}
+    with self.lock:
+      for hostname in hostnames:
+        entry = self.entries.pop(("host", hostname), None)
+        if entry is not None:
+          self.entries[("host", hostname)] = entry
+          found[hostname] = entry[0]
+      self.hits += len(found)
+      self.misses += len(hostnames) - len(found)
+      epoch = self.epoch
+
+    if fields is not None:
+      for (hostname, host) in found.items():
+        found[hostname] = project_host(host, fields)
+
+    missing = [hostname for hostname in hostnames if hostname not in found]
+    if missing:
+      fetched = self.inner.hosts(missing, fields)
+      with self.lock:
+        for host in fetched:
+          found[host.name] = host
+          if fields is None and epoch == self.epoch and not self.bypass:
+            self.__store(("host", host.name), host, [HOST % host.name])
+
+    return [found[hostname] for hostname in hostnames if hostname in found]
+
+  def host_tags(self, hostname):
+    return self.__cached(("tags", hostname), [HOST % hostname],
+                         lambda: self.inner.host_tags(hostname))
+
+  def host_exists(self, hostname):
+    return self.inner.host_exists(hostname)
+
+  def lookup(self, macaddr):
+    mac = canonical_mac(macaddr)
+    return self.__cached(("lookup", mac), lookup_targets,
+                         lambda: self.inner.lookup(mac))
+
+  def lookup_batch(self, macaddrs):
+    macs = [canonical_mac(macaddr) for macaddr in macaddrs]
+    if self.bypass:
+      self.bypassed += 1
+      return self.inner.lookup_batch(macs)
+
+    # the cached answers, and one batch to the engine for the rest
+    found = {}
+    with self.lock:
+      for mac in set(macs):
+        entry = self.entries.pop(("lookup", mac), None)
+        if entry is not None:
+          self.entries[("lookup", mac)] = entry
+          found[mac] = entry[0]
+      self.hits += len(found)
+      self.misses += len(set(macs)) - len(found)
+      epoch = self.epoch
+
+    missing = [mac for mac in set(macs) if mac not in found]
+    if missing:
+      fetched = self.inner.lookup_batch(missing)
+      with self.lock:
+        for (mac, result) in zip(missing, fetched):
+          found[mac] = result
+          if epoch == self.epoch and not self.bypass:
+            self.__store(("lookup", mac), result, lookup_targets(result))
+
+    return [found[mac] for mac in macs]
+
+  def generation(self):
+    return self.inner.generation()
+
+  def changes(self, since_version, limit):
+    return self.inner.changes(since_version, limit)
+
+  def pool_stats(self):
+    return self.inner.pool_stats()
+
+  def uncached(self):
+    return self.inner.uncached()
+
+  def listen_changes(self, callback):
+    self.inner.listen_changes(callback)
+
+  #
+  # writes
+  #
+
+  def host_add(self, hostname, macaddr, status, netboot_enabled):
+    added = self.inner.host_add(hostname, macaddr, status, netboot_enabled)
+    if added == ADDED:
+      self.__changed(HOST % hostname, ANY_HOST)
+    return added
+
+  def host_add_batch(self, hosts, status, netboot_enabled):
+    results = self.inner.host_add_batch(hosts, status, netboot_enabled)
+    self.__hosts_changed([hostname for ((hostname, macaddr), added)
+                          in zip(hosts, results) if added == ADDED])
+    return results
+
+  def host_remove(self, hostname):
+    return self.__host_changed(hostname,
+                               self.inner.host_remove(hostname))
+
+  def set_assignment(self, hostname, project, owner, status):
+    return self.__host_changed(hostname, self.inner.set_assignment(
+      hostname, project, owner, status))
+
+  def set_assignment_batch(self, assignments, status):
+    results = self.inner.set_assignment_batch(assignments, status)
+    self.__hosts_changed([assignment[0] for (assignment, assigned)
+                          in zip(assignments, results) if assigned])
+    return results
+
+  def host_allocate(self, project, owner, count, query, status):
+    claimed = self.inner.host_allocate(project, owner, count, query, status)
+    self.__hosts_changed(claimed)
+    return claimed
+
+  def tag_add(self, hostname, tag):
+    return self.__host_changed(hostname,
+                               self.inner.tag_add(hostname, tag))
+
+  def tag_add_batch(self, tags):
+    results = self.inner.tag_add_batch(tags)
+    self.__hosts_changed([hostname for ((hostname, tag), tagged)
+                          in zip(tags, results) if tagged])
+    return results
+
+  def tag_remove_all(self, hostname):
+    return self.__host_changed(hostname,
+                               self.inner.tag_remove_all(hostname))
+
+  def __host_changed(self, hostname, changed):
+    if changed:
+      self.__changed(HOST % hostname, ANY_HOST)
+    return changed
+
+  def __hosts_changed(self, hostnames):
+    # one invalidation message for the whole batch
+    if hostnames:
+      self.__changed(ANY_HOST, *[HOST % hostname
+                                 for hostname in set(hostnames)])
+
+  def project_add(self, name, nfsserver, nfsroot, kernel, initrd, params):
+    return self.__project_changed(name, self.inner.project_add(
+      name, nfsserver, nfsroot, kernel, initrd, params))
+
+  def project_remove(self, name):
+    return self.__project_changed(name, self.inner.project_remove(name))
+
+  def __project_changed(self, name, changed):
+    if changed:
+      self.__changed(PROJECT % name, ANY_PROJECT)
+    return changed
+
+  def record_change(self, op, name, args):
+    return self.inner.record_change(op, name, args)
+
+  def record_changes(self, changes):
+    return self.inner.record_changes(changes)
+
+  # users aren't cached
+
+  def user_add(self, username, fullname):
+    return self.inner.user_add(username, fullname)
+
+  def user_remove(self, username):
+    return self.inner.user_remove(username)
+
+  #
+  # maintenance rewrites records in bulk
+  #
+
+  def migrate_tags(self, batch_size=100):
+    migrated = self.inner.migrate_tags(batch_size)
+    if migrated:
+      self.__changed(EVERYTHING)
+    return migrated
+
+  def rebuild_indexes(self):
+    rebuilt = self.inner.rebuild_indexes()
+    self.__changed(EVERYTHING)
+    return rebuilt
+
+  def upgrade(self, batch_size=100):
+    upgraded = self.inner.upgrade(batch_size)
+    if upgraded:
+      self.__changed(EVERYTHING)
+    return upgraded
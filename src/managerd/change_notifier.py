@@ -0,0 +1,38 @@
+#
+# Wakes the watch() calls waiting in a managerd for the next change.
+#
+# Each waiting call parks its handler thread on one shared condition
+# rather than holding a storage connection of its own.  The handler
+# notifies it after recording a change, and the storage engine after
+# hearing that another managerd has (see Storage.listen_changes()).
+# Waiters then re-read the change log to see whether anything they are
+# interested in happened, so a notification only needs to say that
+# something may have.
+#
+
+import threading, time
+
+class ChangeNotifier(object):
+  def __init__(self):
+    self.condition = threading.Condition()
+    # bumped by every notification
+    self.sequence = 0
+
+  def notify(self, version=None):
+    with self.condition:
+      self.sequence += 1
+      self.condition.notify_all()
+
+  def wait(self, sequence, timeout):
+    # wait until there has been a notification since self.sequence was
+    # sequence, for at most timeout seconds; True if there was.  Reading
+    # self.sequence before the change log and passing it in means a
+    # change made in between still wakes us.
+    deadline = time.time() + timeout
+    with self.condition:
+      while self.sequence == sequence:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+          return False
+        self.condition.wait(remaining)
+      return True
@@ -28,6 +28,26 @@ class Iface:
   def ping(self, ):
     pass
 
+  def get_pool_stats(self, ):
+    pass
+
+  def get_cache_stats(self, ):
+    pass
+
+  def set_cache_bypass(self, bypass):
+    """
+    Parameters:
+     - bypass
+    """
+    pass
+
+  def get_stats(self, reset):
+    """
+    Parameters:
+     - reset
+    """
+    pass
+
   def host_add(self, host, macaddr):
     """
     Parameters:
@@ -43,6 +63,13 @@ class Iface:
     """
     pass
 
+  def host_add_batch(self, hosts):
+    """
+    Parameters:
+     - hosts
+    """
+    pass
+
   def project_add(self, name, nfsserver, rootpath, kernel, initrd, params):
     """
     Parameters:
@@ -80,11 +107,53 @@ class Iface:
   def get_projects(self, ):
     pass
 
-  def get_hosts(self, project, tag):
+  def get_project_host_counts(self, ):
+    pass
+
+  def get_hosts(self, project, tag, fields):
+    """
+    Parameters:
+     - project
+     - tag
+     - fields
+    """
+    pass
+
+  def get_hosts_query(self, query, fields):
+    """
+    Parameters:
+     - query
+     - fields
+    """
+    pass
+
+  def get_generation(self, ):
+    pass
+
+  def get_hosts_if_changed(self, since_generation, project, tag, fields):
     """
     Parameters:
+     - since_generation
      - project
      - tag
+     - fields
+    """
+    pass
+
+  def get_changes(self, since_version, limit):
+    """
+    Parameters:
+     - since_version
+     - limit
+    """
+    pass
+
+  def watch(self, since_version, timeout_ms, filter):
+    """
+    Parameters:
+     - since_version
+     - timeout_ms
+     - filter
     """
     pass
 
@@ -95,6 +164,16 @@ class Iface:
     """
     pass
 
+  def get_hosts_page(self, filter, cursor, limit, fields):
+    """
+    Parameters:
+     - filter
+     - cursor
+     - limit
+     - fields
+    """
+    pass
+
   def host_assign(self, host, project, user):
     """
     Parameters:
@@ -104,6 +183,23 @@ class Iface:
     """
     pass
 
+  def host_allocate(self, project, count, constraints, user):
+    """
+    Parameters:
+     - project
+     - count
+     - constraints
+     - user
+    """
+    pass
+
+  def host_assign_batch(self, assignments):
+    """
+    Parameters:
+     - assignments
+    """
+    pass
+
   def host_release(self, host):
     """
     Parameters:
@@ -119,6 +215,13 @@ class Iface:
     """
     pass
 
+  def tag_add_batch(self, tags):
+    """
+    Parameters:
+     - tags
+    """
+    pass
+
   def tag_removeAll(self, host):
     """
     Parameters:
@@ -133,6 +236,13 @@ class Iface:
     """
     pass
 
+  def lookup_batch(self, macaddrs):
+    """
+    Parameters:
+     - macaddrs
+    """
+    pass
+
 
 class Client(Iface):
   def __init__(self, iprot, oprot=None):
@@ -194,6 +304,114 @@ class Client(Iface):
     self._iprot.readMessageEnd()
     return
 
+  def get_pool_stats(self, ):
+    self.send_get_pool_stats()
+    return self.recv_get_pool_stats()
+
+  def send_get_pool_stats(self, ):
+    self._oprot.writeMessageBegin('get_pool_stats', TMessageType.CALL, self._seqid)
+    args = get_pool_stats_args()
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_get_pool_stats(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = get_pool_stats_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_pool_stats failed: unknown result");
+
+  def get_cache_stats(self, ):
+    self.send_get_cache_stats()
+    return self.recv_get_cache_stats()
+
+  def send_get_cache_stats(self, ):
+    self._oprot.writeMessageBegin('get_cache_stats', TMessageType.CALL, self._seqid)
+    args = get_cache_stats_args()
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_get_cache_stats(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = get_cache_stats_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_cache_stats failed: unknown result");
+
+  def set_cache_bypass(self, bypass):
+    """
+    Parameters:
+     - bypass
+    """
+    self.send_set_cache_bypass(bypass)
+    self.recv_set_cache_bypass()
+
+  def send_set_cache_bypass(self, bypass):
+    self._oprot.writeMessageBegin('set_cache_bypass', TMessageType.CALL, self._seqid)
+    args = set_cache_bypass_args()
+    args.bypass = bypass
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_set_cache_bypass(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = set_cache_bypass_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    return
+
+  def get_stats(self, reset):
+    """
+    Parameters:
+     - reset
+    """
+    self.send_get_stats(reset)
+    return self.recv_get_stats()
+
+  def send_get_stats(self, reset):
+    self._oprot.writeMessageBegin('get_stats', TMessageType.CALL, self._seqid)
+    args = get_stats_args()
+    args.reset = reset
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_get_stats(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = get_stats_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_stats failed: unknown result");
+
   def host_add(self, host, macaddr):
     """
     Parameters:
@@ -256,6 +474,36 @@ class Client(Iface):
       return result.success
     raise TApplicationException(TApplicationException.MISSING_RESULT, "host_remove failed: unknown result");
 
+  def host_add_batch(self, hosts):
+    """
+    Parameters:
+     - hosts
+    """
+    self.send_host_add_batch(hosts)
+    return self.recv_host_add_batch()
+
+  def send_host_add_batch(self, hosts):
+    self._oprot.writeMessageBegin('host_add_batch', TMessageType.CALL, self._seqid)
+    args = host_add_batch_args()
+    args.hosts = hosts
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_host_add_batch(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = host_add_batch_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "host_add_batch failed: unknown result");
+
   def project_add(self, name, nfsserver, rootpath, kernel, initrd, params):
     """
     Parameters:
@@ -413,20 +661,47 @@ class Client(Iface):
       return result.success
     raise TApplicationException(TApplicationException.MISSING_RESULT, "get_projects failed: unknown result");
 
-  def get_hosts(self, project, tag):
+  def get_project_host_counts(self, ):
+    self.send_get_project_host_counts()
+    return self.recv_get_project_host_counts()
+
+  def send_get_project_host_counts(self, ):
+    self._oprot.writeMessageBegin('get_project_host_counts', TMessageType.CALL, self._seqid)
+    args = get_project_host_counts_args()
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_get_project_host_counts(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = get_project_host_counts_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_project_host_counts failed: unknown result");
+
+  def get_hosts(self, project, tag, fields):
     """
     Parameters:
      - project
      - tag
+     - fields
     """
-    self.send_get_hosts(project, tag)
+    self.send_get_hosts(project, tag, fields)
     return self.recv_get_hosts()
 
-  def send_get_hosts(self, project, tag):
+  def send_get_hosts(self, project, tag, fields):
     self._oprot.writeMessageBegin('get_hosts', TMessageType.CALL, self._seqid)
     args = get_hosts_args()
     args.project = project
     args.tag = tag
+    args.fields = fields
     args.write(self._oprot)
     self._oprot.writeMessageEnd()
     self._oprot.trans.flush()
@@ -449,138 +724,443 @@ class Client(Iface):
       raise result.prjx
     raise TApplicationException(TApplicationException.MISSING_RESULT, "get_hosts failed: unknown result");
 
-  def get_tags(self, host):
+  def get_hosts_query(self, query, fields):
     """
     Parameters:
-     - host
+     - query
+     - fields
     """
-    self.send_get_tags(host)
-    return self.recv_get_tags()
-
-  def send_get_tags(self, host):
-    self._oprot.writeMessageBegin('get_tags', TMessageType.CALL, self._seqid)
-    args = get_tags_args()
-    args.host = host
+    self.send_get_hosts_query(query, fields)
+    return self.recv_get_hosts_query()
+
+  def send_get_hosts_query(self, query, fields):
+    self._oprot.writeMessageBegin('get_hosts_query', TMessageType.CALL, self._seqid)
+    args = get_hosts_query_args()
+    args.query = query
+    args.fields = fields
     args.write(self._oprot)
     self._oprot.writeMessageEnd()
     self._oprot.trans.flush()
 
-  def recv_get_tags(self, ):
+  def recv_get_hosts_query(self, ):
     (fname, mtype, rseqid) = self._iprot.readMessageBegin()
     if mtype == TMessageType.EXCEPTION:
       x = TApplicationException()
       x.read(self._iprot)
       self._iprot.readMessageEnd()
       raise x
-    result = get_tags_result()
+    result = get_hosts_query_result()
     result.read(self._iprot)
     self._iprot.readMessageEnd()
     if result.success is not None:
       return result.success
-    if result.hostx is not None:
-      raise result.hostx
-    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_tags failed: unknown result");
+    if result.clix is not None:
+      raise result.clix
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_hosts_query failed: unknown result");
 
-  def host_assign(self, host, project, user):
-    """
-    Parameters:
-     - host
-     - project
-     - user
-    """
-    self.send_host_assign(host, project, user)
-    self.recv_host_assign()
+  def get_generation(self, ):
+    self.send_get_generation()
+    return self.recv_get_generation()
 
-  def send_host_assign(self, host, project, user):
-    self._oprot.writeMessageBegin('host_assign', TMessageType.CALL, self._seqid)
-    args = host_assign_args()
-    args.host = host
-    args.project = project
-    args.user = user
+  def send_get_generation(self, ):
+    self._oprot.writeMessageBegin('get_generation', TMessageType.CALL, self._seqid)
+    args = get_generation_args()
     args.write(self._oprot)
     self._oprot.writeMessageEnd()
     self._oprot.trans.flush()
 
-  def recv_host_assign(self, ):
+  def recv_get_generation(self, ):
     (fname, mtype, rseqid) = self._iprot.readMessageBegin()
     if mtype == TMessageType.EXCEPTION:
       x = TApplicationException()
       x.read(self._iprot)
       self._iprot.readMessageEnd()
       raise x
-    result = host_assign_result()
+    result = get_generation_result()
     result.read(self._iprot)
     self._iprot.readMessageEnd()
-    if result.hostx is not None:
-      raise result.hostx
-    if result.projx is not None:
-      raise result.projx
-    if result.userx is not None:
-      raise result.userx
-    return
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_generation failed: unknown result");
 
-  def host_release(self, host):
+  def get_hosts_if_changed(self, since_generation, project, tag, fields):
     """
     Parameters:
-     - host
+     - since_generation
+     - project
+     - tag
+     - fields
     """
-    self.send_host_release(host)
-    self.recv_host_release()
+    self.send_get_hosts_if_changed(since_generation, project, tag, fields)
+    return self.recv_get_hosts_if_changed()
 
-  def send_host_release(self, host):
-    self._oprot.writeMessageBegin('host_release', TMessageType.CALL, self._seqid)
-    args = host_release_args()
-    args.host = host
+  def send_get_hosts_if_changed(self, since_generation, project, tag, fields):
+    self._oprot.writeMessageBegin('get_hosts_if_changed', TMessageType.CALL, self._seqid)
+    args = get_hosts_if_changed_args()
+    args.since_generation = since_generation
+    args.project = project
+    args.tag = tag
+    args.fields = fields
     args.write(self._oprot)
     self._oprot.writeMessageEnd()
     self._oprot.trans.flush()
 
-  def recv_host_release(self, ):
+  def recv_get_hosts_if_changed(self, ):
     (fname, mtype, rseqid) = self._iprot.readMessageBegin()
     if mtype == TMessageType.EXCEPTION:
       x = TApplicationException()
       x.read(self._iprot)
       self._iprot.readMessageEnd()
       raise x
-    result = host_release_result()
+    result = get_hosts_if_changed_result()
     result.read(self._iprot)
     self._iprot.readMessageEnd()
-    if result.hostx is not None:
-      raise result.hostx
-    return
+    if result.success is not None:
+      return result.success
+    if result.clix is not None:
+      raise result.clix
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_hosts_if_changed failed: unknown result");
 
-  def tag_add(self, host, tag):
+  def get_changes(self, since_version, limit):
     """
     Parameters:
-     - host
-     - tag
+     - since_version
+     - limit
     """
-    self.send_tag_add(host, tag)
-    self.recv_tag_add()
-
-  def send_tag_add(self, host, tag):
-    self._oprot.writeMessageBegin('tag_add', TMessageType.CALL, self._seqid)
-    args = tag_add_args()
-    args.host = host
-    args.tag = tag
+    self.send_get_changes(since_version, limit)
+    return self.recv_get_changes()
+
+  def send_get_changes(self, since_version, limit):
+    self._oprot.writeMessageBegin('get_changes', TMessageType.CALL, self._seqid)
+    args = get_changes_args()
+    args.since_version = since_version
+    args.limit = limit
     args.write(self._oprot)
     self._oprot.writeMessageEnd()
     self._oprot.trans.flush()
 
-  def recv_tag_add(self, ):
+  def recv_get_changes(self, ):
     (fname, mtype, rseqid) = self._iprot.readMessageBegin()
     if mtype == TMessageType.EXCEPTION:
       x = TApplicationException()
       x.read(self._iprot)
       self._iprot.readMessageEnd()
       raise x
-    result = tag_add_result()
+    result = get_changes_result()
     result.read(self._iprot)
     self._iprot.readMessageEnd()
-    if result.hostx is not None:
-      raise result.hostx
-    return
-
+    if result.success is not None:
+      return result.success
+    if result.clix is not None:
+      raise result.clix
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_changes failed: unknown result");
+
+  def watch(self, since_version, timeout_ms, filter):
+    """
+    Parameters:
+     - since_version
+     - timeout_ms
+     - filter
+    """
+    self.send_watch(since_version, timeout_ms, filter)
+    return self.recv_watch()
+
+  def send_watch(self, since_version, timeout_ms, filter):
+    self._oprot.writeMessageBegin('watch', TMessageType.CALL, self._seqid)
+    args = watch_args()
+    args.since_version = since_version
+    args.timeout_ms = timeout_ms
+    args.filter = filter
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_watch(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = watch_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "watch failed: unknown result");
+
+  def get_tags(self, host):
+    """
+    Parameters:
+     - host
+    """
+    self.send_get_tags(host)
+    return self.recv_get_tags()
+
+  def send_get_tags(self, host):
+    self._oprot.writeMessageBegin('get_tags', TMessageType.CALL, self._seqid)
+    args = get_tags_args()
+    args.host = host
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_get_tags(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = get_tags_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    if result.hostx is not None:
+      raise result.hostx
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_tags failed: unknown result");
+
+  def get_hosts_page(self, filter, cursor, limit, fields):
+    """
+    Parameters:
+     - filter
+     - cursor
+     - limit
+     - fields
+    """
+    self.send_get_hosts_page(filter, cursor, limit, fields)
+    return self.recv_get_hosts_page()
+
+  def send_get_hosts_page(self, filter, cursor, limit, fields):
+    self._oprot.writeMessageBegin('get_hosts_page', TMessageType.CALL, self._seqid)
+    args = get_hosts_page_args()
+    args.filter = filter
+    args.cursor = cursor
+    args.limit = limit
+    args.fields = fields
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_get_hosts_page(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = get_hosts_page_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    if result.clix is not None:
+      raise result.clix
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_hosts_page failed: unknown result");
+
+  def host_assign(self, host, project, user):
+    """
+    Parameters:
+     - host
+     - project
+     - user
+    """
+    self.send_host_assign(host, project, user)
+    self.recv_host_assign()
+
+  def send_host_assign(self, host, project, user):
+    self._oprot.writeMessageBegin('host_assign', TMessageType.CALL, self._seqid)
+    args = host_assign_args()
+    args.host = host
+    args.project = project
+    args.user = user
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_host_assign(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = host_assign_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.hostx is not None:
+      raise result.hostx
+    if result.projx is not None:
+      raise result.projx
+    if result.userx is not None:
+      raise result.userx
+    return
+
+  def host_allocate(self, project, count, constraints, user):
+    """
+    Parameters:
+     - project
+     - count
+     - constraints
+     - user
+    """
+    self.send_host_allocate(project, count, constraints, user)
+    return self.recv_host_allocate()
+
+  def send_host_allocate(self, project, count, constraints, user):
+    self._oprot.writeMessageBegin('host_allocate', TMessageType.CALL, self._seqid)
+    args = host_allocate_args()
+    args.project = project
+    args.count = count
+    args.constraints = constraints
+    args.user = user
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_host_allocate(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = host_allocate_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    if result.clix is not None:
+      raise result.clix
+    if result.projx is not None:
+      raise result.projx
+    if result.availx is not None:
+      raise result.availx
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "host_allocate failed: unknown result");
+
+  def host_assign_batch(self, assignments):
+    """
+    Parameters:
+     - assignments
+    """
+    self.send_host_assign_batch(assignments)
+    return self.recv_host_assign_batch()
+
+  def send_host_assign_batch(self, assignments):
+    self._oprot.writeMessageBegin('host_assign_batch', TMessageType.CALL, self._seqid)
+    args = host_assign_batch_args()
+    args.assignments = assignments
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_host_assign_batch(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = host_assign_batch_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "host_assign_batch failed: unknown result");
+
+  def host_release(self, host):
+    """
+    Parameters:
+     - host
+    """
+    self.send_host_release(host)
+    self.recv_host_release()
+
+  def send_host_release(self, host):
+    self._oprot.writeMessageBegin('host_release', TMessageType.CALL, self._seqid)
+    args = host_release_args()
+    args.host = host
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_host_release(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = host_release_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.hostx is not None:
+      raise result.hostx
+    return
+
+  def tag_add(self, host, tag):
+    """
+    Parameters:
+     - host
+     - tag
+    """
+    self.send_tag_add(host, tag)
+    self.recv_tag_add()
+
+  def send_tag_add(self, host, tag):
+    self._oprot.writeMessageBegin('tag_add', TMessageType.CALL, self._seqid)
+    args = tag_add_args()
+    args.host = host
+    args.tag = tag
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_tag_add(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = tag_add_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.hostx is not None:
+      raise result.hostx
+    return
+
+  def tag_add_batch(self, tags):
+    """
+    Parameters:
+     - tags
+    """
+    self.send_tag_add_batch(tags)
+    return self.recv_tag_add_batch()
+
+  def send_tag_add_batch(self, tags):
+    self._oprot.writeMessageBegin('tag_add_batch', TMessageType.CALL, self._seqid)
+    args = tag_add_batch_args()
+    args.tags = tags
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_tag_add_batch(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = tag_add_batch_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "tag_add_batch failed: unknown result");
+
   def tag_removeAll(self, host):
     """
     Parameters:
@@ -643,27 +1223,73 @@ class Client(Iface):
       raise result.hostx
     raise TApplicationException(TApplicationException.MISSING_RESULT, "lookup failed: unknown result");
 
+  def lookup_batch(self, macaddrs):
+    """
+    Parameters:
+     - macaddrs
+    """
+    self.send_lookup_batch(macaddrs)
+    return self.recv_lookup_batch()
 
-class Processor(Iface, TProcessor):
-  def __init__(self, handler):
-    self._handler = handler
-    self._processMap = {}
-    self._processMap["login"] = Processor.process_login
-    self._processMap["ping"] = Processor.process_ping
-    self._processMap["host_add"] = Processor.process_host_add
-    self._processMap["host_remove"] = Processor.process_host_remove
-    self._processMap["project_add"] = Processor.process_project_add
-    self._processMap["project_remove"] = Processor.process_project_remove
-    self._processMap["user_add"] = Processor.process_user_add
-    self._processMap["user_remove"] = Processor.process_user_remove
-    self._processMap["get_projects"] = Processor.process_get_projects
+  def send_lookup_batch(self, macaddrs):
+    self._oprot.writeMessageBegin('lookup_batch', TMessageType.CALL, self._seqid)
+    args = lookup_batch_args()
+    args.macaddrs = macaddrs
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_lookup_batch(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = lookup_batch_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success is not None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "lookup_batch failed: unknown result");
+
+
+class Processor(Iface, TProcessor):
+  def __init__(self, handler):
+    self._handler = handler
+    self._processMap = {}
+    self._processMap["login"] = Processor.process_login
+    self._processMap["ping"] = Processor.process_ping
+    self._processMap["get_pool_stats"] = Processor.process_get_pool_stats
+    self._processMap["get_cache_stats"] = Processor.process_get_cache_stats
+    self._processMap["set_cache_bypass"] = Processor.process_set_cache_bypass
+    self._processMap["get_stats"] = Processor.process_get_stats
+    self._processMap["host_add"] = Processor.process_host_add
+    self._processMap["host_remove"] = Processor.process_host_remove
+    self._processMap["host_add_batch"] = Processor.process_host_add_batch
+    self._processMap["project_add"] = Processor.process_project_add
+    self._processMap["project_remove"] = Processor.process_project_remove
+    self._processMap["user_add"] = Processor.process_user_add
+    self._processMap["user_remove"] = Processor.process_user_remove
+    self._processMap["get_projects"] = Processor.process_get_projects
+    self._processMap["get_project_host_counts"] = Processor.process_get_project_host_counts
     self._processMap["get_hosts"] = Processor.process_get_hosts
+    self._processMap["get_hosts_query"] = Processor.process_get_hosts_query
+    self._processMap["get_generation"] = Processor.process_get_generation
+    self._processMap["get_hosts_if_changed"] = Processor.process_get_hosts_if_changed
+    self._processMap["get_changes"] = Processor.process_get_changes
+    self._processMap["watch"] = Processor.process_watch
     self._processMap["get_tags"] = Processor.process_get_tags
+    self._processMap["get_hosts_page"] = Processor.process_get_hosts_page
     self._processMap["host_assign"] = Processor.process_host_assign
+    self._processMap["host_allocate"] = Processor.process_host_allocate
+    self._processMap["host_assign_batch"] = Processor.process_host_assign_batch
     self._processMap["host_release"] = Processor.process_host_release
     self._processMap["tag_add"] = Processor.process_tag_add
+    self._processMap["tag_add_batch"] = Processor.process_tag_add_batch
     self._processMap["tag_removeAll"] = Processor.process_tag_removeAll
     self._processMap["lookup"] = Processor.process_lookup
+    self._processMap["lookup_batch"] = Processor.process_lookup_batch
 
   def process(self, iprot, oprot):
     (name, type, seqid) = iprot.readMessageBegin()
@@ -705,6 +1331,50 @@ class Processor(Iface, TProcessor):
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
+  def process_get_pool_stats(self, seqid, iprot, oprot):
+    args = get_pool_stats_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_pool_stats_result()
+    result.success = self._handler.get_pool_stats()
+    oprot.writeMessageBegin("get_pool_stats", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_get_cache_stats(self, seqid, iprot, oprot):
+    args = get_cache_stats_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_cache_stats_result()
+    result.success = self._handler.get_cache_stats()
+    oprot.writeMessageBegin("get_cache_stats", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_set_cache_bypass(self, seqid, iprot, oprot):
+    args = set_cache_bypass_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = set_cache_bypass_result()
+    self._handler.set_cache_bypass(args.bypass)
+    oprot.writeMessageBegin("set_cache_bypass", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_get_stats(self, seqid, iprot, oprot):
+    args = get_stats_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_stats_result()
+    result.success = self._handler.get_stats(args.reset)
+    oprot.writeMessageBegin("get_stats", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
   def process_host_add(self, seqid, iprot, oprot):
     args = host_add_args()
     args.read(iprot)
@@ -727,6 +1397,17 @@ class Processor(Iface, TProcessor):
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
+  def process_host_add_batch(self, seqid, iprot, oprot):
+    args = host_add_batch_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = host_add_batch_result()
+    result.success = self._handler.host_add_batch(args.hosts)
+    oprot.writeMessageBegin("host_add_batch", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
   def process_project_add(self, seqid, iprot, oprot):
     args = project_add_args()
     args.read(iprot)
@@ -782,13 +1463,24 @@ class Processor(Iface, TProcessor):
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
+  def process_get_project_host_counts(self, seqid, iprot, oprot):
+    args = get_project_host_counts_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_project_host_counts_result()
+    result.success = self._handler.get_project_host_counts()
+    oprot.writeMessageBegin("get_project_host_counts", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
   def process_get_hosts(self, seqid, iprot, oprot):
     args = get_hosts_args()
     args.read(iprot)
     iprot.readMessageEnd()
     result = get_hosts_result()
     try:
-      result.success = self._handler.get_hosts(args.project, args.tag)
+      result.success = self._handler.get_hosts(args.project, args.tag, args.fields)
     except ClientError as clix:
       result.clix = clix
     except BadProjectException as prjx:
@@ -798,110 +1490,2272 @@ class Processor(Iface, TProcessor):
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
-  def process_get_tags(self, seqid, iprot, oprot):
-    args = get_tags_args()
-    args.read(iprot)
-    iprot.readMessageEnd()
-    result = get_tags_result()
-    try:
-      result.success = self._handler.get_tags(args.host)
-    except BadHostException as hostx:
-      result.hostx = hostx
-    oprot.writeMessageBegin("get_tags", TMessageType.REPLY, seqid)
-    result.write(oprot)
-    oprot.writeMessageEnd()
-    oprot.trans.flush()
+  def process_get_hosts_query(self, seqid, iprot, oprot):
+    args = get_hosts_query_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_hosts_query_result()
+    try:
+      result.success = self._handler.get_hosts_query(args.query, args.fields)
+    except ClientError as clix:
+      result.clix = clix
+    oprot.writeMessageBegin("get_hosts_query", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_get_generation(self, seqid, iprot, oprot):
+    args = get_generation_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_generation_result()
+    result.success = self._handler.get_generation()
+    oprot.writeMessageBegin("get_generation", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_get_hosts_if_changed(self, seqid, iprot, oprot):
+    args = get_hosts_if_changed_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_hosts_if_changed_result()
+    try:
+      result.success = self._handler.get_hosts_if_changed(args.since_generation, args.project, args.tag, args.fields)
+    except ClientError as clix:
+      result.clix = clix
+    oprot.writeMessageBegin("get_hosts_if_changed", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_get_changes(self, seqid, iprot, oprot):
+    args = get_changes_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_changes_result()
+    try:
+      result.success = self._handler.get_changes(args.since_version, args.limit)
+    except ClientError as clix:
+      result.clix = clix
+    oprot.writeMessageBegin("get_changes", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_watch(self, seqid, iprot, oprot):
+    args = watch_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = watch_result()
+    result.success = self._handler.watch(args.since_version, args.timeout_ms, args.filter)
+    oprot.writeMessageBegin("watch", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_get_tags(self, seqid, iprot, oprot):
+    args = get_tags_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_tags_result()
+    try:
+      result.success = self._handler.get_tags(args.host)
+    except BadHostException as hostx:
+      result.hostx = hostx
+    oprot.writeMessageBegin("get_tags", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_get_hosts_page(self, seqid, iprot, oprot):
+    args = get_hosts_page_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_hosts_page_result()
+    try:
+      result.success = self._handler.get_hosts_page(args.filter, args.cursor, args.limit, args.fields)
+    except ClientError as clix:
+      result.clix = clix
+    oprot.writeMessageBegin("get_hosts_page", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_host_assign(self, seqid, iprot, oprot):
+    args = host_assign_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = host_assign_result()
+    try:
+      self._handler.host_assign(args.host, args.project, args.user)
+    except BadHostException as hostx:
+      result.hostx = hostx
+    except BadProjectException as projx:
+      result.projx = projx
+    except BadUserException as userx:
+      result.userx = userx
+    oprot.writeMessageBegin("host_assign", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_host_allocate(self, seqid, iprot, oprot):
+    args = host_allocate_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = host_allocate_result()
+    try:
+      result.success = self._handler.host_allocate(args.project, args.count, args.constraints, args.user)
+    except ClientError as clix:
+      result.clix = clix
+    except BadProjectException as projx:
+      result.projx = projx
+    except NotEnoughHostsException as availx:
+      result.availx = availx
+    oprot.writeMessageBegin("host_allocate", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_host_assign_batch(self, seqid, iprot, oprot):
+    args = host_assign_batch_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = host_assign_batch_result()
+    result.success = self._handler.host_assign_batch(args.assignments)
+    oprot.writeMessageBegin("host_assign_batch", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_host_release(self, seqid, iprot, oprot):
+    args = host_release_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = host_release_result()
+    try:
+      self._handler.host_release(args.host)
+    except BadHostException as hostx:
+      result.hostx = hostx
+    oprot.writeMessageBegin("host_release", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_tag_add(self, seqid, iprot, oprot):
+    args = tag_add_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = tag_add_result()
+    try:
+      self._handler.tag_add(args.host, args.tag)
+    except BadHostException as hostx:
+      result.hostx = hostx
+    oprot.writeMessageBegin("tag_add", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_tag_add_batch(self, seqid, iprot, oprot):
+    args = tag_add_batch_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = tag_add_batch_result()
+    result.success = self._handler.tag_add_batch(args.tags)
+    oprot.writeMessageBegin("tag_add_batch", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_tag_removeAll(self, seqid, iprot, oprot):
+    args = tag_removeAll_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = tag_removeAll_result()
+    try:
+      self._handler.tag_removeAll(args.host)
+    except BadHostException as hostx:
+      result.hostx = hostx
+    oprot.writeMessageBegin("tag_removeAll", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_lookup(self, seqid, iprot, oprot):
+    args = lookup_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = lookup_result()
+    try:
+      result.success = self._handler.lookup(args.macaddr)
+    except BadHostException as hostx:
+      result.hostx = hostx
+    oprot.writeMessageBegin("lookup", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_lookup_batch(self, seqid, iprot, oprot):
+    args = lookup_batch_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = lookup_batch_result()
+    result.success = self._handler.lookup_batch(args.macaddrs)
+    oprot.writeMessageBegin("lookup_batch", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+class login_args:
+  """
+  Attributes:
+   - auth_request
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'auth_request', (AuthenticationRequest, AuthenticationRequest.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, auth_request=None,):
+    self.auth_request = auth_request
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.auth_request = AuthenticationRequest()
+          self.auth_request.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('login_args')
+    if self.auth_request is not None:
+      oprot.writeFieldBegin('auth_request', TType.STRUCT, 1)
+      self.auth_request.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.auth_request is None:
+      raise TProtocol.TProtocolException(message='Required field auth_request is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class login_result:
+  """
+  Attributes:
+   - authnx
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'authnx', (AuthenticationException, AuthenticationException.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, authnx=None,):
+    self.authnx = authnx
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.authnx = AuthenticationException()
+          self.authnx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('login_result')
+    if self.authnx is not None:
+      oprot.writeFieldBegin('authnx', TType.STRUCT, 1)
+      self.authnx.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ping_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ping_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ping_result:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ping_result')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_pool_stats_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_pool_stats_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_pool_stats_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.MAP, 'success', (TType.STRING,None,TType.DOUBLE,None), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.MAP:
+          self.success = {}
+          (_ktype54, _vtype55, _size53 ) = iprot.readMapBegin() 
+          for _i57 in xrange(_size53):
+            _key58 = iprot.readString();
+            _val59 = iprot.readDouble();
+            self.success[_key58] = _val59
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_pool_stats_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.MAP, 0)
+      oprot.writeMapBegin(TType.STRING, TType.DOUBLE, len(self.success))
+      for kiter60,viter61 in self.success.items():
+        oprot.writeString(kiter60)
+        oprot.writeDouble(viter61)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_cache_stats_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_cache_stats_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_cache_stats_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.MAP, 'success', (TType.STRING,None,TType.DOUBLE,None), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.MAP:
+          self.success = {}
+          (_ktype63, _vtype64, _size62 ) = iprot.readMapBegin() 
+          for _i66 in xrange(_size62):
+            _key67 = iprot.readString();
+            _val68 = iprot.readDouble();
+            self.success[_key67] = _val68
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_cache_stats_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.MAP, 0)
+      oprot.writeMapBegin(TType.STRING, TType.DOUBLE, len(self.success))
+      for kiter69,viter70 in self.success.items():
+        oprot.writeString(kiter69)
+        oprot.writeDouble(viter70)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class set_cache_bypass_args:
+  """
+  Attributes:
+   - bypass
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.BOOL, 'bypass', None, None, ), # 1
+  )
+
+  def __init__(self, bypass=None,):
+    self.bypass = bypass
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.BOOL:
+          self.bypass = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('set_cache_bypass_args')
+    if self.bypass is not None:
+      oprot.writeFieldBegin('bypass', TType.BOOL, 1)
+      oprot.writeBool(self.bypass)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.bypass is None:
+      raise TProtocol.TProtocolException(message='Required field bypass is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class set_cache_bypass_result:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('set_cache_bypass_result')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_stats_args:
+  """
+  Attributes:
+   - reset
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.BOOL, 'reset', None, None, ), # 1
+  )
+
+  def __init__(self, reset=None,):
+    self.reset = reset
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.BOOL:
+          self.reset = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_stats_args')
+    if self.reset is not None:
+      oprot.writeFieldBegin('reset', TType.BOOL, 1)
+      oprot.writeBool(self.reset)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_stats_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.MAP, 'success', (TType.STRING,None,TType.STRUCT,(RpcStats, RpcStats.thrift_spec)), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.MAP:
+          self.success = {}
+          (_ktype72, _vtype73, _size71 ) = iprot.readMapBegin() 
+          for _i75 in xrange(_size71):
+            _key76 = iprot.readString();
+            _val77 = RpcStats()
+            _val77.read(iprot)
+            self.success[_key76] = _val77
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_stats_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.MAP, 0)
+      oprot.writeMapBegin(TType.STRING, TType.STRUCT, len(self.success))
+      for kiter78,viter79 in self.success.items():
+        oprot.writeString(kiter78)
+        viter79.write(oprot)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class host_add_args:
+  """
+  Attributes:
+   - host
+   - macaddr
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'host', None, None, ), # 1
+    (2, TType.STRING, 'macaddr', None, None, ), # 2
+  )
+
+  def __init__(self, host=None, macaddr=None,):
+    self.host = host
+    self.macaddr = macaddr
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.host = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.macaddr = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('host_add_args')
+    if self.host is not None:
+      oprot.writeFieldBegin('host', TType.STRING, 1)
+      oprot.writeString(self.host)
+      oprot.writeFieldEnd()
+    if self.macaddr is not None:
+      oprot.writeFieldBegin('macaddr', TType.STRING, 2)
+      oprot.writeString(self.macaddr)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.host is None:
+      raise TProtocol.TProtocolException(message='Required field host is unset!')
+    if self.macaddr is None:
+      raise TProtocol.TProtocolException(message='Required field macaddr is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class host_add_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.BOOL:
+          self.success = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('host_add_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.BOOL, 0)
+      oprot.writeBool(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class host_remove_args:
+  """
+  Attributes:
+   - host
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'host', None, None, ), # 1
+  )
+
+  def __init__(self, host=None,):
+    self.host = host
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.host = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('host_remove_args')
+    if self.host is not None:
+      oprot.writeFieldBegin('host', TType.STRING, 1)
+      oprot.writeString(self.host)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.host is None:
+      raise TProtocol.TProtocolException(message='Required field host is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class host_remove_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.BOOL:
+          self.success = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('host_remove_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.BOOL, 0)
+      oprot.writeBool(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class host_add_batch_args:
+  """
+  Attributes:
+   - hosts
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'hosts', (TType.STRUCT,(HostSpec, HostSpec.thrift_spec)), None, ), # 1
+  )
+
+  def __init__(self, hosts=None,):
+    self.hosts = hosts
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST:
+          self.hosts = []
+          (_etype83, _size80) = iprot.readListBegin()
+          for _i84 in xrange(_size80):
+            _elem85 = HostSpec()
+            _elem85.read(iprot)
+            self.hosts.append(_elem85)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('host_add_batch_args')
+    if self.hosts is not None:
+      oprot.writeFieldBegin('hosts', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRUCT, len(self.hosts))
+      for iter86 in self.hosts:
+        iter86.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.hosts is None:
+      raise TProtocol.TProtocolException(message='Required field hosts is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class host_add_batch_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.LIST, 'success', (TType.BOOL,None), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.LIST:
+          self.success = []
+          (_etype90, _size87) = iprot.readListBegin()
+          for _i91 in xrange(_size87):
+            _elem92 = iprot.readBool();
+            self.success.append(_elem92)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('host_add_batch_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.LIST, 0)
+      oprot.writeListBegin(TType.BOOL, len(self.success))
+      for iter93 in self.success:
+        oprot.writeBool(iter93)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class project_add_args:
+  """
+  Attributes:
+   - name
+   - nfsserver
+   - rootpath
+   - kernel
+   - initrd
+   - params
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'name', None, None, ), # 1
+    (2, TType.STRING, 'nfsserver', None, None, ), # 2
+    (3, TType.STRING, 'rootpath', None, None, ), # 3
+    (4, TType.STRING, 'kernel', None, None, ), # 4
+    (5, TType.STRING, 'initrd', None, None, ), # 5
+    (6, TType.STRING, 'params', None, None, ), # 6
+  )
+
+  def __init__(self, name=None, nfsserver=None, rootpath=None, kernel=None, initrd=None, params=None,):
+    self.name = name
+    self.nfsserver = nfsserver
+    self.rootpath = rootpath
+    self.kernel = kernel
+    self.initrd = initrd
+    self.params = params
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.name = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.nfsserver = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.rootpath = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRING:
+          self.kernel = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.STRING:
+          self.initrd = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.STRING:
+          self.params = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('project_add_args')
+    if self.name is not None:
+      oprot.writeFieldBegin('name', TType.STRING, 1)
+      oprot.writeString(self.name)
+      oprot.writeFieldEnd()
+    if self.nfsserver is not None:
+      oprot.writeFieldBegin('nfsserver', TType.STRING, 2)
+      oprot.writeString(self.nfsserver)
+      oprot.writeFieldEnd()
+    if self.rootpath is not None:
+      oprot.writeFieldBegin('rootpath', TType.STRING, 3)
+      oprot.writeString(self.rootpath)
+      oprot.writeFieldEnd()
+    if self.kernel is not None:
+      oprot.writeFieldBegin('kernel', TType.STRING, 4)
+      oprot.writeString(self.kernel)
+      oprot.writeFieldEnd()
+    if self.initrd is not None:
+      oprot.writeFieldBegin('initrd', TType.STRING, 5)
+      oprot.writeString(self.initrd)
+      oprot.writeFieldEnd()
+    if self.params is not None:
+      oprot.writeFieldBegin('params', TType.STRING, 6)
+      oprot.writeString(self.params)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.name is None:
+      raise TProtocol.TProtocolException(message='Required field name is unset!')
+    if self.nfsserver is None:
+      raise TProtocol.TProtocolException(message='Required field nfsserver is unset!')
+    if self.rootpath is None:
+      raise TProtocol.TProtocolException(message='Required field rootpath is unset!')
+    if self.kernel is None:
+      raise TProtocol.TProtocolException(message='Required field kernel is unset!')
+    if self.initrd is None:
+      raise TProtocol.TProtocolException(message='Required field initrd is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class project_add_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.BOOL:
+          self.success = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('project_add_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.BOOL, 0)
+      oprot.writeBool(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class project_remove_args:
+  """
+  Attributes:
+   - project
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'project', None, None, ), # 1
+  )
+
+  def __init__(self, project=None,):
+    self.project = project
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.project = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('project_remove_args')
+    if self.project is not None:
+      oprot.writeFieldBegin('project', TType.STRING, 1)
+      oprot.writeString(self.project)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.project is None:
+      raise TProtocol.TProtocolException(message='Required field project is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class project_remove_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.BOOL:
+          self.success = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('project_remove_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.BOOL, 0)
+      oprot.writeBool(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class user_add_args:
+  """
+  Attributes:
+   - username
+   - fullname
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'username', None, None, ), # 1
+    (2, TType.STRING, 'fullname', None, None, ), # 2
+  )
+
+  def __init__(self, username=None, fullname=None,):
+    self.username = username
+    self.fullname = fullname
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.username = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.fullname = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('user_add_args')
+    if self.username is not None:
+      oprot.writeFieldBegin('username', TType.STRING, 1)
+      oprot.writeString(self.username)
+      oprot.writeFieldEnd()
+    if self.fullname is not None:
+      oprot.writeFieldBegin('fullname', TType.STRING, 2)
+      oprot.writeString(self.fullname)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.username is None:
+      raise TProtocol.TProtocolException(message='Required field username is unset!')
+    if self.fullname is None:
+      raise TProtocol.TProtocolException(message='Required field fullname is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class user_add_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.BOOL:
+          self.success = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('user_add_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.BOOL, 0)
+      oprot.writeBool(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class user_remove_args:
+  """
+  Attributes:
+   - user
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'user', None, None, ), # 1
+  )
+
+  def __init__(self, user=None,):
+    self.user = user
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.user = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('user_remove_args')
+    if self.user is not None:
+      oprot.writeFieldBegin('user', TType.STRING, 1)
+      oprot.writeString(self.user)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.user is None:
+      raise TProtocol.TProtocolException(message='Required field user is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class user_remove_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.BOOL:
+          self.success = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('user_remove_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.BOOL, 0)
+      oprot.writeBool(self.success)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_projects_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_projects_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_projects_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRING,None), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.LIST:
+          self.success = []
+          (_etype97, _size94) = iprot.readListBegin()
+          for _i98 in xrange(_size94):
+            _elem99 = iprot.readString();
+            self.success.append(_elem99)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_projects_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.LIST, 0)
+      oprot.writeListBegin(TType.STRING, len(self.success))
+      for iter100 in self.success:
+        oprot.writeString(iter100)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_project_host_counts_args:
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_project_host_counts_args')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_project_host_counts_result:
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.MAP, 'success', (TType.STRING,None,TType.I32,None), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.MAP:
+          self.success = {}
+          (_ktype102, _vtype103, _size101 ) = iprot.readMapBegin() 
+          for _i105 in xrange(_size101):
+            _key106 = iprot.readString();
+            _val107 = iprot.readI32();
+            self.success[_key106] = _val107
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_project_host_counts_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.MAP, 0)
+      oprot.writeMapBegin(TType.STRING, TType.I32, len(self.success))
+      for kiter108,viter109 in self.success.items():
+        oprot.writeString(kiter108)
+        oprot.writeI32(viter109)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_hosts_args:
+  """
+  Attributes:
+   - project
+   - tag
+   - fields
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'project', None, None, ), # 1
+    (2, TType.STRING, 'tag', None, None, ), # 2
+    (3, TType.LIST, 'fields', (TType.STRING,None), None, ), # 3
+  )
+
+  def __init__(self, project=None, tag=None, fields=None,):
+    self.project = project
+    self.tag = tag
+    self.fields = fields
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.project = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.tag = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.LIST:
+          self.fields = []
+          (_etype113, _size110) = iprot.readListBegin()
+          for _i114 in xrange(_size110):
+            _elem115 = iprot.readString();
+            self.fields.append(_elem115)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_hosts_args')
+    if self.project is not None:
+      oprot.writeFieldBegin('project', TType.STRING, 1)
+      oprot.writeString(self.project)
+      oprot.writeFieldEnd()
+    if self.tag is not None:
+      oprot.writeFieldBegin('tag', TType.STRING, 2)
+      oprot.writeString(self.tag)
+      oprot.writeFieldEnd()
+    if self.fields is not None:
+      oprot.writeFieldBegin('fields', TType.LIST, 3)
+      oprot.writeListBegin(TType.STRING, len(self.fields))
+      for iter116 in self.fields:
+        oprot.writeString(iter116)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_hosts_result:
+  """
+  Attributes:
+   - success
+   - clix
+   - prjx
+  """
+
+  thrift_spec = (
+    (0, TType.LIST, 'success', (TType.STRUCT,(Host, Host.thrift_spec)), None, ), # 0
+    (1, TType.STRUCT, 'clix', (ClientError, ClientError.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'prjx', (BadProjectException, BadProjectException.thrift_spec), None, ), # 2
+  )
 
-  def process_host_assign(self, seqid, iprot, oprot):
-    args = host_assign_args()
-    args.read(iprot)
-    iprot.readMessageEnd()
-    result = host_assign_result()
-    try:
-      self._handler.host_assign(args.host, args.project, args.user)
-    except BadHostException as hostx:
-      result.hostx = hostx
-    except BadProjectException as projx:
-      result.projx = projx
-    except BadUserException as userx:
-      result.userx = userx
-    oprot.writeMessageBegin("host_assign", TMessageType.REPLY, seqid)
-    result.write(oprot)
-    oprot.writeMessageEnd()
-    oprot.trans.flush()
+  def __init__(self, success=None, clix=None, prjx=None,):
+    self.success = success
+    self.clix = clix
+    self.prjx = prjx
 
-  def process_host_release(self, seqid, iprot, oprot):
-    args = host_release_args()
-    args.read(iprot)
-    iprot.readMessageEnd()
-    result = host_release_result()
-    try:
-      self._handler.host_release(args.host)
-    except BadHostException as hostx:
-      result.hostx = hostx
-    oprot.writeMessageBegin("host_release", TMessageType.REPLY, seqid)
-    result.write(oprot)
-    oprot.writeMessageEnd()
-    oprot.trans.flush()
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.LIST:
+          self.success = []
+          (_etype120, _size117) = iprot.readListBegin()
+          for _i121 in xrange(_size117):
+            _elem122 = Host()
+            _elem122.read(iprot)
+            self.success.append(_elem122)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.clix = ClientError()
+          self.clix.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.prjx = BadProjectException()
+          self.prjx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
 
-  def process_tag_add(self, seqid, iprot, oprot):
-    args = tag_add_args()
-    args.read(iprot)
-    iprot.readMessageEnd()
-    result = tag_add_result()
-    try:
-      self._handler.tag_add(args.host, args.tag)
-    except BadHostException as hostx:
-      result.hostx = hostx
-    oprot.writeMessageBegin("tag_add", TMessageType.REPLY, seqid)
-    result.write(oprot)
-    oprot.writeMessageEnd()
-    oprot.trans.flush()
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_hosts_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.LIST, 0)
+      oprot.writeListBegin(TType.STRUCT, len(self.success))
+      for iter123 in self.success:
+        iter123.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.clix is not None:
+      oprot.writeFieldBegin('clix', TType.STRUCT, 1)
+      self.clix.write(oprot)
+      oprot.writeFieldEnd()
+    if self.prjx is not None:
+      oprot.writeFieldBegin('prjx', TType.STRUCT, 2)
+      self.prjx.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
 
-  def process_tag_removeAll(self, seqid, iprot, oprot):
-    args = tag_removeAll_args()
-    args.read(iprot)
-    iprot.readMessageEnd()
-    result = tag_removeAll_result()
-    try:
-      self._handler.tag_removeAll(args.host)
-    except BadHostException as hostx:
-      result.hostx = hostx
-    oprot.writeMessageBegin("tag_removeAll", TMessageType.REPLY, seqid)
-    result.write(oprot)
-    oprot.writeMessageEnd()
-    oprot.trans.flush()
+  def validate(self):
+    return
 
-  def process_lookup(self, seqid, iprot, oprot):
-    args = lookup_args()
-    args.read(iprot)
-    iprot.readMessageEnd()
-    result = lookup_result()
-    try:
-      result.success = self._handler.lookup(args.macaddr)
-    except BadHostException as hostx:
-      result.hostx = hostx
-    oprot.writeMessageBegin("lookup", TMessageType.REPLY, seqid)
-    result.write(oprot)
-    oprot.writeMessageEnd()
-    oprot.trans.flush()
 
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
 
-# HELPER FUNCTIONS AND STRUCTURES
+  def __ne__(self, other):
+    return not (self == other)
 
-class login_args:
+class get_hosts_query_args:
   """
   Attributes:
-   - auth_request
+   - query
+   - fields
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'auth_request', (AuthenticationRequest, AuthenticationRequest.thrift_spec), None, ), # 1
+    (1, TType.STRING, 'query', None, None, ), # 1
+    (2, TType.LIST, 'fields', (TType.STRING,None), None, ), # 2
   )
 
-  def __init__(self, auth_request=None,):
-    self.auth_request = auth_request
+  def __init__(self, query=None, fields=None,):
+    self.query = query
+    self.fields = fields
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -913,9 +3767,18 @@ class login_args:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRUCT:
-          self.auth_request = AuthenticationRequest()
-          self.auth_request.read(iprot)
+        if ftype == TType.STRING:
+          self.query = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.fields = []
+          (_etype127, _size124) = iprot.readListBegin()
+          for _i128 in xrange(_size124):
+            _elem129 = iprot.readString();
+            self.fields.append(_elem129)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       else:
@@ -927,17 +3790,24 @@ class login_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('login_args')
-    if self.auth_request is not None:
-      oprot.writeFieldBegin('auth_request', TType.STRUCT, 1)
-      self.auth_request.write(oprot)
+    oprot.writeStructBegin('get_hosts_query_args')
+    if self.query is not None:
+      oprot.writeFieldBegin('query', TType.STRING, 1)
+      oprot.writeString(self.query)
+      oprot.writeFieldEnd()
+    if self.fields is not None:
+      oprot.writeFieldBegin('fields', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRING, len(self.fields))
+      for iter130 in self.fields:
+        oprot.writeString(iter130)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.auth_request is None:
-      raise TProtocol.TProtocolException(message='Required field auth_request is unset!')
+    if self.query is None:
+      raise TProtocol.TProtocolException(message='Required field query is unset!')
     return
 
 
@@ -952,19 +3822,21 @@ class login_args:
   def __ne__(self, other):
     return not (self == other)
 
-class login_result:
+class get_hosts_query_result:
   """
   Attributes:
-   - authnx
+   - success
+   - clix
   """
 
   thrift_spec = (
-    None, # 0
-    (1, TType.STRUCT, 'authnx', (AuthenticationException, AuthenticationException.thrift_spec), None, ), # 1
+    (0, TType.LIST, 'success', (TType.STRUCT,(Host, Host.thrift_spec)), None, ), # 0
+    (1, TType.STRUCT, 'clix', (ClientError, ClientError.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, authnx=None,):
-    self.authnx = authnx
+  def __init__(self, success=None, clix=None,):
+    self.success = success
+    self.clix = clix
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -975,10 +3847,21 @@ class login_result:
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
-      if fid == 1:
+      if fid == 0:
+        if ftype == TType.LIST:
+          self.success = []
+          (_etype134, _size131) = iprot.readListBegin()
+          for _i135 in xrange(_size131):
+            _elem136 = Host()
+            _elem136.read(iprot)
+            self.success.append(_elem136)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
         if ftype == TType.STRUCT:
-          self.authnx = AuthenticationException()
-          self.authnx.read(iprot)
+          self.clix = ClientError()
+          self.clix.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -990,10 +3873,17 @@ class login_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('login_result')
-    if self.authnx is not None:
-      oprot.writeFieldBegin('authnx', TType.STRUCT, 1)
-      self.authnx.write(oprot)
+    oprot.writeStructBegin('get_hosts_query_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.LIST, 0)
+      oprot.writeListBegin(TType.STRUCT, len(self.success))
+      for iter137 in self.success:
+        iter137.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.clix is not None:
+      oprot.writeFieldBegin('clix', TType.STRUCT, 1)
+      self.clix.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1013,7 +3903,7 @@ class login_result:
   def __ne__(self, other):
     return not (self == other)
 
-class ping_args:
+class get_generation_args:
 
   thrift_spec = (
   )
@@ -1036,7 +3926,7 @@ class ping_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('ping_args')
+    oprot.writeStructBegin('get_generation_args')
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -1055,11 +3945,19 @@ class ping_args:
   def __ne__(self, other):
     return not (self == other)
 
-class ping_result:
+class get_generation_result:
+  """
+  Attributes:
+   - success
+  """
 
   thrift_spec = (
+    (0, TType.I64, 'success', None, None, ), # 0
   )
 
+  def __init__(self, success=None,):
+    self.success = success
+
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
       fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
@@ -1069,6 +3967,11 @@ class ping_result:
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
+      if fid == 0:
+        if ftype == TType.I64:
+          self.success = iprot.readI64();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -1078,7 +3981,11 @@ class ping_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('ping_result')
+    oprot.writeStructBegin('get_generation_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.I64, 0)
+      oprot.writeI64(self.success)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -1097,22 +4004,28 @@ class ping_result:
   def __ne__(self, other):
     return not (self == other)
 
-class host_add_args:
+class get_hosts_if_changed_args:
   """
   Attributes:
-   - host
-   - macaddr
+   - since_generation
+   - project
+   - tag
+   - fields
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'host', None, None, ), # 1
-    (2, TType.STRING, 'macaddr', None, None, ), # 2
+    (1, TType.I64, 'since_generation', None, None, ), # 1
+    (2, TType.STRING, 'project', None, None, ), # 2
+    (3, TType.STRING, 'tag', None, None, ), # 3
+    (4, TType.LIST, 'fields', (TType.STRING,None), None, ), # 4
   )
 
-  def __init__(self, host=None, macaddr=None,):
-    self.host = host
-    self.macaddr = macaddr
+  def __init__(self, since_generation=None, project=None, tag=None, fields=None,):
+    self.since_generation = since_generation
+    self.project = project
+    self.tag = tag
+    self.fields = fields
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1124,13 +4037,28 @@ class host_add_args:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.host = iprot.readString();
+        if ftype == TType.I64:
+          self.since_generation = iprot.readI64();
         else:
           iprot.skip(ftype)
       elif fid == 2:
         if ftype == TType.STRING:
-          self.macaddr = iprot.readString();
+          self.project = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.tag = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.LIST:
+          self.fields = []
+          (_etype141, _size138) = iprot.readListBegin()
+          for _i142 in xrange(_size138):
+            _elem143 = iprot.readString();
+            self.fields.append(_elem143)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       else:
@@ -1142,23 +4070,32 @@ class host_add_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('host_add_args')
-    if self.host is not None:
-      oprot.writeFieldBegin('host', TType.STRING, 1)
-      oprot.writeString(self.host)
+    oprot.writeStructBegin('get_hosts_if_changed_args')
+    if self.since_generation is not None:
+      oprot.writeFieldBegin('since_generation', TType.I64, 1)
+      oprot.writeI64(self.since_generation)
       oprot.writeFieldEnd()
-    if self.macaddr is not None:
-      oprot.writeFieldBegin('macaddr', TType.STRING, 2)
-      oprot.writeString(self.macaddr)
+    if self.project is not None:
+      oprot.writeFieldBegin('project', TType.STRING, 2)
+      oprot.writeString(self.project)
+      oprot.writeFieldEnd()
+    if self.tag is not None:
+      oprot.writeFieldBegin('tag', TType.STRING, 3)
+      oprot.writeString(self.tag)
+      oprot.writeFieldEnd()
+    if self.fields is not None:
+      oprot.writeFieldBegin('fields', TType.LIST, 4)
+      oprot.writeListBegin(TType.STRING, len(self.fields))
+      for iter144 in self.fields:
+        oprot.writeString(iter144)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.host is None:
-      raise TProtocol.TProtocolException(message='Required field host is unset!')
-    if self.macaddr is None:
-      raise TProtocol.TProtocolException(message='Required field macaddr is unset!')
+    if self.since_generation is None:
+      raise TProtocol.TProtocolException(message='Required field since_generation is unset!')
     return
 
 
@@ -1173,18 +4110,21 @@ class host_add_args:
   def __ne__(self, other):
     return not (self == other)
 
-class host_add_result:
+class get_hosts_if_changed_result:
   """
   Attributes:
    - success
+   - clix
   """
 
   thrift_spec = (
-    (0, TType.BOOL, 'success', None, None, ), # 0
+    (0, TType.STRUCT, 'success', (HostsUpdate, HostsUpdate.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'clix', (ClientError, ClientError.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, success=None,):
+  def __init__(self, success=None, clix=None,):
     self.success = success
+    self.clix = clix
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1196,8 +4136,15 @@ class host_add_result:
       if ftype == TType.STOP:
         break
       if fid == 0:
-        if ftype == TType.BOOL:
-          self.success = iprot.readBool();
+        if ftype == TType.STRUCT:
+          self.success = HostsUpdate()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.clix = ClientError()
+          self.clix.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -1209,10 +4156,14 @@ class host_add_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('host_add_result')
+    oprot.writeStructBegin('get_hosts_if_changed_result')
     if self.success is not None:
-      oprot.writeFieldBegin('success', TType.BOOL, 0)
-      oprot.writeBool(self.success)
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    if self.clix is not None:
+      oprot.writeFieldBegin('clix', TType.STRUCT, 1)
+      self.clix.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1232,19 +4183,22 @@ class host_add_result:
   def __ne__(self, other):
     return not (self == other)
 
-class host_remove_args:
+class get_changes_args:
   """
   Attributes:
-   - host
+   - since_version
+   - limit
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'host', None, None, ), # 1
+    (1, TType.I64, 'since_version', None, None, ), # 1
+    (2, TType.I32, 'limit', None, None, ), # 2
   )
 
-  def __init__(self, host=None,):
-    self.host = host
+  def __init__(self, since_version=None, limit=None,):
+    self.since_version = since_version
+    self.limit = limit
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1256,8 +4210,13 @@ class host_remove_args:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.host = iprot.readString();
+        if ftype == TType.I64:
+          self.since_version = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.limit = iprot.readI32();
         else:
           iprot.skip(ftype)
       else:
@@ -1269,17 +4228,21 @@ class host_remove_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('host_remove_args')
-    if self.host is not None:
-      oprot.writeFieldBegin('host', TType.STRING, 1)
-      oprot.writeString(self.host)
+    oprot.writeStructBegin('get_changes_args')
+    if self.since_version is not None:
+      oprot.writeFieldBegin('since_version', TType.I64, 1)
+      oprot.writeI64(self.since_version)
+      oprot.writeFieldEnd()
+    if self.limit is not None:
+      oprot.writeFieldBegin('limit', TType.I32, 2)
+      oprot.writeI32(self.limit)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.host is None:
-      raise TProtocol.TProtocolException(message='Required field host is unset!')
+    if self.since_version is None:
+      raise TProtocol.TProtocolException(message='Required field since_version is unset!')
     return
 
 
@@ -1294,18 +4257,21 @@ class host_remove_args:
   def __ne__(self, other):
     return not (self == other)
 
-class host_remove_result:
+class get_changes_result:
   """
   Attributes:
    - success
+   - clix
   """
 
   thrift_spec = (
-    (0, TType.BOOL, 'success', None, None, ), # 0
+    (0, TType.STRUCT, 'success', (ChangesPage, ChangesPage.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'clix', (ClientError, ClientError.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, success=None,):
+  def __init__(self, success=None, clix=None,):
     self.success = success
+    self.clix = clix
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1317,8 +4283,15 @@ class host_remove_result:
       if ftype == TType.STOP:
         break
       if fid == 0:
-        if ftype == TType.BOOL:
-          self.success = iprot.readBool();
+        if ftype == TType.STRUCT:
+          self.success = ChangesPage()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.clix = ClientError()
+          self.clix.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -1330,10 +4303,14 @@ class host_remove_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('host_remove_result')
+    oprot.writeStructBegin('get_changes_result')
     if self.success is not None:
-      oprot.writeFieldBegin('success', TType.BOOL, 0)
-      oprot.writeBool(self.success)
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    if self.clix is not None:
+      oprot.writeFieldBegin('clix', TType.STRUCT, 1)
+      self.clix.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1353,34 +4330,25 @@ class host_remove_result:
   def __ne__(self, other):
     return not (self == other)
 
-class project_add_args:
+class watch_args:
   """
   Attributes:
-   - name
-   - nfsserver
-   - rootpath
-   - kernel
-   - initrd
-   - params
+   - since_version
+   - timeout_ms
+   - filter
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'name', None, None, ), # 1
-    (2, TType.STRING, 'nfsserver', None, None, ), # 2
-    (3, TType.STRING, 'rootpath', None, None, ), # 3
-    (4, TType.STRING, 'kernel', None, None, ), # 4
-    (5, TType.STRING, 'initrd', None, None, ), # 5
-    (6, TType.STRING, 'params', None, None, ), # 6
+    (1, TType.I64, 'since_version', None, None, ), # 1
+    (2, TType.I32, 'timeout_ms', None, None, ), # 2
+    (3, TType.STRUCT, 'filter', (ChangeFilter, ChangeFilter.thrift_spec), None, ), # 3
   )
 
-  def __init__(self, name=None, nfsserver=None, rootpath=None, kernel=None, initrd=None, params=None,):
-    self.name = name
-    self.nfsserver = nfsserver
-    self.rootpath = rootpath
-    self.kernel = kernel
-    self.initrd = initrd
-    self.params = params
+  def __init__(self, since_version=None, timeout_ms=None, filter=None,):
+    self.since_version = since_version
+    self.timeout_ms = timeout_ms
+    self.filter = filter
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1392,33 +4360,19 @@ class project_add_args:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.name = iprot.readString();
+        if ftype == TType.I64:
+          self.since_version = iprot.readI64();
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.STRING:
-          self.nfsserver = iprot.readString();
+        if ftype == TType.I32:
+          self.timeout_ms = iprot.readI32();
         else:
           iprot.skip(ftype)
       elif fid == 3:
-        if ftype == TType.STRING:
-          self.rootpath = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 4:
-        if ftype == TType.STRING:
-          self.kernel = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 5:
-        if ftype == TType.STRING:
-          self.initrd = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 6:
-        if ftype == TType.STRING:
-          self.params = iprot.readString();
+        if ftype == TType.STRUCT:
+          self.filter = ChangeFilter()
+          self.filter.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -1430,45 +4384,25 @@ class project_add_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('project_add_args')
-    if self.name is not None:
-      oprot.writeFieldBegin('name', TType.STRING, 1)
-      oprot.writeString(self.name)
-      oprot.writeFieldEnd()
-    if self.nfsserver is not None:
-      oprot.writeFieldBegin('nfsserver', TType.STRING, 2)
-      oprot.writeString(self.nfsserver)
-      oprot.writeFieldEnd()
-    if self.rootpath is not None:
-      oprot.writeFieldBegin('rootpath', TType.STRING, 3)
-      oprot.writeString(self.rootpath)
+    oprot.writeStructBegin('watch_args')
+    if self.since_version is not None:
+      oprot.writeFieldBegin('since_version', TType.I64, 1)
+      oprot.writeI64(self.since_version)
       oprot.writeFieldEnd()
-    if self.kernel is not None:
-      oprot.writeFieldBegin('kernel', TType.STRING, 4)
-      oprot.writeString(self.kernel)
-      oprot.writeFieldEnd()
-    if self.initrd is not None:
-      oprot.writeFieldBegin('initrd', TType.STRING, 5)
-      oprot.writeString(self.initrd)
+    if self.timeout_ms is not None:
+      oprot.writeFieldBegin('timeout_ms', TType.I32, 2)
+      oprot.writeI32(self.timeout_ms)
       oprot.writeFieldEnd()
-    if self.params is not None:
-      oprot.writeFieldBegin('params', TType.STRING, 6)
-      oprot.writeString(self.params)
+    if self.filter is not None:
+      oprot.writeFieldBegin('filter', TType.STRUCT, 3)
+      self.filter.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.name is None:
-      raise TProtocol.TProtocolException(message='Required field name is unset!')
-    if self.nfsserver is None:
-      raise TProtocol.TProtocolException(message='Required field nfsserver is unset!')
-    if self.rootpath is None:
-      raise TProtocol.TProtocolException(message='Required field rootpath is unset!')
-    if self.kernel is None:
-      raise TProtocol.TProtocolException(message='Required field kernel is unset!')
-    if self.initrd is None:
-      raise TProtocol.TProtocolException(message='Required field initrd is unset!')
+    if self.since_version is None:
+      raise TProtocol.TProtocolException(message='Required field since_version is unset!')
     return
 
 
@@ -1483,14 +4417,14 @@ class project_add_args:
   def __ne__(self, other):
     return not (self == other)
 
-class project_add_result:
+class watch_result:
   """
   Attributes:
    - success
   """
 
   thrift_spec = (
-    (0, TType.BOOL, 'success', None, None, ), # 0
+    (0, TType.STRUCT, 'success', (ChangesPage, ChangesPage.thrift_spec), None, ), # 0
   )
 
   def __init__(self, success=None,):
@@ -1506,8 +4440,9 @@ class project_add_result:
       if ftype == TType.STOP:
         break
       if fid == 0:
-        if ftype == TType.BOOL:
-          self.success = iprot.readBool();
+        if ftype == TType.STRUCT:
+          self.success = ChangesPage()
+          self.success.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -1519,10 +4454,10 @@ class project_add_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('project_add_result')
+    oprot.writeStructBegin('watch_result')
     if self.success is not None:
-      oprot.writeFieldBegin('success', TType.BOOL, 0)
-      oprot.writeBool(self.success)
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1542,19 +4477,19 @@ class project_add_result:
   def __ne__(self, other):
     return not (self == other)
 
-class project_remove_args:
+class get_tags_args:
   """
   Attributes:
-   - project
+   - host
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'project', None, None, ), # 1
+    (1, TType.STRING, 'host', None, None, ), # 1
   )
 
-  def __init__(self, project=None,):
-    self.project = project
+  def __init__(self, host=None,):
+    self.host = host
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1567,7 +4502,7 @@ class project_remove_args:
         break
       if fid == 1:
         if ftype == TType.STRING:
-          self.project = iprot.readString();
+          self.host = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -1579,17 +4514,17 @@ class project_remove_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('project_remove_args')
-    if self.project is not None:
-      oprot.writeFieldBegin('project', TType.STRING, 1)
-      oprot.writeString(self.project)
+    oprot.writeStructBegin('get_tags_args')
+    if self.host is not None:
+      oprot.writeFieldBegin('host', TType.STRING, 1)
+      oprot.writeString(self.host)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.project is None:
-      raise TProtocol.TProtocolException(message='Required field project is unset!')
+    if self.host is None:
+      raise TProtocol.TProtocolException(message='Required field host is unset!')
     return
 
 
@@ -1604,18 +4539,21 @@ class project_remove_args:
   def __ne__(self, other):
     return not (self == other)
 
-class project_remove_result:
+class get_tags_result:
   """
   Attributes:
    - success
+   - hostx
   """
 
   thrift_spec = (
-    (0, TType.BOOL, 'success', None, None, ), # 0
+    (0, TType.LIST, 'success', (TType.STRING,None), None, ), # 0
+    (1, TType.STRUCT, 'hostx', (BadHostException, BadHostException.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, success=None,):
+  def __init__(self, success=None, hostx=None,):
     self.success = success
+    self.hostx = hostx
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1627,8 +4565,19 @@ class project_remove_result:
       if ftype == TType.STOP:
         break
       if fid == 0:
-        if ftype == TType.BOOL:
-          self.success = iprot.readBool();
+        if ftype == TType.LIST:
+          self.success = []
+          (_etype148, _size145) = iprot.readListBegin()
+          for _i149 in xrange(_size145):
+            _elem150 = iprot.readString();
+            self.success.append(_elem150)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.hostx = BadHostException()
+          self.hostx.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -1640,10 +4589,17 @@ class project_remove_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('project_remove_result')
+    oprot.writeStructBegin('get_tags_result')
     if self.success is not None:
-      oprot.writeFieldBegin('success', TType.BOOL, 0)
-      oprot.writeBool(self.success)
+      oprot.writeFieldBegin('success', TType.LIST, 0)
+      oprot.writeListBegin(TType.STRING, len(self.success))
+      for iter151 in self.success:
+        oprot.writeString(iter151)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.hostx is not None:
+      oprot.writeFieldBegin('hostx', TType.STRUCT, 1)
+      self.hostx.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1663,22 +4619,28 @@ class project_remove_result:
   def __ne__(self, other):
     return not (self == other)
 
-class user_add_args:
+class get_hosts_page_args:
   """
   Attributes:
-   - username
-   - fullname
+   - filter
+   - cursor
+   - limit
+   - fields
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'username', None, None, ), # 1
-    (2, TType.STRING, 'fullname', None, None, ), # 2
+    (1, TType.STRUCT, 'filter', (HostFilter, HostFilter.thrift_spec), None, ), # 1
+    (2, TType.STRING, 'cursor', None, None, ), # 2
+    (3, TType.I32, 'limit', None, None, ), # 3
+    (4, TType.LIST, 'fields', (TType.STRING,None), None, ), # 4
   )
 
-  def __init__(self, username=None, fullname=None,):
-    self.username = username
-    self.fullname = fullname
+  def __init__(self, filter=None, cursor=None, limit=None, fields=None,):
+    self.filter = filter
+    self.cursor = cursor
+    self.limit = limit
+    self.fields = fields
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1690,13 +4652,29 @@ class user_add_args:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.username = iprot.readString();
+        if ftype == TType.STRUCT:
+          self.filter = HostFilter()
+          self.filter.read(iprot)
         else:
           iprot.skip(ftype)
       elif fid == 2:
         if ftype == TType.STRING:
-          self.fullname = iprot.readString();
+          self.cursor = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32:
+          self.limit = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.LIST:
+          self.fields = []
+          (_etype155, _size152) = iprot.readListBegin()
+          for _i156 in xrange(_size152):
+            _elem157 = iprot.readString();
+            self.fields.append(_elem157)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       else:
@@ -1706,25 +4684,32 @@ class user_add_args:
 
   def write(self, oprot):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
-      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
-      return
-    oprot.writeStructBegin('user_add_args')
-    if self.username is not None:
-      oprot.writeFieldBegin('username', TType.STRING, 1)
-      oprot.writeString(self.username)
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_hosts_page_args')
+    if self.filter is not None:
+      oprot.writeFieldBegin('filter', TType.STRUCT, 1)
+      self.filter.write(oprot)
       oprot.writeFieldEnd()
-    if self.fullname is not None:
-      oprot.writeFieldBegin('fullname', TType.STRING, 2)
-      oprot.writeString(self.fullname)
+    if self.cursor is not None:
+      oprot.writeFieldBegin('cursor', TType.STRING, 2)
+      oprot.writeString(self.cursor)
+      oprot.writeFieldEnd()
+    if self.limit is not None:
+      oprot.writeFieldBegin('limit', TType.I32, 3)
+      oprot.writeI32(self.limit)
+      oprot.writeFieldEnd()
+    if self.fields is not None:
+      oprot.writeFieldBegin('fields', TType.LIST, 4)
+      oprot.writeListBegin(TType.STRING, len(self.fields))
+      for iter158 in self.fields:
+        oprot.writeString(iter158)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.username is None:
-      raise TProtocol.TProtocolException(message='Required field username is unset!')
-    if self.fullname is None:
-      raise TProtocol.TProtocolException(message='Required field fullname is unset!')
     return
 
 
@@ -1739,18 +4724,21 @@ class user_add_args:
   def __ne__(self, other):
     return not (self == other)
 
-class user_add_result:
+class get_hosts_page_result:
   """
   Attributes:
    - success
+   - clix
   """
 
   thrift_spec = (
-    (0, TType.BOOL, 'success', None, None, ), # 0
+    (0, TType.STRUCT, 'success', (HostsPage, HostsPage.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'clix', (ClientError, ClientError.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, success=None,):
+  def __init__(self, success=None, clix=None,):
     self.success = success
+    self.clix = clix
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1762,8 +4750,15 @@ class user_add_result:
       if ftype == TType.STOP:
         break
       if fid == 0:
-        if ftype == TType.BOOL:
-          self.success = iprot.readBool();
+        if ftype == TType.STRUCT:
+          self.success = HostsPage()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.clix = ClientError()
+          self.clix.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -1775,10 +4770,14 @@ class user_add_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('user_add_result')
+    oprot.writeStructBegin('get_hosts_page_result')
     if self.success is not None:
-      oprot.writeFieldBegin('success', TType.BOOL, 0)
-      oprot.writeBool(self.success)
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    if self.clix is not None:
+      oprot.writeFieldBegin('clix', TType.STRUCT, 1)
+      self.clix.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1798,18 +4797,24 @@ class user_add_result:
   def __ne__(self, other):
     return not (self == other)
 
-class user_remove_args:
+class host_assign_args:
   """
   Attributes:
+   - host
+   - project
    - user
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'user', None, None, ), # 1
+    (1, TType.STRING, 'host', None, None, ), # 1
+    (2, TType.STRING, 'project', None, None, ), # 2
+    (3, TType.STRING, 'user', None, None, ), # 3
   )
 
-  def __init__(self, user=None,):
+  def __init__(self, host=None, project=None, user=None,):
+    self.host = host
+    self.project = project
     self.user = user
 
   def read(self, iprot):
@@ -1822,6 +4827,16 @@ class user_remove_args:
       if ftype == TType.STOP:
         break
       if fid == 1:
+        if ftype == TType.STRING:
+          self.host = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.project = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
         if ftype == TType.STRING:
           self.user = iprot.readString();
         else:
@@ -1835,17 +4850,27 @@ class user_remove_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('user_remove_args')
+    oprot.writeStructBegin('host_assign_args')
+    if self.host is not None:
+      oprot.writeFieldBegin('host', TType.STRING, 1)
+      oprot.writeString(self.host)
+      oprot.writeFieldEnd()
+    if self.project is not None:
+      oprot.writeFieldBegin('project', TType.STRING, 2)
+      oprot.writeString(self.project)
+      oprot.writeFieldEnd()
     if self.user is not None:
-      oprot.writeFieldBegin('user', TType.STRING, 1)
+      oprot.writeFieldBegin('user', TType.STRING, 3)
       oprot.writeString(self.user)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.user is None:
-      raise TProtocol.TProtocolException(message='Required field user is unset!')
+    if self.host is None:
+      raise TProtocol.TProtocolException(message='Required field host is unset!')
+    if self.project is None:
+      raise TProtocol.TProtocolException(message='Required field project is unset!')
     return
 
 
@@ -1860,18 +4885,25 @@ class user_remove_args:
   def __ne__(self, other):
     return not (self == other)
 
-class user_remove_result:
+class host_assign_result:
   """
   Attributes:
-   - success
+   - hostx
+   - projx
+   - userx
   """
 
   thrift_spec = (
-    (0, TType.BOOL, 'success', None, None, ), # 0
+    None, # 0
+    (1, TType.STRUCT, 'hostx', (BadHostException, BadHostException.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'projx', (BadProjectException, BadProjectException.thrift_spec), None, ), # 2
+    (3, TType.STRUCT, 'userx', (BadUserException, BadUserException.thrift_spec), None, ), # 3
   )
 
-  def __init__(self, success=None,):
-    self.success = success
+  def __init__(self, hostx=None, projx=None, userx=None,):
+    self.hostx = hostx
+    self.projx = projx
+    self.userx = userx
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1882,9 +4914,22 @@ class user_remove_result:
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
-      if fid == 0:
-        if ftype == TType.BOOL:
-          self.success = iprot.readBool();
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.hostx = BadHostException()
+          self.hostx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.projx = BadProjectException()
+          self.projx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRUCT:
+          self.userx = BadUserException()
+          self.userx.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -1896,10 +4941,18 @@ class user_remove_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('user_remove_result')
-    if self.success is not None:
-      oprot.writeFieldBegin('success', TType.BOOL, 0)
-      oprot.writeBool(self.success)
+    oprot.writeStructBegin('host_assign_result')
+    if self.hostx is not None:
+      oprot.writeFieldBegin('hostx', TType.STRUCT, 1)
+      self.hostx.write(oprot)
+      oprot.writeFieldEnd()
+    if self.projx is not None:
+      oprot.writeFieldBegin('projx', TType.STRUCT, 2)
+      self.projx.write(oprot)
+      oprot.writeFieldEnd()
+    if self.userx is not None:
+      oprot.writeFieldBegin('userx', TType.STRUCT, 3)
+      self.userx.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1919,11 +4972,29 @@ class user_remove_result:
   def __ne__(self, other):
     return not (self == other)
 
-class get_projects_args:
+class host_allocate_args:
+  """
+  Attributes:
+   - project
+   - count
+   - constraints
+   - user
+  """
 
   thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'project', None, None, ), # 1
+    (2, TType.I32, 'count', None, None, ), # 2
+    (3, TType.STRING, 'constraints', None, None, ), # 3
+    (4, TType.STRING, 'user', None, None, ), # 4
   )
 
+  def __init__(self, project=None, count=None, constraints=None, user=None,):
+    self.project = project
+    self.count = count
+    self.constraints = constraints
+    self.user = user
+
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
       fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
@@ -1933,6 +5004,26 @@ class get_projects_args:
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.project = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.count = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.constraints = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRING:
+          self.user = iprot.readString();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -1942,11 +5033,31 @@ class get_projects_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_projects_args')
+    oprot.writeStructBegin('host_allocate_args')
+    if self.project is not None:
+      oprot.writeFieldBegin('project', TType.STRING, 1)
+      oprot.writeString(self.project)
+      oprot.writeFieldEnd()
+    if self.count is not None:
+      oprot.writeFieldBegin('count', TType.I32, 2)
+      oprot.writeI32(self.count)
+      oprot.writeFieldEnd()
+    if self.constraints is not None:
+      oprot.writeFieldBegin('constraints', TType.STRING, 3)
+      oprot.writeString(self.constraints)
+      oprot.writeFieldEnd()
+    if self.user is not None:
+      oprot.writeFieldBegin('user', TType.STRING, 4)
+      oprot.writeString(self.user)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
+    if self.project is None:
+      raise TProtocol.TProtocolException(message='Required field project is unset!')
+    if self.count is None:
+      raise TProtocol.TProtocolException(message='Required field count is unset!')
     return
 
 
@@ -1961,18 +5072,27 @@ class get_projects_args:
   def __ne__(self, other):
     return not (self == other)
 
-class get_projects_result:
+class host_allocate_result:
   """
   Attributes:
    - success
+   - clix
+   - projx
+   - availx
   """
 
   thrift_spec = (
-    (0, TType.LIST, 'success', (TType.STRING,None), None, ), # 0
+    (0, TType.LIST, 'success', (TType.STRUCT,(Host, Host.thrift_spec)), None, ), # 0
+    (1, TType.STRUCT, 'clix', (ClientError, ClientError.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'projx', (BadProjectException, BadProjectException.thrift_spec), None, ), # 2
+    (3, TType.STRUCT, 'availx', (NotEnoughHostsException, NotEnoughHostsException.thrift_spec), None, ), # 3
   )
 
-  def __init__(self, success=None,):
+  def __init__(self, success=None, clix=None, projx=None, availx=None,):
     self.success = success
+    self.clix = clix
+    self.projx = projx
+    self.availx = availx
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1986,13 +5106,32 @@ class get_projects_result:
       if fid == 0:
         if ftype == TType.LIST:
           self.success = []
-          (_etype12, _size9) = iprot.readListBegin()
-          for _i13 in xrange(_size9):
-            _elem14 = iprot.readString();
-            self.success.append(_elem14)
+          (_etype162, _size159) = iprot.readListBegin()
+          for _i163 in xrange(_size159):
+            _elem164 = Host()
+            _elem164.read(iprot)
+            self.success.append(_elem164)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.clix = ClientError()
+          self.clix.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.projx = BadProjectException()
+          self.projx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRUCT:
+          self.availx = NotEnoughHostsException()
+          self.availx.read(iprot)
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -2002,14 +5141,26 @@ class get_projects_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_projects_result')
+    oprot.writeStructBegin('host_allocate_result')
     if self.success is not None:
       oprot.writeFieldBegin('success', TType.LIST, 0)
-      oprot.writeListBegin(TType.STRING, len(self.success))
-      for iter15 in self.success:
-        oprot.writeString(iter15)
+      oprot.writeListBegin(TType.STRUCT, len(self.success))
+      for iter165 in self.success:
+        iter165.write(oprot)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
+    if self.clix is not None:
+      oprot.writeFieldBegin('clix', TType.STRUCT, 1)
+      self.clix.write(oprot)
+      oprot.writeFieldEnd()
+    if self.projx is not None:
+      oprot.writeFieldBegin('projx', TType.STRUCT, 2)
+      self.projx.write(oprot)
+      oprot.writeFieldEnd()
+    if self.availx is not None:
+      oprot.writeFieldBegin('availx', TType.STRUCT, 3)
+      self.availx.write(oprot)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -2028,22 +5179,19 @@ class get_projects_result:
   def __ne__(self, other):
     return not (self == other)
 
-class get_hosts_args:
+class host_assign_batch_args:
   """
   Attributes:
-   - project
-   - tag
+   - assignments
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'project', None, None, ), # 1
-    (2, TType.STRING, 'tag', None, None, ), # 2
+    (1, TType.LIST, 'assignments', (TType.STRUCT,(Assignment, Assignment.thrift_spec)), None, ), # 1
   )
 
-  def __init__(self, project=None, tag=None,):
-    self.project = project
-    self.tag = tag
+  def __init__(self, assignments=None,):
+    self.assignments = assignments
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2055,13 +5203,14 @@ class get_hosts_args:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.project = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRING:
-          self.tag = iprot.readString();
+        if ftype == TType.LIST:
+          self.assignments = []
+          (_etype169, _size166) = iprot.readListBegin()
+          for _i170 in xrange(_size166):
+            _elem171 = Assignment()
+            _elem171.read(iprot)
+            self.assignments.append(_elem171)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       else:
@@ -2073,19 +5222,20 @@ class get_hosts_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_hosts_args')
-    if self.project is not None:
-      oprot.writeFieldBegin('project', TType.STRING, 1)
-      oprot.writeString(self.project)
-      oprot.writeFieldEnd()
-    if self.tag is not None:
-      oprot.writeFieldBegin('tag', TType.STRING, 2)
-      oprot.writeString(self.tag)
+    oprot.writeStructBegin('host_assign_batch_args')
+    if self.assignments is not None:
+      oprot.writeFieldBegin('assignments', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRUCT, len(self.assignments))
+      for iter172 in self.assignments:
+        iter172.write(oprot)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
+    if self.assignments is None:
+      raise TProtocol.TProtocolException(message='Required field assignments is unset!')
     return
 
 
@@ -2100,24 +5250,18 @@ class get_hosts_args:
   def __ne__(self, other):
     return not (self == other)
 
-class get_hosts_result:
+class host_assign_batch_result:
   """
   Attributes:
    - success
-   - clix
-   - prjx
   """
 
   thrift_spec = (
-    (0, TType.LIST, 'success', (TType.STRUCT,(Host, Host.thrift_spec)), None, ), # 0
-    (1, TType.STRUCT, 'clix', (ClientError, ClientError.thrift_spec), None, ), # 1
-    (2, TType.STRUCT, 'prjx', (BadProjectException, BadProjectException.thrift_spec), None, ), # 2
+    (0, TType.LIST, 'success', (TType.BOOL,None), None, ), # 0
   )
 
-  def __init__(self, success=None, clix=None, prjx=None,):
+  def __init__(self, success=None,):
     self.success = success
-    self.clix = clix
-    self.prjx = prjx
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2130,25 +5274,12 @@ class get_hosts_result:
         break
       if fid == 0:
         if ftype == TType.LIST:
-          self.success = []
-          (_etype19, _size16) = iprot.readListBegin()
-          for _i20 in xrange(_size16):
-            _elem21 = Host()
-            _elem21.read(iprot)
-            self.success.append(_elem21)
-          iprot.readListEnd()
-        else:
-          iprot.skip(ftype)
-      elif fid == 1:
-        if ftype == TType.STRUCT:
-          self.clix = ClientError()
-          self.clix.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRUCT:
-          self.prjx = BadProjectException()
-          self.prjx.read(iprot)
+          self.success = []
+          (_etype176, _size173) = iprot.readListBegin()
+          for _i177 in xrange(_size173):
+            _elem178 = iprot.readBool();
+            self.success.append(_elem178)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       else:
@@ -2160,22 +5291,14 @@ class get_hosts_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_hosts_result')
+    oprot.writeStructBegin('host_assign_batch_result')
     if self.success is not None:
       oprot.writeFieldBegin('success', TType.LIST, 0)
-      oprot.writeListBegin(TType.STRUCT, len(self.success))
-      for iter22 in self.success:
-        iter22.write(oprot)
+      oprot.writeListBegin(TType.BOOL, len(self.success))
+      for iter179 in self.success:
+        oprot.writeBool(iter179)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
-    if self.clix is not None:
-      oprot.writeFieldBegin('clix', TType.STRUCT, 1)
-      self.clix.write(oprot)
-      oprot.writeFieldEnd()
-    if self.prjx is not None:
-      oprot.writeFieldBegin('prjx', TType.STRUCT, 2)
-      self.prjx.write(oprot)
-      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -2194,7 +5317,7 @@ class get_hosts_result:
   def __ne__(self, other):
     return not (self == other)
 
-class get_tags_args:
+class host_release_args:
   """
   Attributes:
    - host
@@ -2231,7 +5354,7 @@ class get_tags_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_tags_args')
+    oprot.writeStructBegin('host_release_args')
     if self.host is not None:
       oprot.writeFieldBegin('host', TType.STRING, 1)
       oprot.writeString(self.host)
@@ -2256,20 +5379,18 @@ class get_tags_args:
   def __ne__(self, other):
     return not (self == other)
 
-class get_tags_result:
+class host_release_result:
   """
   Attributes:
-   - success
    - hostx
   """
 
   thrift_spec = (
-    (0, TType.LIST, 'success', (TType.STRING,None), None, ), # 0
+    None, # 0
     (1, TType.STRUCT, 'hostx', (BadHostException, BadHostException.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, success=None, hostx=None,):
-    self.success = success
+  def __init__(self, hostx=None,):
     self.hostx = hostx
 
   def read(self, iprot):
@@ -2281,17 +5402,7 @@ class get_tags_result:
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
-      if fid == 0:
-        if ftype == TType.LIST:
-          self.success = []
-          (_etype26, _size23) = iprot.readListBegin()
-          for _i27 in xrange(_size23):
-            _elem28 = iprot.readString();
-            self.success.append(_elem28)
-          iprot.readListEnd()
-        else:
-          iprot.skip(ftype)
-      elif fid == 1:
+      if fid == 1:
         if ftype == TType.STRUCT:
           self.hostx = BadHostException()
           self.hostx.read(iprot)
@@ -2306,14 +5417,7 @@ class get_tags_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_tags_result')
-    if self.success is not None:
-      oprot.writeFieldBegin('success', TType.LIST, 0)
-      oprot.writeListBegin(TType.STRING, len(self.success))
-      for iter29 in self.success:
-        oprot.writeString(iter29)
-      oprot.writeListEnd()
-      oprot.writeFieldEnd()
+    oprot.writeStructBegin('host_release_result')
     if self.hostx is not None:
       oprot.writeFieldBegin('hostx', TType.STRUCT, 1)
       self.hostx.write(oprot)
@@ -2336,25 +5440,22 @@ class get_tags_result:
   def __ne__(self, other):
     return not (self == other)
 
-class host_assign_args:
+class tag_add_args:
   """
   Attributes:
    - host
-   - project
-   - user
+   - tag
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRING, 'host', None, None, ), # 1
-    (2, TType.STRING, 'project', None, None, ), # 2
-    (3, TType.STRING, 'user', None, None, ), # 3
+    (2, TType.STRING, 'tag', None, None, ), # 2
   )
 
-  def __init__(self, host=None, project=None, user=None,):
+  def __init__(self, host=None, tag=None,):
     self.host = host
-    self.project = project
-    self.user = user
+    self.tag = tag
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2372,12 +5473,7 @@ class host_assign_args:
           iprot.skip(ftype)
       elif fid == 2:
         if ftype == TType.STRING:
-          self.project = iprot.readString();
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.STRING:
-          self.user = iprot.readString();
+          self.tag = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -2389,18 +5485,14 @@ class host_assign_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('host_assign_args')
+    oprot.writeStructBegin('tag_add_args')
     if self.host is not None:
       oprot.writeFieldBegin('host', TType.STRING, 1)
       oprot.writeString(self.host)
       oprot.writeFieldEnd()
-    if self.project is not None:
-      oprot.writeFieldBegin('project', TType.STRING, 2)
-      oprot.writeString(self.project)
-      oprot.writeFieldEnd()
-    if self.user is not None:
-      oprot.writeFieldBegin('user', TType.STRING, 3)
-      oprot.writeString(self.user)
+    if self.tag is not None:
+      oprot.writeFieldBegin('tag', TType.STRING, 2)
+      oprot.writeString(self.tag)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -2408,8 +5500,8 @@ class host_assign_args:
   def validate(self):
     if self.host is None:
       raise TProtocol.TProtocolException(message='Required field host is unset!')
-    if self.project is None:
-      raise TProtocol.TProtocolException(message='Required field project is unset!')
+    if self.tag is None:
+      raise TProtocol.TProtocolException(message='Required field tag is unset!')
     return
 
 
@@ -2424,25 +5516,19 @@ class host_assign_args:
   def __ne__(self, other):
     return not (self == other)
 
-class host_assign_result:
+class tag_add_result:
   """
   Attributes:
    - hostx
-   - projx
-   - userx
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRUCT, 'hostx', (BadHostException, BadHostException.thrift_spec), None, ), # 1
-    (2, TType.STRUCT, 'projx', (BadProjectException, BadProjectException.thrift_spec), None, ), # 2
-    (3, TType.STRUCT, 'userx', (BadUserException, BadUserException.thrift_spec), None, ), # 3
   )
 
-  def __init__(self, hostx=None, projx=None, userx=None,):
+  def __init__(self, hostx=None,):
     self.hostx = hostx
-    self.projx = projx
-    self.userx = userx
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2459,18 +5545,6 @@ class host_assign_result:
           self.hostx.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRUCT:
-          self.projx = BadProjectException()
-          self.projx.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.STRUCT:
-          self.userx = BadUserException()
-          self.userx.read(iprot)
-        else:
-          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -2480,19 +5554,11 @@ class host_assign_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('host_assign_result')
+    oprot.writeStructBegin('tag_add_result')
     if self.hostx is not None:
       oprot.writeFieldBegin('hostx', TType.STRUCT, 1)
       self.hostx.write(oprot)
       oprot.writeFieldEnd()
-    if self.projx is not None:
-      oprot.writeFieldBegin('projx', TType.STRUCT, 2)
-      self.projx.write(oprot)
-      oprot.writeFieldEnd()
-    if self.userx is not None:
-      oprot.writeFieldBegin('userx', TType.STRUCT, 3)
-      self.userx.write(oprot)
-      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -2511,19 +5577,19 @@ class host_assign_result:
   def __ne__(self, other):
     return not (self == other)
 
-class host_release_args:
+class tag_add_batch_args:
   """
   Attributes:
-   - host
+   - tags
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'host', None, None, ), # 1
+    (1, TType.LIST, 'tags', (TType.STRUCT,(HostTag, HostTag.thrift_spec)), None, ), # 1
   )
 
-  def __init__(self, host=None,):
-    self.host = host
+  def __init__(self, tags=None,):
+    self.tags = tags
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2535,8 +5601,14 @@ class host_release_args:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.host = iprot.readString();
+        if ftype == TType.LIST:
+          self.tags = []
+          (_etype183, _size180) = iprot.readListBegin()
+          for _i184 in xrange(_size180):
+            _elem185 = HostTag()
+            _elem185.read(iprot)
+            self.tags.append(_elem185)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       else:
@@ -2548,17 +5620,20 @@ class host_release_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('host_release_args')
-    if self.host is not None:
-      oprot.writeFieldBegin('host', TType.STRING, 1)
-      oprot.writeString(self.host)
+    oprot.writeStructBegin('tag_add_batch_args')
+    if self.tags is not None:
+      oprot.writeFieldBegin('tags', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRUCT, len(self.tags))
+      for iter186 in self.tags:
+        iter186.write(oprot)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.host is None:
-      raise TProtocol.TProtocolException(message='Required field host is unset!')
+    if self.tags is None:
+      raise TProtocol.TProtocolException(message='Required field tags is unset!')
     return
 
 
@@ -2573,19 +5648,18 @@ class host_release_args:
   def __ne__(self, other):
     return not (self == other)
 
-class host_release_result:
+class tag_add_batch_result:
   """
   Attributes:
-   - hostx
+   - success
   """
 
   thrift_spec = (
-    None, # 0
-    (1, TType.STRUCT, 'hostx', (BadHostException, BadHostException.thrift_spec), None, ), # 1
+    (0, TType.LIST, 'success', (TType.BOOL,None), None, ), # 0
   )
 
-  def __init__(self, hostx=None,):
-    self.hostx = hostx
+  def __init__(self, success=None,):
+    self.success = success
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2596,10 +5670,14 @@ class host_release_result:
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
-      if fid == 1:
-        if ftype == TType.STRUCT:
-          self.hostx = BadHostException()
-          self.hostx.read(iprot)
+      if fid == 0:
+        if ftype == TType.LIST:
+          self.success = []
+          (_etype190, _size187) = iprot.readListBegin()
+          for _i191 in xrange(_size187):
+            _elem192 = iprot.readBool();
+            self.success.append(_elem192)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       else:
@@ -2611,10 +5689,13 @@ class host_release_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('host_release_result')
-    if self.hostx is not None:
-      oprot.writeFieldBegin('hostx', TType.STRUCT, 1)
-      self.hostx.write(oprot)
+    oprot.writeStructBegin('tag_add_batch_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.LIST, 0)
+      oprot.writeListBegin(TType.BOOL, len(self.success))
+      for iter193 in self.success:
+        oprot.writeBool(iter193)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -2634,22 +5715,19 @@ class host_release_result:
   def __ne__(self, other):
     return not (self == other)
 
-class tag_add_args:
+class tag_removeAll_args:
   """
   Attributes:
    - host
-   - tag
   """
 
   thrift_spec = (
     None, # 0
     (1, TType.STRING, 'host', None, None, ), # 1
-    (2, TType.STRING, 'tag', None, None, ), # 2
   )
 
-  def __init__(self, host=None, tag=None,):
+  def __init__(self, host=None,):
     self.host = host
-    self.tag = tag
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2665,11 +5743,6 @@ class tag_add_args:
           self.host = iprot.readString();
         else:
           iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRING:
-          self.tag = iprot.readString();
-        else:
-          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -2679,23 +5752,17 @@ class tag_add_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('tag_add_args')
+    oprot.writeStructBegin('tag_removeAll_args')
     if self.host is not None:
       oprot.writeFieldBegin('host', TType.STRING, 1)
       oprot.writeString(self.host)
       oprot.writeFieldEnd()
-    if self.tag is not None:
-      oprot.writeFieldBegin('tag', TType.STRING, 2)
-      oprot.writeString(self.tag)
-      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
     if self.host is None:
       raise TProtocol.TProtocolException(message='Required field host is unset!')
-    if self.tag is None:
-      raise TProtocol.TProtocolException(message='Required field tag is unset!')
     return
 
 
@@ -2710,7 +5777,7 @@ class tag_add_args:
   def __ne__(self, other):
     return not (self == other)
 
-class tag_add_result:
+class tag_removeAll_result:
   """
   Attributes:
    - hostx
@@ -2748,7 +5815,7 @@ class tag_add_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('tag_add_result')
+    oprot.writeStructBegin('tag_removeAll_result')
     if self.hostx is not None:
       oprot.writeFieldBegin('hostx', TType.STRUCT, 1)
       self.hostx.write(oprot)
@@ -2771,19 +5838,19 @@ class tag_add_result:
   def __ne__(self, other):
     return not (self == other)
 
-class tag_removeAll_args:
+class lookup_args:
   """
   Attributes:
-   - host
+   - macaddr
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'host', None, None, ), # 1
+    (1, TType.STRING, 'macaddr', None, None, ), # 1
   )
 
-  def __init__(self, host=None,):
-    self.host = host
+  def __init__(self, macaddr=None,):
+    self.macaddr = macaddr
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2796,7 +5863,7 @@ class tag_removeAll_args:
         break
       if fid == 1:
         if ftype == TType.STRING:
-          self.host = iprot.readString();
+          self.macaddr = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -2808,17 +5875,17 @@ class tag_removeAll_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('tag_removeAll_args')
-    if self.host is not None:
-      oprot.writeFieldBegin('host', TType.STRING, 1)
-      oprot.writeString(self.host)
+    oprot.writeStructBegin('lookup_args')
+    if self.macaddr is not None:
+      oprot.writeFieldBegin('macaddr', TType.STRING, 1)
+      oprot.writeString(self.macaddr)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.host is None:
-      raise TProtocol.TProtocolException(message='Required field host is unset!')
+    if self.macaddr is None:
+      raise TProtocol.TProtocolException(message='Required field macaddr is unset!')
     return
 
 
@@ -2833,18 +5900,20 @@ class tag_removeAll_args:
   def __ne__(self, other):
     return not (self == other)
 
-class tag_removeAll_result:
+class lookup_result:
   """
   Attributes:
+   - success
    - hostx
   """
 
   thrift_spec = (
-    None, # 0
+    (0, TType.STRUCT, 'success', (BootConfig, BootConfig.thrift_spec), None, ), # 0
     (1, TType.STRUCT, 'hostx', (BadHostException, BadHostException.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, hostx=None,):
+  def __init__(self, success=None, hostx=None,):
+    self.success = success
     self.hostx = hostx
 
   def read(self, iprot):
@@ -2856,7 +5925,13 @@ class tag_removeAll_result:
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
-      if fid == 1:
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = BootConfig()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
         if ftype == TType.STRUCT:
           self.hostx = BadHostException()
           self.hostx.read(iprot)
@@ -2871,7 +5946,11 @@ class tag_removeAll_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('tag_removeAll_result')
+    oprot.writeStructBegin('lookup_result')
+    if self.success is not None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
     if self.hostx is not None:
       oprot.writeFieldBegin('hostx', TType.STRUCT, 1)
       self.hostx.write(oprot)
@@ -2894,19 +5973,19 @@ class tag_removeAll_result:
   def __ne__(self, other):
     return not (self == other)
 
-class lookup_args:
+class lookup_batch_args:
   """
   Attributes:
-   - macaddr
+   - macaddrs
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'macaddr', None, None, ), # 1
+    (1, TType.LIST, 'macaddrs', (TType.STRING,None), None, ), # 1
   )
 
-  def __init__(self, macaddr=None,):
-    self.macaddr = macaddr
+  def __init__(self, macaddrs=None,):
+    self.macaddrs = macaddrs
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2918,8 +5997,13 @@ class lookup_args:
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.macaddr = iprot.readString();
+        if ftype == TType.LIST:
+          self.macaddrs = []
+          (_etype197, _size194) = iprot.readListBegin()
+          for _i198 in xrange(_size194):
+            _elem199 = iprot.readString();
+            self.macaddrs.append(_elem199)
+          iprot.readListEnd()
         else:
           iprot.skip(ftype)
       else:
@@ -2931,17 +6015,20 @@ class lookup_args:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('lookup_args')
-    if self.macaddr is not None:
-      oprot.writeFieldBegin('macaddr', TType.STRING, 1)
-      oprot.writeString(self.macaddr)
+    oprot.writeStructBegin('lookup_batch_args')
+    if self.macaddrs is not None:
+      oprot.writeFieldBegin('macaddrs', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRING, len(self.macaddrs))
+      for iter200 in self.macaddrs:
+        oprot.writeString(iter200)
+      oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.macaddr is None:
-      raise TProtocol.TProtocolException(message='Required field macaddr is unset!')
+    if self.macaddrs is None:
+      raise TProtocol.TProtocolException(message='Required field macaddrs is unset!')
     return
 
 
@@ -2956,21 +6043,18 @@ class lookup_args:
   def __ne__(self, other):
     return not (self == other)
 
-class lookup_result:
+class lookup_batch_result:
   """
   Attributes:
    - success
-   - hostx
   """
 
   thrift_spec = (
-    (0, TType.STRUCT, 'success', (BootConfig, BootConfig.thrift_spec), None, ), # 0
-    (1, TType.STRUCT, 'hostx', (BadHostException, BadHostException.thrift_spec), None, ), # 1
+    (0, TType.MAP, 'success', (TType.STRING,None,TType.STRUCT,(BootConfig, BootConfig.thrift_spec)), None, ), # 0
   )
 
-  def __init__(self, success=None, hostx=None,):
+  def __init__(self, success=None,):
     self.success = success
-    self.hostx = hostx
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2982,15 +6066,15 @@ class lookup_result:
       if ftype == TType.STOP:
         break
       if fid == 0:
-        if ftype == TType.STRUCT:
-          self.success = BootConfig()
-          self.success.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 1:
-        if ftype == TType.STRUCT:
-          self.hostx = BadHostException()
-          self.hostx.read(iprot)
+        if ftype == TType.MAP:
+          self.success = {}
+          (_ktype202, _vtype203, _size201 ) = iprot.readMapBegin() 
+          for _i205 in xrange(_size201):
+            _key206 = iprot.readString();
+            _val207 = BootConfig()
+            _val207.read(iprot)
+            self.success[_key206] = _val207
+          iprot.readMapEnd()
         else:
           iprot.skip(ftype)
       else:
@@ -3002,14 +6086,14 @@ class lookup_result:
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('lookup_result')
+    oprot.writeStructBegin('lookup_batch_result')
     if self.success is not None:
-      oprot.writeFieldBegin('success', TType.STRUCT, 0)
-      self.success.write(oprot)
-      oprot.writeFieldEnd()
-    if self.hostx is not None:
-      oprot.writeFieldBegin('hostx', TType.STRUCT, 1)
-      self.hostx.write(oprot)
+      oprot.writeFieldBegin('success', TType.MAP, 0)
+      oprot.writeMapBegin(TType.STRING, TType.STRUCT, len(self.success))
+      for kiter208,viter209 in self.success.items():
+        oprot.writeString(kiter208)
+        viter209.write(oprot)
+      oprot.writeMapEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -9,3 +9,11 @@
 from thrift.Thrift import TType, TMessageType, TException, TApplicationException
 from ttypes import *
 
+NAMES_ONLY = [
+  "name",
+]
+MAPPING_FIELDS = [
+  "name",
+  "assigned_project",
+  "tags",
+]
@@ -226,18 +226,6 @@ class Host:
   def validate(self):
     if self.name is None:
       raise TProtocol.TProtocolException(message='Required field name is unset!')
-    if self.status is None:
-      raise TProtocol.TProtocolException(message='Required field status is unset!')
-    if self.owner is None:
-      raise TProtocol.TProtocolException(message='Required field owner is unset!')
-    if self.assigned_project is None:
-      raise TProtocol.TProtocolException(message='Required field assigned_project is unset!')
-    if self.netboot_enabled is None:
-      raise TProtocol.TProtocolException(message='Required field netboot_enabled is unset!')
-    if self.macaddr is None:
-      raise TProtocol.TProtocolException(message='Required field macaddr is unset!')
-    if self.tags is None:
-      raise TProtocol.TProtocolException(message='Required field tags is unset!')
     return
 
 
@@ -588,19 +576,22 @@ class BootConfig:
   def __ne__(self, other):
     return not (self == other)
 
-class AuthenticationException(TException):
+class HostFilter:
   """
   Attributes:
-   - why
+   - project
+   - tag
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'why', None, None, ), # 1
+    (1, TType.STRING, 'project', None, None, ), # 1
+    (2, TType.STRING, 'tag', None, None, ), # 2
   )
 
-  def __init__(self, why=None,):
-    self.why = why
+  def __init__(self, project=None, tag=None,):
+    self.project = project
+    self.tag = tag
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -613,7 +604,12 @@ class AuthenticationException(TException):
         break
       if fid == 1:
         if ftype == TType.STRING:
-          self.why = iprot.readString();
+          self.project = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.tag = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -625,23 +621,22 @@ class AuthenticationException(TException):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('AuthenticationException')
-    if self.why is not None:
-      oprot.writeFieldBegin('why', TType.STRING, 1)
-      oprot.writeString(self.why)
+    oprot.writeStructBegin('HostFilter')
+    if self.project is not None:
+      oprot.writeFieldBegin('project', TType.STRING, 1)
+      oprot.writeString(self.project)
+      oprot.writeFieldEnd()
+    if self.tag is not None:
+      oprot.writeFieldBegin('tag', TType.STRING, 2)
+      oprot.writeString(self.tag)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
-    if self.why is None:
-      raise TProtocol.TProtocolException(message='Required field why is unset!')
     return
 
 
-  def __str__(self):
-    return repr(self)
-
   def __repr__(self):
     L = ['%s=%r' % (key, value)
       for key, value in self.__dict__.iteritems()]
@@ -653,19 +648,22 @@ class AuthenticationException(TException):
   def __ne__(self, other):
     return not (self == other)
 
-class ClientError(TException):
+class HostsPage:
   """
   Attributes:
-   - why
+   - hosts
+   - cursor
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 'why', None, None, ), # 1
+    (1, TType.LIST, 'hosts', (TType.STRUCT,(Host, Host.thrift_spec)), None, ), # 1
+    (2, TType.STRING, 'cursor', None, None, ), # 2
   )
 
-  def __init__(self, why=None,):
-    self.why = why
+  def __init__(self, hosts=None, cursor=None,):
+    self.hosts = hosts
+    self.cursor = cursor
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -677,8 +675,19 @@ class ClientError(TException):
       if ftype == TType.STOP:
         break
       if fid == 1:
+        if ftype == TType.LIST:
+          self.hosts = []
+          (_etype12, _size9) = iprot.readListBegin()
+          for _i13 in xrange(_size9):
+            _elem14 = Host()
+            _elem14.read(iprot)
+            self.hosts.append(_elem14)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
         if ftype == TType.STRING:
-          self.why = iprot.readString();
+          self.cursor = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -690,21 +699,29 @@ class ClientError(TException):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('ClientError')
-    if self.why is not None:
-      oprot.writeFieldBegin('why', TType.STRING, 1)
-      oprot.writeString(self.why)
+    oprot.writeStructBegin('HostsPage')
+    if self.hosts is not None:
+      oprot.writeFieldBegin('hosts', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRUCT, len(self.hosts))
+      for iter15 in self.hosts:
+        iter15.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.cursor is not None:
+      oprot.writeFieldBegin('cursor', TType.STRING, 2)
+      oprot.writeString(self.cursor)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
+    if self.hosts is None:
+      raise TProtocol.TProtocolException(message='Required field hosts is unset!')
+    if self.cursor is None:
+      raise TProtocol.TProtocolException(message='Required field cursor is unset!')
     return
 
 
-  def __str__(self):
-    return repr(self)
-
   def __repr__(self):
     L = ['%s=%r' % (key, value)
       for key, value in self.__dict__.iteritems()]
@@ -716,11 +733,23 @@ class ClientError(TException):
   def __ne__(self, other):
     return not (self == other)
 
-class BadProjectException(TException):
+class HostSpec:
+  """
+  Attributes:
+   - host
+   - macaddr
+  """
 
   thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'host', None, None, ), # 1
+    (2, TType.STRING, 'macaddr', None, None, ), # 2
   )
 
+  def __init__(self, host=None, macaddr=None,):
+    self.host = host
+    self.macaddr = macaddr
+
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
       fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
@@ -730,6 +759,16 @@ class BadProjectException(TException):
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.host = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.macaddr = iprot.readString();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -739,16 +778,113 @@ class BadProjectException(TException):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('BadProjectException')
+    oprot.writeStructBegin('HostSpec')
+    if self.host is not None:
+      oprot.writeFieldBegin('host', TType.STRING, 1)
+      oprot.writeString(self.host)
+      oprot.writeFieldEnd()
+    if self.macaddr is not None:
+      oprot.writeFieldBegin('macaddr', TType.STRING, 2)
+      oprot.writeString(self.macaddr)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
+    if self.host is None:
+      raise TProtocol.TProtocolException(message='Required field host is unset!')
+    if self.macaddr is None:
+      raise TProtocol.TProtocolException(message='Required field macaddr is unset!')
     return
 
 
-  def __str__(self):
-    return repr(self)
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class Assignment:
+  """
+  Attributes:
+   - host
+   - project
+   - user
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'host', None, None, ), # 1
+    (2, TType.STRING, 'project', None, None, ), # 2
+    (3, TType.STRING, 'user', None, None, ), # 3
+  )
+
+  def __init__(self, host=None, project=None, user=None,):
+    self.host = host
+    self.project = project
+    self.user = user
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.host = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.project = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.user = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('Assignment')
+    if self.host is not None:
+      oprot.writeFieldBegin('host', TType.STRING, 1)
+      oprot.writeString(self.host)
+      oprot.writeFieldEnd()
+    if self.project is not None:
+      oprot.writeFieldBegin('project', TType.STRING, 2)
+      oprot.writeString(self.project)
+      oprot.writeFieldEnd()
+    if self.user is not None:
+      oprot.writeFieldBegin('user', TType.STRING, 3)
+      oprot.writeString(self.user)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.host is None:
+      raise TProtocol.TProtocolException(message='Required field host is unset!')
+    if self.project is None:
+      raise TProtocol.TProtocolException(message='Required field project is unset!')
+    return
+
 
   def __repr__(self):
     L = ['%s=%r' % (key, value)
@@ -761,11 +897,23 @@ class BadProjectException(TException):
   def __ne__(self, other):
     return not (self == other)
 
-class BadHostException(TException):
+class HostTag:
+  """
+  Attributes:
+   - host
+   - tag
+  """
 
   thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'host', None, None, ), # 1
+    (2, TType.STRING, 'tag', None, None, ), # 2
   )
 
+  def __init__(self, host=None, tag=None,):
+    self.host = host
+    self.tag = tag
+
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
       fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
@@ -775,6 +923,16 @@ class BadHostException(TException):
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.host = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.tag = iprot.readString();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -784,16 +942,108 @@ class BadHostException(TException):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('BadHostException')
+    oprot.writeStructBegin('HostTag')
+    if self.host is not None:
+      oprot.writeFieldBegin('host', TType.STRING, 1)
+      oprot.writeString(self.host)
+      oprot.writeFieldEnd()
+    if self.tag is not None:
+      oprot.writeFieldBegin('tag', TType.STRING, 2)
+      oprot.writeString(self.tag)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
   def validate(self):
+    if self.host is None:
+      raise TProtocol.TProtocolException(message='Required field host is unset!')
+    if self.tag is None:
+      raise TProtocol.TProtocolException(message='Required field tag is unset!')
     return
 
 
-  def __str__(self):
-    return repr(self)
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class HostsUpdate:
+  """
+  Attributes:
+   - generation
+   - hosts
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I64, 'generation', None, None, ), # 1
+    (2, TType.LIST, 'hosts', (TType.STRUCT,(Host, Host.thrift_spec)), None, ), # 2
+  )
+
+  def __init__(self, generation=None, hosts=None,):
+    self.generation = generation
+    self.hosts = hosts
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I64:
+          self.generation = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.hosts = []
+          (_etype19, _size16) = iprot.readListBegin()
+          for _i20 in xrange(_size16):
+            _elem21 = Host()
+            _elem21.read(iprot)
+            self.hosts.append(_elem21)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('HostsUpdate')
+    if self.generation is not None:
+      oprot.writeFieldBegin('generation', TType.I64, 1)
+      oprot.writeI64(self.generation)
+      oprot.writeFieldEnd()
+    if self.hosts is not None:
+      oprot.writeFieldBegin('hosts', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRUCT, len(self.hosts))
+      for iter22 in self.hosts:
+        iter22.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.generation is None:
+      raise TProtocol.TProtocolException(message='Required field generation is unset!')
+    return
+
 
   def __repr__(self):
     L = ['%s=%r' % (key, value)
@@ -806,11 +1056,29 @@ class BadHostException(TException):
   def __ne__(self, other):
     return not (self == other)
 
-class BadUserException(TException):
+class Change:
+  """
+  Attributes:
+   - version
+   - op
+   - name
+   - args
+  """
 
   thrift_spec = (
+    None, # 0
+    (1, TType.I64, 'version', None, None, ), # 1
+    (2, TType.STRING, 'op', None, None, ), # 2
+    (3, TType.STRING, 'name', None, None, ), # 3
+    (4, TType.MAP, 'args', (TType.STRING,None,TType.STRING,None), None, ), # 4
   )
 
+  def __init__(self, version=None, op=None, name=None, args=None,):
+    self.version = version
+    self.op = op
+    self.name = name
+    self.args = args
+
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
       fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
@@ -820,6 +1088,32 @@ class BadUserException(TException):
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
+      if fid == 1:
+        if ftype == TType.I64:
+          self.version = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.op = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.name = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.MAP:
+          self.args = {}
+          (_ktype24, _vtype25, _size23 ) = iprot.readMapBegin() 
+          for _i27 in xrange(_size23):
+            _key28 = iprot.readString();
+            _val29 = iprot.readString();
+            self.args[_key28] = _val29
+          iprot.readMapEnd()
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -829,7 +1123,731 @@ class BadUserException(TException):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('BadUserException')
+    oprot.writeStructBegin('Change')
+    if self.version is not None:
+      oprot.writeFieldBegin('version', TType.I64, 1)
+      oprot.writeI64(self.version)
+      oprot.writeFieldEnd()
+    if self.op is not None:
+      oprot.writeFieldBegin('op', TType.STRING, 2)
+      oprot.writeString(self.op)
+      oprot.writeFieldEnd()
+    if self.name is not None:
+      oprot.writeFieldBegin('name', TType.STRING, 3)
+      oprot.writeString(self.name)
+      oprot.writeFieldEnd()
+    if self.args is not None:
+      oprot.writeFieldBegin('args', TType.MAP, 4)
+      oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.args))
+      for kiter30,viter31 in self.args.items():
+        oprot.writeString(kiter30)
+        oprot.writeString(viter31)
+      oprot.writeMapEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.version is None:
+      raise TProtocol.TProtocolException(message='Required field version is unset!')
+    if self.op is None:
+      raise TProtocol.TProtocolException(message='Required field op is unset!')
+    if self.name is None:
+      raise TProtocol.TProtocolException(message='Required field name is unset!')
+    if self.args is None:
+      raise TProtocol.TProtocolException(message='Required field args is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ChangesPage:
+  """
+  Attributes:
+   - version
+   - changes
+   - more
+   - resync_required
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I64, 'version', None, None, ), # 1
+    (2, TType.LIST, 'changes', (TType.STRUCT,(Change, Change.thrift_spec)), None, ), # 2
+    (3, TType.BOOL, 'more', None, None, ), # 3
+    (4, TType.BOOL, 'resync_required', None, None, ), # 4
+  )
+
+  def __init__(self, version=None, changes=None, more=None, resync_required=None,):
+    self.version = version
+    self.changes = changes
+    self.more = more
+    self.resync_required = resync_required
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I64:
+          self.version = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.changes = []
+          (_etype35, _size32) = iprot.readListBegin()
+          for _i36 in xrange(_size32):
+            _elem37 = Change()
+            _elem37.read(iprot)
+            self.changes.append(_elem37)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.BOOL:
+          self.more = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.BOOL:
+          self.resync_required = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ChangesPage')
+    if self.version is not None:
+      oprot.writeFieldBegin('version', TType.I64, 1)
+      oprot.writeI64(self.version)
+      oprot.writeFieldEnd()
+    if self.changes is not None:
+      oprot.writeFieldBegin('changes', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRUCT, len(self.changes))
+      for iter38 in self.changes:
+        iter38.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.more is not None:
+      oprot.writeFieldBegin('more', TType.BOOL, 3)
+      oprot.writeBool(self.more)
+      oprot.writeFieldEnd()
+    if self.resync_required is not None:
+      oprot.writeFieldBegin('resync_required', TType.BOOL, 4)
+      oprot.writeBool(self.resync_required)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.version is None:
+      raise TProtocol.TProtocolException(message='Required field version is unset!')
+    if self.changes is None:
+      raise TProtocol.TProtocolException(message='Required field changes is unset!')
+    if self.more is None:
+      raise TProtocol.TProtocolException(message='Required field more is unset!')
+    if self.resync_required is None:
+      raise TProtocol.TProtocolException(message='Required field resync_required is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ChangeFilter:
+  """
+  Attributes:
+   - ops
+   - names
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'ops', (TType.STRING,None), None, ), # 1
+    (2, TType.LIST, 'names', (TType.STRING,None), None, ), # 2
+  )
+
+  def __init__(self, ops=None, names=None,):
+    self.ops = ops
+    self.names = names
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST:
+          self.ops = []
+          (_etype42, _size39) = iprot.readListBegin()
+          for _i43 in xrange(_size39):
+            _elem44 = iprot.readString();
+            self.ops.append(_elem44)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.names = []
+          (_etype48, _size45) = iprot.readListBegin()
+          for _i49 in xrange(_size45):
+            _elem50 = iprot.readString();
+            self.names.append(_elem50)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ChangeFilter')
+    if self.ops is not None:
+      oprot.writeFieldBegin('ops', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRING, len(self.ops))
+      for iter51 in self.ops:
+        oprot.writeString(iter51)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.names is not None:
+      oprot.writeFieldBegin('names', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRING, len(self.names))
+      for iter52 in self.names:
+        oprot.writeString(iter52)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class RpcStats:
+  """
+  Attributes:
+   - calls
+   - errors
+   - mean_ms
+   - p50_ms
+   - p95_ms
+   - p99_ms
+   - max_ms
+   - redis_round_trips
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I64, 'calls', None, None, ), # 1
+    (2, TType.I64, 'errors', None, None, ), # 2
+    (3, TType.DOUBLE, 'mean_ms', None, None, ), # 3
+    (4, TType.DOUBLE, 'p50_ms', None, None, ), # 4
+    (5, TType.DOUBLE, 'p95_ms', None, None, ), # 5
+    (6, TType.DOUBLE, 'p99_ms', None, None, ), # 6
+    (7, TType.DOUBLE, 'max_ms', None, None, ), # 7
+    (8, TType.DOUBLE, 'redis_round_trips', None, None, ), # 8
+  )
+
+  def __init__(self, calls=None, errors=None, mean_ms=None, p50_ms=None, p95_ms=None, p99_ms=None, max_ms=None, redis_round_trips=None,):
+    self.calls = calls
+    self.errors = errors
+    self.mean_ms = mean_ms
+    self.p50_ms = p50_ms
+    self.p95_ms = p95_ms
+    self.p99_ms = p99_ms
+    self.max_ms = max_ms
+    self.redis_round_trips = redis_round_trips
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I64:
+          self.calls = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I64:
+          self.errors = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.DOUBLE:
+          self.mean_ms = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.DOUBLE:
+          self.p50_ms = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.DOUBLE:
+          self.p95_ms = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.DOUBLE:
+          self.p99_ms = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.DOUBLE:
+          self.max_ms = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 8:
+        if ftype == TType.DOUBLE:
+          self.redis_round_trips = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('RpcStats')
+    if self.calls is not None:
+      oprot.writeFieldBegin('calls', TType.I64, 1)
+      oprot.writeI64(self.calls)
+      oprot.writeFieldEnd()
+    if self.errors is not None:
+      oprot.writeFieldBegin('errors', TType.I64, 2)
+      oprot.writeI64(self.errors)
+      oprot.writeFieldEnd()
+    if self.mean_ms is not None:
+      oprot.writeFieldBegin('mean_ms', TType.DOUBLE, 3)
+      oprot.writeDouble(self.mean_ms)
+      oprot.writeFieldEnd()
+    if self.p50_ms is not None:
+      oprot.writeFieldBegin('p50_ms', TType.DOUBLE, 4)
+      oprot.writeDouble(self.p50_ms)
+      oprot.writeFieldEnd()
+    if self.p95_ms is not None:
+      oprot.writeFieldBegin('p95_ms', TType.DOUBLE, 5)
+      oprot.writeDouble(self.p95_ms)
+      oprot.writeFieldEnd()
+    if self.p99_ms is not None:
+      oprot.writeFieldBegin('p99_ms', TType.DOUBLE, 6)
+      oprot.writeDouble(self.p99_ms)
+      oprot.writeFieldEnd()
+    if self.max_ms is not None:
+      oprot.writeFieldBegin('max_ms', TType.DOUBLE, 7)
+      oprot.writeDouble(self.max_ms)
+      oprot.writeFieldEnd()
+    if self.redis_round_trips is not None:
+      oprot.writeFieldBegin('redis_round_trips', TType.DOUBLE, 8)
+      oprot.writeDouble(self.redis_round_trips)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.calls is None:
+      raise TProtocol.TProtocolException(message='Required field calls is unset!')
+    if self.errors is None:
+      raise TProtocol.TProtocolException(message='Required field errors is unset!')
+    if self.mean_ms is None:
+      raise TProtocol.TProtocolException(message='Required field mean_ms is unset!')
+    if self.p50_ms is None:
+      raise TProtocol.TProtocolException(message='Required field p50_ms is unset!')
+    if self.p95_ms is None:
+      raise TProtocol.TProtocolException(message='Required field p95_ms is unset!')
+    if self.p99_ms is None:
+      raise TProtocol.TProtocolException(message='Required field p99_ms is unset!')
+    if self.max_ms is None:
+      raise TProtocol.TProtocolException(message='Required field max_ms is unset!')
+    if self.redis_round_trips is None:
+      raise TProtocol.TProtocolException(message='Required field redis_round_trips is unset!')
+    return
+
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class AuthenticationException(TException):
+  """
+  Attributes:
+   - why
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'why', None, None, ), # 1
+  )
+
+  def __init__(self, why=None,):
+    self.why = why
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.why = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('AuthenticationException')
+    if self.why is not None:
+      oprot.writeFieldBegin('why', TType.STRING, 1)
+      oprot.writeString(self.why)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    if self.why is None:
+      raise TProtocol.TProtocolException(message='Required field why is unset!')
+    return
+
+
+  def __str__(self):
+    return repr(self)
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ClientError(TException):
+  """
+  Attributes:
+   - why
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'why', None, None, ), # 1
+  )
+
+  def __init__(self, why=None,):
+    self.why = why
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.why = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ClientError')
+    if self.why is not None:
+      oprot.writeFieldBegin('why', TType.STRING, 1)
+      oprot.writeString(self.why)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __str__(self):
+    return repr(self)
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class BadProjectException(TException):
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('BadProjectException')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __str__(self):
+    return repr(self)
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class BadHostException(TException):
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('BadHostException')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __str__(self):
+    return repr(self)
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class BadUserException(TException):
+
+  thrift_spec = (
+  )
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('BadUserException')
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def validate(self):
+    return
+
+
+  def __str__(self):
+    return repr(self)
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class NotEnoughHostsException(TException):
+  """
+  Attributes:
+   - requested
+   - available
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'requested', None, None, ), # 1
+    (2, TType.I32, 'available', None, None, ), # 2
+  )
+
+  def __init__(self, requested=None, available=None,):
+    self.requested = requested
+    self.available = available
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32:
+          self.requested = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.available = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('NotEnoughHostsException')
+    if self.requested is not None:
+      oprot.writeFieldBegin('requested', TType.I32, 1)
+      oprot.writeI32(self.requested)
+      oprot.writeFieldEnd()
+    if self.available is not None:
+      oprot.writeFieldBegin('available', TType.I32, 2)
+      oprot.writeI32(self.available)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -0,0 +1,181 @@
+#
+# Host query expressions, as taken by get_hosts_query():
+#
+#   proj1-rack & (rack12 | rack13) & !degraded
+#   project:proj1 & !gpu
+#
+# A bare name is a tag and project:NAME the hosts assigned to a project
+# (tag:NAME spells a tag out, for tags that would otherwise look like
+# something else).  ! binds tightest, then &, then |; parentheses group.
+#
+# parse() turns the text into a tree of tuples, which the storage
+# engines evaluate with set operations on their project and tag indexes:
+#
+#   ("tag", name)  ("project", name)
+#   ("and", (expr, ...))  ("or", (expr, ...))  ("not", expr)
+#
+# plus AVAILABLE, the hosts free to be allocated, which parse() never
+# produces but host_allocate() ANDs with its constraints.  The tuples are
+# hashable, so the cache can key on them.
+#
+
+import re
+
+AVAILABLE = ("available", "")
+LEAVES = ("tag", "project", "available")
+
+TOKEN_RE = re.compile(r'\s*(?:([&|!()])|([^\s&|!()]+))')
+
+# deep and long enough for any query a person would write, small enough
+# not to run the parser out of stack or the engines out of operands
+MAX_DEPTH = 50
+MAX_NAMES = 200
+
+def tokenize(text):
+  tokens = []
+  position = 0
+  text = text.rstrip()
+  while position < len(text):
+    match = TOKEN_RE.match(text, position)
+    if not match:
+      raise ValueError("can't parse query at %r" % text[position:])
+    tokens.append(match.group(1) or match.group(2))
+    position = match.end()
+  return tokens
+
+class Parser(object):
+  #   expr   := term ("|" term)*
+  #   term   := factor ("&" factor)*
+  #   factor := "!" factor | "(" expr ")" | name
+  def __init__(self, text):
+    self.tokens = tokenize(text)
+    self.position = 0
+    self.names = 0
+
+  def peek(self):
+    if self.position < len(self.tokens):
+      return self.tokens[self.position]
+    return None
+
+  def take(self):
+    token = self.peek()
+    if token is None:
+      raise ValueError("query ends too soon")
+    self.position += 1
+    return token
+
+  def parse(self):
+    if not self.tokens:
+      raise ValueError("empty query")
+    expr = self.expr(0)
+    if self.peek() is not None:
+      raise ValueError("unexpected %r in query" % self.peek())
+    return expr
+
+  def expr(self, depth):
+    terms = [self.term(depth)]
+    while self.peek() == "|":
+      self.take()
+      terms.append(self.term(depth))
+    return flatten("or", terms)
+
+  def term(self, depth):
+    factors = [self.factor(depth)]
+    while self.peek() == "&":
+      self.take()
+      factors.append(self.factor(depth))
+    return flatten("and", factors)
+
+  def factor(self, depth):
+    if depth > MAX_DEPTH:
+      raise ValueError("query nested too deeply")
+    token = self.take()
+    if token == "!":
+      operand = self.factor(depth + 1)
+      if operand[0] == "not":
+        return operand[1]
+      return ("not", operand)
+    elif token == "(":
+      expr = self.expr(depth + 1)
+      if self.take() != ")":
+        raise ValueError("missing ) in query")
+      return expr
+    elif token in ("&", "|", ")"):
+      raise ValueError("unexpected %r in query" % token)
+    self.names += 1
+    if self.names > MAX_NAMES:
+      raise ValueError("query names more than %d tags and projects" %
+                       MAX_NAMES)
+    return leaf(token)
+
+def leaf(name):
+  (kind, sep, rest) = name.partition(":")
+  if sep and kind in ("tag", "project"):
+    if not rest:
+      raise ValueError("no name after %r in query" % name)
+    return (kind, rest)
+  return ("tag", name)
+
+def flatten(op, operands):
+  # a & (b & c) is a & b & c; repeats are dropped, keeping the first
+  if len(operands) == 1:
+    return operands[0]
+  flat = []
+  for operand in operands:
+    for expr in (operand[1] if operand[0] == op else (operand,)):
+      if expr not in flat:
+        flat.append(expr)
+  if len(flat) == 1:
+    return flat[0]
+  return (op, tuple(flat))
+
+def parse(text):
+  # the expression tree for text; ValueError if it doesn't parse
+  return Parser(text).parse()
+
+def restrict_available(expr):
+  # the AVAILABLE hosts among those expr selects (all of them for None)
+  if expr is None:
+    return AVAILABLE
+  return flatten("and", [AVAILABLE, expr])
+
+def split_and(operands):
+  # (positive, negated) operands of an "and": the negated ones can be
+  # subtracted from the intersection of the others rather than each
+  # complemented against every host
+  positive = [expr for expr in operands if expr[0] != "not"]
+  negated = [expr[1] for expr in operands if expr[0] == "not"]
+  return (positive, negated)
+
+def evaluate(expr, names, all_names):
+  # the set of hostnames expr selects, given names(kind, name), the
+  # hostnames in one index (tag, project or available), and all_names(),
+  # every hostname.  Neither's results are modified, so engines can hand
+  # over their own index sets.  Intersections start from the smallest set
+  # and subtractions only test what's left, so an "and" costs about the
+  # size of its smallest operand rather than that of the inventory.
+  op = expr[0]
+  if op in LEAVES:
+    return names(op, expr[1])
+  elif op == "or":
+    hostnames = set()
+    for operand in expr[1]:
+      hostnames.update(evaluate(operand, names, all_names))
+    return hostnames
+  elif op == "not":
+    excluded = evaluate(expr[1], names, all_names)
+    return set(name for name in all_names() if name not in excluded)
+
+  (positive, negated) = split_and(expr[1])
+  if positive:
+    sets = sorted((evaluate(operand, names, all_names)
+                   for operand in positive), key=len)
+    hostnames = set(sets[0])
+    for other in sets[1:]:
+      hostnames = set(name for name in hostnames if name in other)
+  else:
+    hostnames = set(all_names())
+  for operand in negated:
+    excluded = evaluate(operand, names, all_names)
+    hostnames = set(name for name in hostnames if name not in excluded)
+  return hostnames
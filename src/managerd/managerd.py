@@ -1,323 +1,667 @@
 #!/usr/bin/env python
 
-import sys, argparse, os
+import sys, argparse, logging, os, threading, time
 sys.path.append('gen-py')
 
-import redis
-from redis.exceptions import ConnectionError
+from storage import ADDED, EXISTS, MACADDR_TAKEN, HOST_FIELDS, NotEnoughHosts
+from cached_storage import CachedStorage
+import thrift_stack
+import server_models
+from change_notifier import ChangeNotifier
+import host_query
+import rpc_stats
+import queued_logging
 
 from ucsd import ClusterManager
 from ucsd.ttypes import *
 
 from thrift.transport import TSocket
-from thrift.transport import TTransport
-from thrift.protocol import TBinaryProtocol
-from thrift.server import TServer
 
-class ClusterManagerHandler:
-  def __init__(self, _debugmode, servername):
-    self.debugmode = _debugmode
-    self.redis_server = servername
+log = logging.getLogger("managerd")
 
-    self.r_server = redis.Redis(self.redis_server)
+# the most changes get_changes() and hosts get_hosts_page() return at once
+MAX_CHANGES_PAGE = 1000
+MAX_HOSTS_PAGE = 1000
 
-    try:
-      # Redis doesn't actually detect failures until a command is issued,
-      # and so we issue a dummy command here to fail fast if the
-      # server isn't there
-      self.r_server.ping()
-    except ConnectionError as ce:
-      print "Error connecting to redis server: " + str(ce)
-      print "Are you running a redis server on host " + self.redis_server + "?"
-      sys.exit(1)
-
-  def debug(self, str):
-    if self.debugmode:
-      print str
+# the longest watch() waits before answering with no changes
+MAX_WATCH_MS = 60000
+
+# the methods get_stats() reports on
+RPC_NAMES = [name for name in dir(ClusterManager.Iface)
+             if not name.startswith("_")]
+
+class ClusterManagerHandler:
+  def __init__(self, store, record_stats=True, max_watchers=None):
+    # a storage.Storage engine holding every host, project, user and tag
+    self.store = store
+
+    # wakes watch() callers as changes are recorded, by us or by other
+    # managerds
+    self.notifier = ChangeNotifier()
+    store.listen_changes(self.notifier.notify)
+    # bounds the watch() calls waiting at once, if max_watchers is given
+    self.watchers = (threading.Semaphore(max_watchers)
+                     if max_watchers is not None else None)
+
+    # per-RPC counts and latencies for get_stats(); cheap enough to leave
+    # on (see bench/rpc_stats_bench.py)
+    self.recorder = rpc_stats.RpcRecorder()
+    if record_stats:
+      self.recorder.instrument(self, RPC_NAMES)
 
   def login(self, auth_request):
     raise AuthenticationException("login not yet supported")
 
   def ping(self):
-    self.debug('ping()')
+    log.debug('ping()')
     return True
 
   def host_add(self, hostname, macaddr):
-    self.debug("host_add(%s,%s)" % (hostname, macaddr))
+    log.debug("host_add(%s,%s)", hostname, macaddr)
 
-    key = "host_%s" % hostname
-    if self.r_server.exists(key):
+    added = self.store.host_add(hostname, macaddr, HostStatus.AVAILABLE,
+                                True)
+    if added == EXISTS:
       # the host already exists
-      self.debug("  already exists, doing nothing")
+      log.debug("  already exists, doing nothing")
       return False
-    
-    self.r_server.hset(key, "name", hostname)
-    self.r_server.hset(key, "status", HostStatus.AVAILABLE)
-    self.r_server.hset(key, "owner", '')
-    self.r_server.hset(key, "assigned_project", '')
-    self.r_server.hset(key, "netboot_enabled", True)
-    self.r_server.hset(key, "macaddr", macaddr)
-    self.r_server.hset(key, "tags", '')
-
-    self.debug("  added host %s with mac %s" % (hostname, macaddr))
+    elif added == MACADDR_TAKEN:
+      # a macaddr can only identify a single host
+      log.debug("  mac %s already belongs to another host, doing nothing",
+                macaddr)
+      return False
+
+    log.debug("  added host %s with mac %s", hostname, macaddr)
+    self.__changed("host_add", hostname, macaddr=macaddr)
     return True
 
+  def host_add_batch(self, hosts):
+    log.debug("host_add_batch(%d hosts)", len(hosts))
+
+    results = self.store.host_add_batch(
+      [(spec.host, spec.macaddr) for spec in hosts],
+      HostStatus.AVAILABLE, True)
+    self.__changed_batch(
+      [("host_add", spec.host, {"macaddr": spec.macaddr})
+       for (spec, added) in zip(hosts, results) if added == ADDED])
+
+    log.debug("  added %d hosts", results.count(ADDED))
+    return [added == ADDED for added in results]
+
   def host_remove(self, hostname):
-    self.debug("host_remove(%s)" % hostname)
+    log.debug("host_remove(%s)", hostname)
 
-    key = "host_%s" % hostname
-    if not self.r_server.exists(key):
-      self.debug("  host didn't exist, doing nothing")
+    if not self.store.host_remove(hostname):
+      log.debug("  host didn't exist, doing nothing")
       return False
 
-    self.r_server.delete(key)
-    self.debug("  removed host %s" % hostname)
+    log.debug("  removed host %s", hostname)
+    self.__changed("host_remove", hostname)
     return True
 
+  def __changed(self, op, name, **args):
+    # after every successful change: bumps the generation, so that
+    # pollers notice it, logs it for get_changes() and wakes watch()
+    self.notifier.notify(self.store.record_change(op, name, args))
+
+  def __changed_batch(self, changes):
+    # __changed() for each (op, name, args)
+    if changes:
+      self.store.record_changes(changes)
+      self.notifier.notify()
+
+  def rebuild_indexes(self):
+    rebuilt = self.store.rebuild_indexes()
+    # anything may have changed; consumers of get_changes() resync on ops
+    # they don't know
+    self.__changed("rebuild_indexes", "")
+    return rebuilt
+
+  def migrate_tags(self, batch_size=100):
+    return self.store.migrate_tags(batch_size)
+
+  def upgrade_database(self, batch_size=100):
+    # bring a database written by an older managerd up to date; safe to
+    # run while serving, and a no-op once done
+    if self.store.upgrade(batch_size):
+      self.__changed("upgrade_database", "")
+
   def project_add(self, name, server, rootpath, kernel, initrd, params):
-    self.debug("project_add %s" % name)
+    log.debug("project_add %s", name)
+    # an unset optional field arrives as None; store the same '' in every
+    # engine rather than redis's "None"
+    params = params or ''
 
-    key = "project_%s" % name
-    if self.r_server.exists(key):
+    if not self.store.project_add(name, server, rootpath, kernel, initrd,
+                                  params):
       # the project already exists
-      self.debug("  already exists, doing nothing")
+      log.debug("  already exists, doing nothing")
       return False
-    
-    self.r_server.hset(key, "name", name)
-    self.r_server.hset(key, "nfsserver", server)
-    self.r_server.hset(key, "nfsroot", rootpath)
-    self.r_server.hset(key, "kernel", kernel)
-    self.r_server.hset(key, "initrd", initrd)
-    self.r_server.hset(key, "params", params)
-
-    self.debug("  added project %s" % name)
+
+    log.debug("  added project %s", name)
+    self.__changed("project_add", name, nfsserver=server, nfsroot=rootpath,
+                   kernel=kernel, initrd=initrd, params=params)
     return True
 
   def project_remove(self, projectname):
-    self.debug("project_remove %s" % projectname)
+    log.debug("project_remove %s", projectname)
 
-    key = "project_%s" % projectname
-    if not self.r_server.exists(key):
-      self.debug("  project didn't exist, doing nothing")
+    if not self.store.project_remove(projectname):
+      log.debug("  project didn't exist, doing nothing")
       return False
 
-    self.r_server.delete(key)
-    self.debug("  removed project %s" % projectname)
+    log.debug("  removed project %s", projectname)
+    self.__changed("project_remove", projectname)
     return True
 
   def user_add(self, username, fullname):
-    self.debug("user_add %s" % username)
+    log.debug("user_add %s", username)
 
-    key = "user_%s" % username
-    if self.r_server.exists(key):
+    if not self.store.user_add(username, fullname):
       # the user already exists
-      self.debug("  already exists, doing nothing")
+      log.debug("  already exists, doing nothing")
       return False
-    
-    self.r_server.hset(key, "name", username)
-    self.r_server.hset(key, "fullname", fullname)
 
-    self.debug("  added user %s" % username)
+    log.debug("  added user %s", username)
+    self.__changed("user_add", username, fullname=fullname)
     return True
 
   def user_remove(self, username):
-    self.debug("user_remove %s" % username)
+    log.debug("user_remove %s", username)
 
-    key = "user_%s" % username
-    if not self.r_server.exists(key):
-      self.debug("  user didn't exist, doing nothing")
+    if not self.store.user_remove(username):
+      log.debug("  user didn't exist, doing nothing")
       return False
 
-    self.r_server.delete(key)
-    self.debug("  removed user %s" % username)
+    log.debug("  removed user %s", username)
+    self.__changed("user_remove", username)
     return True
 
+  def get_pool_stats(self):
+    log.debug("get_pool_stats")
+
+    return self.store.pool_stats()
+
+  def get_cache_stats(self):
+    log.debug("get_cache_stats")
+
+    if not isinstance(self.store, CachedStorage):
+      return {}
+    return self.store.stats()
+
+  def set_cache_bypass(self, bypass):
+    log.debug("set_cache_bypass %s", bypass)
+
+    if isinstance(self.store, CachedStorage):
+      self.store.set_bypass(bypass)
+
+  def get_stats(self, reset):
+    log.debug("get_stats %s", reset)
+
+    stats = {}
+    for (name, summary) in self.recorder.summaries(reset).items():
+      (calls, errors, mean, p50, p95, p99, longest, round_trips) = summary
+      stats[name] = RpcStats(calls=calls, errors=errors, mean_ms=1000 * mean,
+                             p50_ms=1000 * p50, p95_ms=1000 * p95,
+                             p99_ms=1000 * p99, max_ms=1000 * longest,
+                             redis_round_trips=round_trips)
+    return stats
+
   def get_projects(self):
-    self.debug("get_projects")
+    log.debug("get_projects")
 
-    prefix = "project_"
-    return [name[len(prefix):] for name in self.r_server.keys(prefix+"*")]
+    return list(self.store.project_names())
 
-  def __materialize_hosts(self, host_keys):
-    hosts = []
+  def get_project_host_counts(self):
+    log.debug("get_project_host_counts")
 
-    for hkey in host_keys:
-      host = Host()
+    return self.store.project_host_counts()
 
-      host.name = self.r_server.hget(hkey, "name")
-      status = int(self.r_server.hget(hkey, "status"))
-      if status == 0:
-        host.status = HostStatus.UNKNOWN
-      elif status == 1:
-        host.status = HostStatus.ASSIGNED
-      elif status == 2:
-        host.status = HostStatus.AVAILABLE
-      else:
-        print('bad status value %d in host %s' % (status, hkey))
+  def __projection(self, fields):
+    # the set of Host fields a query asked for, or None for all of them
+    if not fields:
+      return None
+    unknown = set(fields) - set(HOST_FIELDS)
+    if unknown:
+      raise ClientError("no such host fields: %s" %
+                        ", ".join(sorted(unknown)))
+    return frozenset(fields) | frozenset(["name"])
 
-      host.owner = self.r_server.hget(hkey, "owner")
-      host.assigned_project = self.r_server.hget(hkey, "assigned_project")
-      host.netboot_enabled = self.r_server.hget(hkey, "netboot_enabled")
-      host.macaddr = self.r_server.hget(hkey, "macaddr")
-      host.tags = self.r_server.hget(hkey, "tags")
+  def get_hosts(self, project=None, tag=None, fields=None):
+    log.debug("get_hosts %s %s %s", project, tag, fields)
 
-      hosts.append(host)
+    fields = self.__projection(fields)
+    return self.store.hosts(self.store.host_names(project or None,
+                                                  tag or None), fields)
 
-    return hosts
+  def get_hosts_query(self, query, fields=None):
+    log.debug("get_hosts_query %r %s", query, fields)
 
-  def get_hosts(self, project=None, tag=None):
-    self.debug("get_hosts %s %s" % (project, tag))
+    fields = self.__projection(fields)
+    try:
+      expr = host_query.parse(query)
+    except ValueError as ve:
+      raise ClientError(str(ve))
+    return self.store.hosts(self.store.host_names_query(expr), fields)
 
-    # all hosts
-    hkeys = self.r_server.keys("host_*")
+  def get_hosts_page(self, filter, cursor, limit, fields=None):
+    (project, tag) = (filter.project, filter.tag) if filter else (None, None)
+    log.debug("get_hosts_page %s %s %r %s %s", project, tag, cursor, limit,
+              fields)
 
-    # if project is specified, filter all but hosts in that project
-    if project is not None and project is not '':
-      hkeys = [host for host in hkeys if
-        self.r_server.hget(host,"assigned_project") == project]
+    fields = self.__projection(fields)
 
-    # if tag is specified, filter all but hosts with that tag
-    if tag is not None and tag is not '':
-      hkeys = [host for host in hkeys if
-        tag in self.r_server.hget(host,"tags").split()]
+    if limit is not None and limit < 0:
+      raise ClientError("negative limit %d" % limit)
+    if not limit or limit > MAX_HOSTS_PAGE:
+      limit = MAX_HOSTS_PAGE
 
-    return self.__materialize_hosts(hkeys)
+    try:
+      (hostnames, cursor) = self.store.host_names_page(
+        project or None, tag or None, cursor or "", limit)
+    except ValueError as ve:
+      raise ClientError(str(ve))
+
+    page = HostsPage()
+    page.hosts = self.store.hosts(hostnames, fields)
+    page.cursor = cursor
+    return page
+
+  def get_generation(self):
+    log.debug("get_generation")
+
+    return self.store.generation()
+
+  def get_hosts_if_changed(self, since_generation, project=None, tag=None,
+                           fields=None):
+    log.debug("get_hosts_if_changed %d %s %s %s", since_generation, project,
+              tag, fields)
+
+    fields = self.__projection(fields)
+
+    # read the generation first: every change it counts has completed, so
+    # hosts read from the engine after it are at least that current.  Not
+    # so from the cache, which hears of other managerds' changes over the
+    # invalidation channel some time after they count in the generation;
+    # a poller given stale hosts with the new generation would keep them
+    # until the next change.
+    update = HostsUpdate()
+    update.generation = self.store.generation()
+    if update.generation != since_generation:
+      store = self.store.uncached()
+      update.hosts = store.hosts(store.host_names(project or None,
+                                                  tag or None), fields)
+    return update
+
+  def get_changes(self, since_version, limit):
+    log.debug("get_changes %d %s", since_version, limit)
+
+    if limit is not None and limit < 0:
+      raise ClientError("negative limit %d" % limit)
+    return self.__changes_page(since_version, limit, None, None)
+
+  def watch(self, since_version, timeout_ms, filter):
+    ops = set(filter.ops) if filter and filter.ops else None
+    names = set(filter.names) if filter and filter.names else None
+    log.debug("watch %d %s %s %s", since_version, timeout_ms, ops, names)
+
+    timeout = min(max(timeout_ms or 0, 0), MAX_WATCH_MS) / 1000.0
+    deadline = time.time() + timeout
+    while True:
+      sequence = self.notifier.sequence
+      page = self.__changes_page(since_version, MAX_CHANGES_PAGE, ops,
+                                 names)
+      if page.changes or page.resync_required:
+        return page
+
+      # nothing we want up to page.version; skip past it
+      since_version = page.version
+      if page.more:
+        continue
+      remaining = deadline - time.time()
+      if remaining <= 0 or not self.__wait_for_change(sequence, remaining):
+        return page
+
+  def __wait_for_change(self, sequence, timeout):
+    # ChangeNotifier.wait(), unless as many watch() calls are waiting as
+    # may; then we answer rather than tie up another server thread
+    if self.watchers is None:
+      return self.notifier.wait(sequence, timeout)
+    if not self.watchers.acquire(False):
+      return False
+    try:
+      return self.notifier.wait(sequence, timeout)
+    finally:
+      self.watchers.release()
+
+  def __changes_page(self, since_version, limit, ops, names):
+    # a ChangesPage of the changes after since_version whose op is in ops
+    # and name in names (either None for any); version is the last change
+    # looked at, matching or not
+    if not limit or limit > MAX_CHANGES_PAGE:
+      limit = MAX_CHANGES_PAGE
+
+    # one extra tells us whether there's another page
+    (generation, changes) = self.store.changes(since_version, limit + 1)
+
+    page = ChangesPage()
+    page.changes = []
+    page.more = False
+    page.resync_required = changes is None
+    if page.resync_required:
+      # reload everything, then carry on from here
+      log.debug("  log doesn't reach back to %d", since_version)
+      page.version = generation
+      return page
+
+    page.more = len(changes) > limit
+    page.version = since_version
+    for (version, op, name, args) in changes[:limit]:
+      page.version = version
+      if ops is not None and op not in ops:
+        continue
+      if names is not None and name not in names:
+        continue
+      page.changes.append(Change(version=version, op=op, name=name,
+                                 args=args))
+    return page
 
   def get_tags(self, host):
-    self.debug("get_tags %s" % host)
+    log.debug("get_tags %s", host)
     
-    key = "host_%s" % host
-    if not self.r_server.exists(key):
+    tags = self.store.host_tags(host)
+    if tags is None:
       return []
     else:
-      return self.r_server.hget(key, "tags").split(",")
+      return sorted(tags)
   
   def host_assign(self, host, project, user):
-    self.debug("host_assign %s %s %s" % (host,project,user))
-
-    key = "host_%s" % host
-    if not self.r_server.exists(key):
-      self.debug("  host %s didn't exist" % host)
-      return False
+    log.debug("host_assign %s %s %s", host, project, user)
 
     # we should probably sanity check the project and user they gave us
-    self.r_server.hset(key, "assigned_project", project)
-    self.r_server.hset(key, "tags", '')
-    self.r_server.hset(key, "owner", user)
-    self.r_server.hset(key, "status", HostStatus.ASSIGNED)
+    if not self.store.set_assignment(host, project, user or '',
+                                     HostStatus.ASSIGNED):
+      log.debug("  host %s didn't exist", host)
+      return False
 
+    self.__changed("host_assign", host, project=project, owner=user or '')
     return True
 
-  def host_release(self, host):
-    self.debug("host_release %s" % host)
-
-    key = "host_%s" % host
-    if not self.r_server.exists(key):
-      self.debug(" host %s didn't exist" % host)
+  def host_allocate(self, project, count, constraints, user):
+    log.debug("host_allocate %s %s %r %s", project, count, constraints, user)
 
-    self.r_server.hset(key, "assigned_project", '')
-    self.r_server.hset(key, "tags", '')
-    self.r_server.hset(key, "owner", '')
-    self.r_server.hset(key, "status", HostStatus.AVAILABLE)
-
-    return True
+    if count is None or count < 1:
+      raise ClientError("can't allocate %s hosts" % count)
+    try:
+      query = host_query.parse(constraints) if constraints else None
+    except ValueError as ve:
+      raise ClientError(str(ve))
+    if project not in self.store.project_names():
+      raise BadProjectException()
 
-  def tag_add(self, host, tag):
-    self.debug("tag_add %s %s" % (host, tag))
+    owner = user or ''
+    try:
+      hostnames = self.store.host_allocate(project, owner, count, query,
+                                           HostStatus.ASSIGNED)
+    except NotEnoughHosts as neh:
+      log.debug("  only %d hosts available", neh.available)
+      raise NotEnoughHostsException(requested=count,
+                                    available=neh.available)
+
+    self.__changed_batch(
+      [("host_assign", host, {"project": project, "owner": owner})
+       for host in hostnames])
+    log.debug("  allocated %s", hostnames)
+    return self.store.hosts(hostnames)
+
+  def host_assign_batch(self, assignments):
+    log.debug("host_assign_batch(%d hosts)", len(assignments))
+
+    assignments = [(a.host, a.project, a.user or '') for a in assignments]
+    results = self.store.set_assignment_batch(assignments,
+                                              HostStatus.ASSIGNED)
+    self.__changed_batch(
+      [("host_assign", host, {"project": project, "owner": owner})
+       for ((host, project, owner), assigned) in zip(assignments, results)
+       if assigned])
+
+    log.debug("  assigned %d hosts", results.count(True))
+    return results
 
-    key = "host_%s" % host
-    if not self.r_server.exists(key):
-      self.debug(" host %s didn't exist" % host)
+  def host_release(self, host):
+    log.debug("host_release %s", host)
 
-    old_tags = self.r_server.hget(key, "tags")
-    new_tags = old_tags + " " + tag
-    self.r_server.hset(key, "tags", new_tags)
+    if not self.store.set_assignment(host, '', '', HostStatus.AVAILABLE):
+      log.debug(" host %s didn't exist", host)
+      return False
 
+    self.__changed("host_release", host)
     return True
 
-  def tag_removeAll(self, host):
-    self.debug("tag_removeAll %s" % host)
-
-    key = "host_%s" % host
-    if not self.r_server.exists(key):
-      self.debug(" host %s didn't exist" % host)
-
-    self.r_server.hset(key, "tags", '')
-
-  def lookup(self, macaddr):
-    self.debug("lookup %s" % macaddr)
-
-    # find a host with this macaddr
-    h = None
-    for hkey in self.r_server.keys('host_*'):
-      mac = self.r_server.hget(hkey, 'macaddr')
-      if mac.lower() == macaddr.lower():
-        host = hkey[5:]
-        self.debug('found a match for host %s' % host)
-
-        # is the host assigned to a project?
-        status = int(self.r_server.hget(hkey, 'status'))
-        if status != HostStatus.ASSIGNED:
-          self.debug('host %s was not in assigned mode' % host)
-          break
-
-        # lookup what project this host is assigned to
-        proj = self.r_server.hget(hkey, 'assigned_project')
-        projkey = 'project_' + proj
-        self.debug('host %s assigned to project %s' % (host,proj))
-
-        # is the project valid?
-        if not self.r_server.exists('project_' + proj):
-          self.debug('specified project %s is invalid' % proj)
-          break
+  def tag_add(self, host, tag):
+    log.debug("tag_add %s %s", host, tag)
 
-        # construct the bootconfig and return to the client
-        bc = BootConfig()
+    if not self.store.tag_add(host, tag):
+      log.debug(" host %s didn't exist", host)
+      return False
 
-        bc.project = proj
-        bc.kernel = self.r_server.hget(projkey, 'kernel')
-        bc.initrd = self.r_server.hget(projkey, 'initrd')
-        bc.nfsserver = self.r_server.hget(projkey, 'nfsserver')
-        bc.nfsroot = self.r_server.hget(projkey, 'nfsroot')
-        bc.parameters = self.r_server.hget(projkey, 'parameters')
+    self.__changed("tag_add", host, tag=tag)
+    return True
 
-        self.debug("found bootconfig record: %s" % str(bc))
+  def tag_add_batch(self, tags):
+    log.debug("tag_add_batch(%d tags)", len(tags))
 
-        return bc
+    results = self.store.tag_add_batch([(t.host, t.tag) for t in tags])
+    self.__changed_batch(
+      [("tag_add", t.host, {"tag": t.tag})
+       for (t, tagged) in zip(tags, results) if tagged])
 
-    # didn't find a match for 'macaddr'
-    return None
+    log.debug("  added %d tags", results.count(True))
+    return results
 
-def start_managerd(debugmode, redis_server):
-  print "Starting managerd daemon..."
+  def tag_removeAll(self, host):
+    log.debug("tag_removeAll %s", host)
 
-  print "connecting to redis server " + redis_server
+    if not self.store.tag_remove_all(host):
+      log.debug(" host %s didn't exist", host)
+      return
 
-  handler = ClusterManagerHandler(debugmode, redis_server)
-  processor = ClusterManager.Processor(handler)
-  transport = TSocket.TServerSocket(port=9090)
-  tfactory = TTransport.TBufferedTransportFactory()
-  pfactory = TBinaryProtocol.TBinaryProtocolFactory()
+    self.__changed("tag_removeAll", host)
 
-  server = TServer.TThreadedServer(processor, transport, tfactory, pfactory)
+  def lookup(self, macaddr):
+    log.debug("lookup %s", macaddr)
+
+    return self.__boot_config(self.store.lookup(macaddr))
+
+  def lookup_batch(self, macaddrs):
+    log.debug("lookup_batch(%d macaddrs)", len(macaddrs))
+
+    configs = {}
+    for (macaddr, result) in zip(macaddrs,
+                                 self.store.lookup_batch(macaddrs)):
+      bc = self.__boot_config(result)
+      if bc is not None:
+        configs[macaddr] = bc
+
+    log.debug("  found %d bootconfigs", len(configs))
+    return configs
+
+  def __boot_config(self, result):
+    (host, proj, config) = result
+    if host is None:
+      # didn't find a match for 'macaddr'
+      return None
+
+    log.debug('found a match for host %s', host)
+
+    # is the host assigned to a project?
+    if proj is None:
+      log.debug('host %s was not in assigned mode', host)
+      return None
+
+    log.debug('host %s assigned to project %s', host, proj)
+
+    # is the project valid?
+    if config is None:
+      log.debug('specified project %s is invalid', proj)
+      return None
+
+    # construct the bootconfig and return to the client
+    bc = BootConfig()
+
+    bc.project = proj
+    (bc.kernel, bc.initrd, bc.nfsserver, bc.nfsroot, bc.parameters) = config
+
+    log.debug("found bootconfig record: %s", bc)
+
+    return bc
+
+def make_storage(args):
+  if args.storage == "memory":
+    from memory_storage import MemoryStorage
+    return MemoryStorage(change_log_length=args.change_log_length)
+  elif args.storage == "sqlite":
+    from sqlite_storage import SqliteStorage
+    log.info("using sqlite database %s", args.sqlite_path)
+    return SqliteStorage(args.sqlite_path,
+                         change_log_length=args.change_log_length)
+
+  from redis_pool import MonitoredConnectionPool
+  from redis_storage import RedisStorage
+
+  log.info("connecting to redis server %s", args.redis_server)
+
+  pool = MonitoredConnectionPool(
+    host=args.redis_server, db=args.redis_db,
+    max_connections=args.redis_max_connections,
+    timeout=args.redis_pool_timeout,
+    socket_timeout=args.redis_socket_timeout,
+    socket_connect_timeout=args.redis_connect_timeout,
+    health_check_interval=args.redis_health_check_interval)
+
+  return RedisStorage(args.redis_server,
+                      materialize_chunk=args.materialize_chunk,
+                      scan_count=args.scan_count,
+                      pool=pool,
+                      change_log_length=args.change_log_length)
+
+def make_handler(args):
+  # always behind the cache, even when it's bypassed, so that our writes
+  # still invalidate the caches of other managerds
+  store = CachedStorage(make_storage(args), max_entries=args.cache_size,
+                        bypass=args.cache_bypass)
+  return ClusterManagerHandler(store, max_watchers=args.max_watchers)
+
+def start_managerd(args):
+  log.info("Starting managerd daemon...")
+
+  handler = make_handler(args)
+
+  # convert any tags still in the old string format and build any
+  # missing indexes in the background
+  migration = threading.Thread(target=handler.upgrade_database,
+                               args=(args.migration_batch,))
+  migration.daemon = True
+  migration.start()
+
+  def make_processor():
+    # fork() copies none of the threads behind a handler's storage
+    # connections, cache and change listener, so each worker of a process
+    # pool makes its own; ours is left running the migration
+    if args.server_model == "processpool":
+      queued_logging.after_fork()
+      return ClusterManager.Processor(make_handler(args))
+    return ClusterManager.Processor(handler)
+
+  transport = TSocket.TServerSocket(port=args.port)
+  tfactory = thrift_stack.transport_factory(args.transport)
+  pfactory = thrift_stack.protocol_factory(args.protocol)
+
+  server = server_models.make_server(args.server_model, args.workers,
+                                     transport, make_processor, tfactory,
+                                     pfactory)
   try:
-    server.serve()
+    server_models.serve(args.server_model, server)
   except KeyboardInterrupt:
     pass
   finally:
     transport.close()
-  print "done"
+  log.info("done")
 
 def main():
   parser = argparse.ArgumentParser(description="Cluster manager daemon")
 
   parser.add_argument("-d", "--debug", action='store_true',
-                      help="debug mode")
+                      help="log every RPC")
+  parser.add_argument("--log_file",
+                      help="where to log, rather than stdout")
+  parser.add_argument("--log_sample", default="",
+                      help="log only one in N calls of the RPCs given as "
+                           "RPC=N,..., e.g. lookup=100")
+  parser.add_argument("--log_queue", type=int, default=10000,
+                      help="log records waiting to be written before more "
+                           "are dropped")
+  parser.add_argument("--storage", choices=["redis", "memory", "sqlite"],
+                      default="redis",
+                      help="where hosts, projects, users and tags are kept")
+  parser.add_argument("--sqlite_path", default="managerd.db",
+                      help="database file for --storage sqlite")
+  parser.add_argument("--change_log_length", type=int, default=10000,
+                      help="changes kept for get_changes(); clients that "
+                           "fall further behind have to resync")
+  parser.add_argument("--cache_size", type=int, default=10000,
+                      help="host records, lookups and queries kept in the "
+                           "read cache (0 disables it)")
+  parser.add_argument("--cache_bypass", action='store_true',
+                      help="start with the read cache bypassed; see the "
+                           "CLI's cache_bypass command")
   parser.add_argument("--redis_server",
                       help="redis server hostname", default="localhost")
+  parser.add_argument("--redis_db", type=int, default=0,
+                      help="redis database number")
+  parser.add_argument("--redis_max_connections", type=int, default=50,
+                      help="redis connections shared by all client threads")
+  parser.add_argument("--redis_pool_timeout", type=float, default=5,
+                      help="seconds a thread waits for a free redis "
+                           "connection before failing")
+  parser.add_argument("--redis_socket_timeout", type=float, default=10,
+                      help="seconds to wait for a redis reply")
+  parser.add_argument("--redis_connect_timeout", type=float, default=5,
+                      help="seconds to wait when connecting to redis")
+  parser.add_argument("--redis_health_check_interval", type=float,
+                      default=30,
+                      help="PING redis connections idle longer than this "
+                           "many seconds before reusing them (0 disables)")
+  parser.add_argument("--materialize_chunk", type=int, default=500,
+                      help="host records fetched per pipelined round trip")
+  parser.add_argument("--scan_count", type=int, default=1000,
+                      help="COUNT hint for incremental SCAN/SSCAN")
+  parser.add_argument("--migration_batch", type=int, default=100,
+                      help="hosts converted per step when migrating tags "
+                           "from the old string format")
+  parser.add_argument("-p", "--port", type=int, default=9090,
+                      help="port to serve thrift on")
+  thrift_stack.add_arguments(parser)
+  server_models.add_arguments(parser)
+  parser.add_argument("--rebuild_indexes", action='store_true',
+                      help="rebuild the lookup indexes from the host records "
+                           "and exit")
   args = parser.parse_args()
-
-  start_managerd(args.debug, args.redis_server)
+  server_models.check_arguments(parser, args)
+  try:
+    sample_rates = queued_logging.parse_sample_rates(args.log_sample)
+  except ValueError as ve:
+    parser.error("--log_sample: %s" % ve)
+  queued_logging.configure(logging.DEBUG if args.debug else logging.INFO,
+                           args.log_file, sample_rates, args.log_queue)
+
+  if args.rebuild_indexes:
+    handler = make_handler(args)
+    handler.migrate_tags(args.migration_batch)
+    handler.rebuild_indexes()
+    return
+
+  start_managerd(args)
 
 if __name__ == "__main__":
   sys.exit(main())
@@ -0,0 +1,290 @@
+#
+# The in-memory storage engine: everything lives in dicts and sets in the
+# managerd process and is lost when it exits.  Meant for tests and for
+# benchmarking the RPC layer without a network round trip per call.
+#
+
+import threading, itertools
+from collections import deque
+
+from ucsd.ttypes import *
+
+import host_query
+from storage import *
+
+class MemoryStorage(Storage):
+  def __init__(self, change_log_length=10000):
+
+    # one lock makes every call atomic, as the redis scripts are
+    self.lock = threading.Lock()
+
+    # name -> record dict, with the same fields as the redis hashes
+    self.host_records = {}
+    self.projects = {}
+    self.users = {}
+
+    # canonical macaddr -> hostname
+    self.macaddrs = {}
+    # project -> set of hostnames; hostname -> set of tags; and back
+    self.project_hosts = {}
+    self.tags_of = {}
+    self.hosts_with = {}
+    # hostnames whose status is AVAILABLE, for host_allocate()
+    self.available = set()
+
+    self.generation_number = 0
+    # (version, op, name, args) of the latest changes, oldest first; the
+    # versions are consecutive
+    self.change_log = deque(maxlen=change_log_length)
+
+  #
+  # hosts, projects and users
+  #
+
+  def host_add(self, hostname, macaddr, status, netboot_enabled):
+    mac = canonical_mac(macaddr)
+    with self.lock:
+      if hostname in self.host_records:
+        return EXISTS
+      if mac in self.macaddrs:
+        return MACADDR_TAKEN
+
+      self.host_records[hostname] = {
+        "name": hostname,
+        "status": status,
+        "owner": '',
+        "assigned_project": '',
+        "netboot_enabled": netboot_enabled,
+        "macaddr": macaddr,
+      }
+      self.macaddrs[mac] = hostname
+      if status == HostStatus.AVAILABLE:
+        self.available.add(hostname)
+      return ADDED
+
+  def host_remove(self, hostname):
+    with self.lock:
+      record = self.host_records.pop(hostname, None)
+      if record is None:
+        return False
+
+      self.__clear_tags(hostname)
+      self.available.discard(hostname)
+      mac = canonical_mac(record["macaddr"])
+      if self.macaddrs.get(mac) == hostname:
+        del self.macaddrs[mac]
+      self.__leave_project(hostname, record["assigned_project"])
+      return True
+
+  def host_exists(self, hostname):
+    return hostname in self.host_records
+
+  def project_add(self, name, nfsserver, nfsroot, kernel, initrd, params):
+    with self.lock:
+      if name in self.projects:
+        return False
+      self.projects[name] = {
+        "name": name,
+        "nfsserver": nfsserver,
+        "nfsroot": nfsroot,
+        "kernel": kernel,
+        "initrd": initrd,
+        "params": params,
+      }
+      return True
+
+  def project_remove(self, name):
+    with self.lock:
+      return self.projects.pop(name, None) is not None
+
+  def user_add(self, username, fullname):
+    with self.lock:
+      if username in self.users:
+        return False
+      self.users[username] = {"name": username, "fullname": fullname}
+      return True
+
+  def user_remove(self, username):
+    with self.lock:
+      return self.users.pop(username, None) is not None
+
+  #
+  # queries
+  #
+
+  def project_names(self):
+    with self.lock:
+      return self.projects.keys()
+
+  def project_host_counts(self):
+    with self.lock:
+      return dict((project, len(self.project_hosts.get(project, ())))
+                  for project in self.projects)
+
+  def host_names(self, project=None, tag=None):
+    with self.lock:
+      if tag:
+        hostnames = set(self.hosts_with.get(tag, ()))
+        if project:
+          hostnames &= self.project_hosts.get(project, set())
+        return hostnames
+      elif project:
+        return set(self.project_hosts.get(project, ()))
+      return self.host_records.keys()
+
+  def host_names_query(self, query):
+    # evaluated on the index sets themselves, which evaluate() leaves be
+    with self.lock:
+      return set(host_query.evaluate(query, self.__index,
+                                     lambda: self.host_records))
+
+  def host_names_page(self, project, tag, cursor, limit):
+    # the cursor is the last name returned; names are handed out in order
+    hostnames = sorted(hostname for hostname in
+                       self.host_names(project, tag) if hostname > cursor)
+    if len(hostnames) <= limit:
+      return (hostnames, "")
+    return (hostnames[:limit], hostnames[limit - 1])
+
+  def hosts(self, hostnames, fields=None):
+    fields = HOST_FIELDS if fields is None else fields
+    hosts = []
+    with self.lock:
+      for hostname in hostnames:
+        record = self.host_records.get(hostname)
+        if record is None:
+          continue
+
+        host = Host()
+        for field in fields:
+          if field == "tags":
+            host.tags = " ".join(sorted(self.tags_of.get(hostname, ())))
+          else:
+            setattr(host, field, record[field])
+        hosts.append(host)
+    return hosts
+
+  def host_tags(self, hostname):
+    with self.lock:
+      if hostname not in self.host_records:
+        return None
+      return set(self.tags_of.get(hostname, ()))
+
+  def lookup(self, macaddr):
+    with self.lock:
+      host = self.macaddrs.get(canonical_mac(macaddr))
+      if host is None:
+        return (None, None, None)
+
+      record = self.host_records[host]
+      if record["status"] != HostStatus.ASSIGNED:
+        return (host, None, None)
+
+      project = record["assigned_project"]
+      p = self.projects.get(project)
+      if p is None:
+        return (host, project, None)
+      return (host, project, (p["kernel"], p["initrd"], p["nfsserver"],
+                              p["nfsroot"], p["params"]))
+
+  def generation(self):
+    return self.generation_number
+
+  def changes(self, since_version, limit):
+    with self.lock:
+      oldest = self.change_log[0][0] if self.change_log else None
+      if not log_covers(since_version, self.generation_number, oldest):
+        return (self.generation_number, None)
+      if oldest is None:
+        return (self.generation_number, [])
+
+      start = max(since_version + 1 - oldest, 0)
+      return (self.generation_number,
+              list(itertools.islice(self.change_log, start, start + limit)))
+
+  #
+  # modifications
+  #
+
+  def record_change(self, op, name, args):
+    with self.lock:
+      self.generation_number += 1
+      self.change_log.append((self.generation_number, op, name, dict(args)))
+      return self.generation_number
+
+  def set_assignment(self, hostname, project, owner, status):
+    with self.lock:
+      record = self.host_records.get(hostname)
+      if record is None:
+        return False
+      self.__assign(hostname, record, project, owner, status)
+      return True
+
+  def host_allocate(self, project, owner, count, query, status):
+    with self.lock:
+      candidates = host_query.evaluate(host_query.restrict_available(query),
+                                       self.__index,
+                                       lambda: self.host_records)
+      claimed = list(itertools.islice(candidates, count))
+      if len(claimed) < count:
+        raise NotEnoughHosts(len(claimed))
+      for hostname in claimed:
+        self.__assign(hostname, self.host_records[hostname], project, owner,
+                      status)
+      return claimed
+
+  def tag_add(self, hostname, tag):
+    with self.lock:
+      if hostname not in self.host_records:
+        return False
+      self.tags_of.setdefault(hostname, set()).add(tag)
+      self.hosts_with.setdefault(tag, set()).add(hostname)
+      return True
+
+  def tag_remove_all(self, hostname):
+    with self.lock:
+      if hostname not in self.host_records:
+        return False
+      self.__clear_tags(hostname)
+      return True
+
+  # the helpers below expect self.lock to be held
+
+  def __index(self, kind, name):
+    # the live index set host_query.evaluate() asks for
+    if kind == "available":
+      return self.available
+    index = self.hosts_with if kind == "tag" else self.project_hosts
+    return index.get(name, frozenset())
+
+  def __assign(self, hostname, record, project, owner, status):
+    if record["assigned_project"] != project:
+      self.__leave_project(hostname, record["assigned_project"])
+    if project:
+      self.project_hosts.setdefault(project, set()).add(hostname)
+
+    # a reassigned host starts out untagged
+    self.__clear_tags(hostname)
+
+    record["assigned_project"] = project
+    record["owner"] = owner
+    record["status"] = status
+    if status == HostStatus.AVAILABLE:
+      self.available.add(hostname)
+    else:
+      self.available.discard(hostname)
+
+  def __clear_tags(self, hostname):
+    for tag in self.tags_of.pop(hostname, ()):
+      hosts = self.hosts_with[tag]
+      hosts.discard(hostname)
+      if not hosts:
+        del self.hosts_with[tag]
+
+  def __leave_project(self, hostname, project):
+    hosts = self.project_hosts.get(project)
+    if hosts is None:
+      return
+    hosts.discard(hostname)
+    if not hosts:
+      del self.project_hosts[project]
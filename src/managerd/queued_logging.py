@@ -0,0 +1,151 @@
+#
+# managerd's logging.
+#
+# The handler and storage engines log through the standard logging module
+# with the arguments left for it to format, so a debug line at a level
+# that is switched off costs a level check and nothing more.  configure()
+# puts a bounded queue in front of the real output: request threads only
+# queue records, and one thread formats and writes them.  If that thread
+# falls behind, records are dropped and counted rather than making
+# requests wait.
+#
+# Every record says which RPC it was logged in and the number of the call,
+# taken from rpc_stats' wrapper, so that one call's lines can be picked
+# out of the interleaving (with the process, as each of the processpool
+# model's workers numbers its own calls):
+#
+#   2026-10-18 12:00:00,123 DEBUG pid=4321 rpc=lookup call=1234 lookup 02:...
+#
+# and the chattiest RPCs can be sampled: with --log_sample lookup=100
+# only every hundredth lookup's debug and info lines are kept, all of that
+# call's lines together.
+#
+# async_managerd logs the same way under Python 3, its calls being tasks
+# rather than threads: it passes configure() a context function of its
+# own.
+#
+
+import atexit, logging, logging.handlers, sys, threading
+try:
+  import Queue
+except ImportError:
+  import queue as Queue
+
+import rpc_stats
+
+FORMAT = ("%(asctime)s %(levelname)s pid=%(process)d rpc=%(rpc)s "
+          "call=%(call)s %(message)s")
+
+def thread_call():
+  # (RPC name, call number) of the call rpc_stats' wrapper is timing on
+  # this thread, each None outside of one
+  return (getattr(rpc_stats.current, "rpc", None),
+          getattr(rpc_stats.current, "call", None))
+
+class CallContextFilter(logging.Filter):
+  # adds rpc and call to each record, and drops those of unsampled calls
+  def __init__(self, sample_rates, context=thread_call):
+    logging.Filter.__init__(self)
+    # RPC name -> keep one call in this many
+    self.sample_rates = sample_rates
+    self.context = context
+
+  def filter(self, record):
+    (rpc, call) = self.context()
+    record.rpc = rpc or "-"
+    record.call = call or "-"
+    rate = self.sample_rates.get(record.rpc)
+    if rate and record.levelno < logging.WARNING:
+      return record.call % rate == 0
+    return True
+
+class QueueHandler(logging.Handler):
+  def __init__(self, queue):
+    logging.Handler.__init__(self)
+    self.queue = queue
+    # records thrown away because the queue was full
+    self.dropped = 0
+
+  def emit(self, record):
+    try:
+      self.queue.put_nowait(record)
+    except Queue.Full:
+      self.dropped += 1
+
+class QueueListener(threading.Thread):
+  # writes the queued records to handler
+  def __init__(self, queue, queue_handler, handler):
+    threading.Thread.__init__(self, name="logging")
+    self.daemon = True
+    self.queue = queue
+    self.queue_handler = queue_handler
+    self.handler = handler
+    self.reported = 0
+
+  def run(self):
+    while True:
+      record = self.queue.get()
+      if record is None:
+        return
+      dropped = self.queue_handler.dropped
+      if dropped != self.reported:
+        self.handler.handle(logging.makeLogRecord({
+          "levelno": logging.WARNING, "levelname": "WARNING",
+          "rpc": "-", "call": "-",
+          "msg": "dropped %d log records" % (dropped - self.reported)}))
+        self.reported = dropped
+      self.handler.handle(record)
+
+  def stop(self):
+    # write out what's queued; the thread gives up at exit otherwise
+    self.queue.put(None)
+    self.join(5)
+
+def parse_sample_rates(text):
+  # "lookup=100,lookup_batch=10" -> {"lookup": 100, "lookup_batch": 10}
+  rates = {}
+  for item in text.split(","):
+    if not item:
+      continue
+    (rpc, sep, rate) = item.partition("=")
+    if not sep or not rate.isdigit() or int(rate) < 1:
+      raise ValueError("expected RPC=N, not %r" % item)
+    rates[rpc] = int(rate)
+  return rates
+
+# the QueueHandler and QueueListener configure() set up
+handler = None
+listener = None
+
+def configure(level, path=None, sample_rates=None, queue_size=10000,
+              context=thread_call):
+  # log at level and above to path (stdout if None) through a queue;
+  # context() gives the (RPC name, call number) a record is logged in
+  global handler, listener
+  if path:
+    # reopens the file when logrotate moves it
+    output = logging.handlers.WatchedFileHandler(path)
+  else:
+    output = logging.StreamHandler(sys.stdout)
+  output.setFormatter(logging.Formatter(FORMAT))
+
+  queue = Queue.Queue(queue_size)
+  handler = QueueHandler(queue)
+  handler.addFilter(CallContextFilter(sample_rates or {}, context))
+  listener = QueueListener(queue, handler, output)
+  listener.start()
+  atexit.register(lambda: listener.stop())
+
+  root = logging.getLogger()
+  root.addHandler(handler)
+  root.setLevel(level)
+
+def after_fork():
+  # a forked process has the queue but not the thread emptying it, so it
+  # gets a queue and thread of its own, writing to the same output
+  global listener
+  if handler is None:
+    return
+  handler.queue = Queue.Queue(handler.queue.maxsize)
+  listener = QueueListener(handler.queue, handler, listener.handler)
+  listener.start()
@@ -0,0 +1,53 @@
+#
+# The keys and channels the redis engine keeps its data in.  Nothing here
+# depends on the Python 2 thrift code, so async_managerd can share it.
+#
+
+# hash of canonical macaddr -> hostname, maintained by host_add/host_remove
+MACADDR_INDEX = "macaddr_index"
+
+# set of the hostnames assigned to a project, maintained by
+# host_assign/host_release/host_remove
+PROJECT_HOSTS = "projhosts_%s"
+
+# a host's tags, and the reverse index of the hosts carrying a tag
+HOST_TAGS = "hosttags_%s"
+TAG_HOSTS = "taghosts_%s"
+
+# set once every host's old space-separated "tags" field has been moved
+# into the tag sets
+TAGS_MIGRATED = "tags_migrated"
+
+# registries of every host, project and user name, maintained by the
+# add/remove calls so that nothing has to enumerate the keyspace
+HOSTS = "hosts"
+PROJECTS = "projects"
+USERS = "users"
+
+# set once rebuild_indexes() has populated the registries and indexes of a
+# database that predates them
+INDEXES_BUILT = "indexes_built"
+
+# set of the hostnames whose status is AVAILABLE, maintained by the
+# host_add and assignment scripts and host_remove, and the marker set once
+# it has been built for a database that predates it
+AVAILABLE_HOSTS = "availhosts"
+AVAILABLE_INDEXED = "available_indexed"
+
+# the inventory generation, INCRed after every change, and a stream of the
+# changes themselves, capped at change_log_length entries
+GENERATION = "generation"
+CHANGES = "changes"
+
+# scratch sets holding the intermediate results of a host query, deleted
+# in the same MULTI that makes them
+QUERY_TEMP = "hostquery_%s_%d"
+
+# pub/sub channels carrying cache invalidations between managerd
+# instances, and the version of every change as it is recorded
+INVALIDATIONS = "managerd_invalidations"
+CHANGE_VERSIONS = "managerd_changes"
+
+def stream_version(entry_id):
+  # change log entries are added with ID <version>-0
+  return int(entry_id.split("-")[0])
@@ -0,0 +1,101 @@
+#
+# A blocking redis connection pool that can tell us whether it is the
+# bottleneck.
+#
+# TThreadedServer runs one thread per client connection, and all of them
+# share the handler's redis client.  This pool caps the number of redis
+# connections, makes threads wait (up to a timeout) for a free one rather
+# than opening more, health-checks connections that have sat idle, and
+# keeps utilization and wait-time counters for get_pool_stats().  Its
+# connections count the round trips of each RPC for get_stats().
+#
+
+import threading, time
+
+import redis
+from redis.exceptions import ConnectionError, TimeoutError
+
+import rpc_stats
+
+class CountedConnection(redis.Connection):
+  # every command, or whole pipeline, is sent with one call of this
+  def send_packed_command(self, *args, **kwargs):
+    rpc_stats.round_trip()
+    return redis.Connection.send_packed_command(self, *args, **kwargs)
+
+class MonitoredConnectionPool(redis.BlockingConnectionPool):
+  def __init__(self, health_check_interval=30, **kwargs):
+    # seconds a connection may sit idle before it is PINGed on checkout;
+    # None or 0 disables the check
+    self.health_check_interval = health_check_interval
+
+    self._stats_lock = threading.Lock()
+    self.in_use = 0
+    self.peak_in_use = 0
+    self.acquired = 0
+    self.acquire_timeouts = 0
+    self.wait_total = 0.0
+    self.wait_max = 0.0
+    self.health_check_failures = 0
+
+    kwargs.setdefault('connection_class', CountedConnection)
+    redis.BlockingConnectionPool.__init__(self, **kwargs)
+
+  def get_connection(self, command_name, *keys, **options):
+    start = time.time()
+    try:
+      connection = redis.BlockingConnectionPool.get_connection(
+        self, command_name, *keys, **options)
+    except ConnectionError:
+      # no connection came free within self.timeout
+      with self._stats_lock:
+        self.acquire_timeouts += 1
+      raise
+    waited = time.time() - start
+
+    with self._stats_lock:
+      self.acquired += 1
+      self.in_use += 1
+      self.peak_in_use = max(self.peak_in_use, self.in_use)
+      self.wait_total += waited
+      self.wait_max = max(self.wait_max, waited)
+
+    self.__check_health(connection)
+    return connection
+
+  def release(self, connection):
+    connection.last_released = time.time()
+    with self._stats_lock:
+      self.in_use -= 1
+    redis.BlockingConnectionPool.release(self, connection)
+
+  def __check_health(self, connection):
+    last_released = getattr(connection, 'last_released', None)
+    if (not self.health_check_interval or last_released is None or
+        time.time() - last_released < self.health_check_interval):
+      return
+
+    try:
+      connection.send_command('PING')
+      connection.read_response()
+    except (ConnectionError, TimeoutError):
+      # drop the dead socket; the next command transparently reconnects
+      connection.disconnect()
+      with self._stats_lock:
+        self.health_check_failures += 1
+
+  def stats(self):
+    with self._stats_lock:
+      acquired = self.acquired
+      return {
+        'max_connections': float(self.max_connections),
+        'open_connections': float(len(self._connections)),
+        'in_use': float(self.in_use),
+        'peak_in_use': float(self.peak_in_use),
+        'utilization': float(self.in_use) / self.max_connections,
+        'acquired': float(acquired),
+        'acquire_timeouts': float(self.acquire_timeouts),
+        'wait_avg_ms': 1000.0 * self.wait_total / acquired if acquired else 0.0,
+        'wait_max_ms': 1000.0 * self.wait_max,
+        'health_check_failures': float(self.health_check_failures),
+      }
@@ -0,0 +1,288 @@
+#
+# Lua scripts run inside redis by managerd.  Each one performs a whole RPC
+# in a single round trip, and because redis runs a script atomically no
+# other client can observe it half done or interleave with its checks.
+#
+# They are registered with redis.Redis.register_script(), which calls
+# EVALSHA and falls back to loading the script on NOSCRIPT.
+#
+# These scripts need a single redis instance, not Redis Cluster.  Some
+# touch keys they only learn while running, so those keys can't be
+# declared in KEYS: LOOKUP reads the host_ and project_ records that the
+# macaddr index points it to, and HOST_SET_ASSIGNMENT, HOST_ALLOCATE and
+# HOST_REMOVE update the projhosts_ and taghosts_ sets of whatever project
+# and tags the host had.  They are given key name prefixes in ARGV for
+# this.  Redis Cluster routes a script by its KEYS, and these keys can
+# hash to any slot.
+#
+
+# KEYS: host_<name>, macaddr index, hosts registry, available hosts set
+# ARGV: name, macaddr, canonical macaddr, status, netboot_enabled,
+#       available status
+# returns 1 if added, 0 if the host exists, -1 if the macaddr is taken
+HOST_ADD = """
+if redis.call('exists', KEYS[1]) == 1 then
+  return 0
+end
+if redis.call('hexists', KEYS[2], ARGV[3]) == 1 then
+  return -1
+end
+redis.call('hmset', KEYS[1],
+           'name', ARGV[1],
+           'status', ARGV[4],
+           'owner', '',
+           'assigned_project', '',
+           'netboot_enabled', ARGV[5],
+           'macaddr', ARGV[2])
+redis.call('hset', KEYS[2], ARGV[3], ARGV[1])
+redis.call('sadd', KEYS[3], ARGV[1])
+if tonumber(ARGV[4]) == tonumber(ARGV[6]) then
+  redis.call('sadd', KEYS[4], ARGV[1])
+end
+return 1
+"""
+
+# KEYS: project_<name>, projects registry
+# ARGV: name, nfsserver, nfsroot, kernel, initrd, params
+# returns 1 if added, 0 if the project exists
+PROJECT_ADD = """
+if redis.call('exists', KEYS[1]) == 1 then
+  return 0
+end
+redis.call('hmset', KEYS[1],
+           'name', ARGV[1],
+           'nfsserver', ARGV[2],
+           'nfsroot', ARGV[3],
+           'kernel', ARGV[4],
+           'initrd', ARGV[5],
+           'params', ARGV[6])
+redis.call('sadd', KEYS[2], ARGV[1])
+return 1
+"""
+
+# KEYS: user_<name>, users registry
+# ARGV: name, fullname
+# returns 1 if added, 0 if the user exists
+USER_ADD = """
+if redis.call('exists', KEYS[1]) == 1 then
+  return 0
+end
+redis.call('hmset', KEYS[1], 'name', ARGV[1], 'fullname', ARGV[2])
+redis.call('sadd', KEYS[2], ARGV[1])
+return 1
+"""
+
+# Used by both project_remove and user_remove.
+# KEYS: project_<name> or user_<name>, projects or users registry
+# ARGV: name
+# returns 1 if removed, 0 if there is no such record
+REMOVE = """
+if redis.call('del', KEYS[1]) == 0 then
+  return 0
+end
+redis.call('srem', KEYS[2], ARGV[1])
+return 1
+"""
+
+# Removes a host's tags from both sides of the tag index, and its old
+# space-separated "tags" field.
+CLEAR_TAGS = """
+local function clear_tags(hkey, tkey, name, tag_prefix)
+  for _, tag in ipairs(redis.call('smembers', tkey)) do
+    redis.call('srem', tag_prefix .. tag, name)
+  end
+  redis.call('del', tkey)
+  redis.call('hdel', hkey, 'tags')
+end
+"""
+
+# KEYS: host_<name>, hosttags_<name>, macaddr index, hosts registry,
+#       available hosts set
+# ARGV: name, project set prefix, tag set prefix
+# returns 1 if removed, 0 if the host doesn't exist
+HOST_REMOVE = CLEAR_TAGS + """
+if redis.call('exists', KEYS[1]) == 0 then
+  return 0
+end
+local h = redis.call('hmget', KEYS[1], 'macaddr', 'assigned_project')
+
+clear_tags(KEYS[1], KEYS[2], ARGV[1], ARGV[3])
+redis.call('del', KEYS[1])
+redis.call('srem', KEYS[4], ARGV[1])
+redis.call('srem', KEYS[5], ARGV[1])
+if h[1] then
+  -- storage.canonical_mac()
+  local mac = string.lower(string.match(h[1], '^%s*(.-)%s*$'))
+  if redis.call('hget', KEYS[3], mac) == ARGV[1] then
+    redis.call('hdel', KEYS[3], mac)
+  end
+end
+if h[2] and h[2] ~= '' then
+  redis.call('srem', ARGV[2] .. h[2], ARGV[1])
+end
+return 1
+"""
+
+# KEYS: host_<name>, hosttags_<name>, taghosts_<tag>
+# ARGV: name, tag
+# returns 1 if tagged, 0 if the host doesn't exist
+TAG_ADD = """
+if redis.call('exists', KEYS[1]) == 0 then
+  return 0
+end
+redis.call('sadd', KEYS[2], ARGV[2])
+redis.call('sadd', KEYS[3], ARGV[1])
+return 1
+"""
+
+# KEYS: host_<name>, hosttags_<name>
+# ARGV: name, tag set prefix
+# returns 1 if the tags were removed, 0 if the host doesn't exist
+TAG_REMOVE_ALL = CLEAR_TAGS + """
+if redis.call('exists', KEYS[1]) == 0 then
+  return 0
+end
+clear_tags(KEYS[1], KEYS[2], ARGV[1], ARGV[2])
+return 1
+"""
+
+# The assignment shared by HOST_SET_ASSIGNMENT and HOST_ALLOCATE.  Moves
+# the host between project membership sets and in or out of the available
+# set, and clears its tags, as a reassigned host starts out untagged.
+ASSIGN = CLEAR_TAGS + """
+local function assign(hkey, tkey, available_key, name, project, owner,
+                      status, available, project_prefix, tag_prefix)
+  local old = redis.call('hget', hkey, 'assigned_project')
+  if old and old ~= '' and old ~= project then
+    redis.call('srem', project_prefix .. old, name)
+  end
+  if project ~= '' then
+    redis.call('sadd', project_prefix .. project, name)
+  end
+
+  clear_tags(hkey, tkey, name, tag_prefix)
+
+  redis.call('hmset', hkey,
+             'assigned_project', project,
+             'owner', owner,
+             'status', status)
+  if tonumber(status) == tonumber(available) then
+    redis.call('sadd', available_key, name)
+  else
+    redis.call('srem', available_key, name)
+  end
+end
+"""
+
+# Used by both host_assign and host_release (with an empty project and
+# owner).
+# KEYS: host_<name>, hosttags_<name>, available hosts set
+# ARGV: name, project, owner, status, project set prefix, tag set prefix,
+#       available status
+# returns 1, or 0 if the host doesn't exist
+HOST_SET_ASSIGNMENT = ASSIGN + """
+if redis.call('exists', KEYS[1]) == 0 then
+  return 0
+end
+
+assign(KEYS[1], KEYS[2], KEYS[3], ARGV[1], ARGV[2], ARGV[3], ARGV[4],
+       ARGV[7], ARGV[5], ARGV[6])
+return 1
+"""
+
+# Claims count of the hosts in a candidate set, all or none.  Picking with
+# SRANDMEMBER costs O(count) however big the set is.  The candidates are
+# checked against their records, so that a stale entry (say from an index
+# rebuild racing an assignment) is dropped rather than claimed.
+# KEYS: candidate set (the available set, or a subset of it), available
+#       hosts set
+# ARGV: count, project, owner, status, project set prefix, tag set prefix,
+#       host key prefix, host tags prefix, available status
+# returns the names claimed, or, if there are fewer than count candidates,
+# how many there are
+HOST_ALLOCATE = ASSIGN + """
+local want = tonumber(ARGV[1])
+local picked = {}
+local chosen = {}
+while #picked < want do
+  local stale = 0
+  for _, name in ipairs(redis.call('srandmember', KEYS[1], want)) do
+    if #picked < want and not chosen[name] then
+      local status = redis.call('hget', ARGV[7] .. name, 'status')
+      if status and tonumber(status) == tonumber(ARGV[9]) then
+        chosen[name] = true
+        table.insert(picked, name)
+      else
+        redis.call('srem', KEYS[1], name)
+        redis.call('srem', KEYS[2], name)
+        stale = stale + 1
+      end
+    end
+  end
+  -- without stale entries, SRANDMEMBER gave us as many as there are
+  if stale == 0 then
+    break
+  end
+end
+if #picked < want then
+  return #picked
+end
+
+for _, name in ipairs(picked) do
+  assign(ARGV[7] .. name, ARGV[8] .. name, KEYS[2], name, ARGV[2], ARGV[3],
+         ARGV[4], ARGV[9], ARGV[5], ARGV[6])
+end
+return picked
+"""
+
+# The stream entry ID of a change is its version, so that XRANGE can
+# start right after the version a client has seen.  The version is then
+# published, to wake every managerd's watch() callers.
+# KEYS: generation counter, change log stream
+# ARGV: log length, notification channel, op, name, then the change's
+#       arguments as field, value pairs
+# returns the change's version
+RECORD_CHANGE = """
+local version = redis.call('incr', KEYS[1])
+
+local last = redis.call('xrevrange', KEYS[2], '+', '-', 'COUNT', 1)[1]
+if last then
+  local logged = tonumber(string.match(last[1], '^%d+'))
+  if logged >= version then
+    -- the counter went backwards, say restored from an older dump than
+    -- the log; versions have to keep increasing
+    version = logged + 1
+    redis.call('set', KEYS[1], version)
+  end
+end
+
+redis.call('xadd', KEYS[2], 'MAXLEN', '~', ARGV[1], version .. '-0',
+           'op', ARGV[3], 'name', ARGV[4], unpack(ARGV, 5))
+redis.call('publish', ARGV[2], version)
+return version
+"""
+
+# KEYS: macaddr index
+# ARGV: canonical macaddr, host key prefix, project key prefix,
+#       assigned status
+# returns nil if no host has the macaddr, {host} if it isn't assigned,
+# {host, project} if the project doesn't exist, otherwise
+# {host, project, kernel, initrd, nfsserver, nfsroot, params}
+LOOKUP = """
+local host = redis.call('hget', KEYS[1], ARGV[1])
+if not host then
+  return nil
+end
+
+local h = redis.call('hmget', ARGV[2] .. host, 'status', 'assigned_project')
+if tonumber(h[1]) ~= tonumber(ARGV[4]) then
+  return {host}
+end
+
+local p = redis.call('hmget', ARGV[3] .. h[2], 'name', 'kernel', 'initrd',
+                     'nfsserver', 'nfsroot', 'params')
+if not p[1] then
+  return {host, h[2]}
+end
+return {host, h[2], p[2], p[3], p[4], p[5], p[6]}
+"""
@@ -0,0 +1,736 @@
+#
+# The redis storage engine.
+#
+
+import logging, sys, threading, time, uuid
+
+import redis
+from redis.exceptions import ConnectionError, TimeoutError
+
+from ucsd.ttypes import *
+
+import host_query
+import redis_scripts
+from redis_keys import *
+from redis_pool import MonitoredConnectionPool
+from storage import *
+
+log = logging.getLogger(__name__)
+
+class RedisStorage(Storage):
+  def __init__(self, servername, materialize_chunk=500,
+               scan_count=1000, db=0, pool=None, change_log_length=10000):
+    self.redis_server = servername
+    # hosts fetched per pipelined round trip when building Host records
+    self.materialize_chunk = materialize_chunk
+    # COUNT hint for SCAN/SSCAN, bounding the work redis does per call
+    self.scan_count = scan_count
+    self.change_log_length = change_log_length
+    self.indexes_built = False
+    self.available_indexed = False
+
+    # channel -> callbacks for its messages, served by one listener thread
+    self.listeners = {}
+    self.listener_lock = threading.Lock()
+    self.listener = None
+
+    if pool is not None:
+      self.r_server = redis.Redis(connection_pool=pool)
+    else:
+      self.r_server = redis.Redis(self.redis_server, db=db)
+
+    try:
+      # Redis doesn't actually detect failures until a command is issued,
+      # and so we issue a dummy command here to fail fast if the
+      # server isn't there
+      self.r_server.ping()
+    except ConnectionError as ce:
+      log.error("Error connecting to redis server: %s", ce)
+      log.error("Are you running a redis server on host %s?",
+                self.redis_server)
+      sys.exit(1)
+
+    self.host_add_script = self.__load_script(redis_scripts.HOST_ADD)
+    self.project_add_script = self.__load_script(redis_scripts.PROJECT_ADD)
+    self.user_add_script = self.__load_script(redis_scripts.USER_ADD)
+    self.remove_script = self.__load_script(redis_scripts.REMOVE)
+    self.host_remove_script = self.__load_script(redis_scripts.HOST_REMOVE)
+    self.tag_add_script = self.__load_script(redis_scripts.TAG_ADD)
+    self.tag_remove_all_script = self.__load_script(
+      redis_scripts.TAG_REMOVE_ALL)
+    self.assignment_script = self.__load_script(
+      redis_scripts.HOST_SET_ASSIGNMENT)
+    self.allocate_script = self.__load_script(redis_scripts.HOST_ALLOCATE)
+    self.lookup_script = self.__load_script(redis_scripts.LOOKUP)
+    self.record_change_script = self.__load_script(
+      redis_scripts.RECORD_CHANGE)
+
+  def __load_script(self, source):
+    # preload so that the first call is already a plain EVALSHA; the
+    # Script object reloads it on NOSCRIPT should redis restart
+    script = self.r_server.register_script(source)
+    self.r_server.script_load(source)
+    return script
+
+  def pool_stats(self):
+    pool = self.r_server.connection_pool
+    if not isinstance(pool, MonitoredConnectionPool):
+      return {}
+    return pool.stats()
+
+  #
+  # hosts, projects and users
+  #
+
+  def host_add(self, hostname, macaddr, status, netboot_enabled):
+    return self.host_add_script(
+      keys=["host_%s" % hostname, MACADDR_INDEX, HOSTS, AVAILABLE_HOSTS],
+      args=[hostname, macaddr, canonical_mac(macaddr), status,
+            netboot_enabled, HostStatus.AVAILABLE],
+      client=self.r_server)
+
+  def host_add_batch(self, hosts, status, netboot_enabled):
+    # every host_add script in one pipelined round trip; each is atomic on
+    # its own and they run in order, so a repeated name or macaddr later
+    # in the batch sees the earlier one
+    pipe = self.r_server.pipeline(transaction=False)
+    for (hostname, macaddr) in hosts:
+      self.host_add_script(
+        keys=["host_%s" % hostname, MACADDR_INDEX, HOSTS, AVAILABLE_HOSTS],
+        args=[hostname, macaddr, canonical_mac(macaddr), status,
+              netboot_enabled, HostStatus.AVAILABLE],
+        client=pipe)
+    return pipe.execute()
+
+  def host_remove(self, hostname):
+    # one script, so that a concurrent host_assign or tag_add can't leave
+    # the name behind in a project or tag set
+    return bool(self.host_remove_script(
+      keys=["host_%s" % hostname, HOST_TAGS % hostname, MACADDR_INDEX,
+            HOSTS, AVAILABLE_HOSTS],
+      args=[hostname, PROJECT_HOSTS % "", TAG_HOSTS % ""],
+      client=self.r_server))
+
+  def host_exists(self, hostname):
+    return self.r_server.exists("host_%s" % hostname)
+
+  def project_add(self, name, nfsserver, nfsroot, kernel, initrd, params):
+    return bool(self.project_add_script(
+      keys=["project_%s" % name, PROJECTS],
+      args=[name, nfsserver, nfsroot, kernel, initrd, params],
+      client=self.r_server))
+
+  def project_remove(self, name):
+    return bool(self.remove_script(keys=["project_%s" % name, PROJECTS],
+                                   args=[name], client=self.r_server))
+
+  def user_add(self, username, fullname):
+    return bool(self.user_add_script(keys=["user_%s" % username, USERS],
+                                     args=[username, fullname],
+                                     client=self.r_server))
+
+  def user_remove(self, username):
+    return bool(self.remove_script(keys=["user_%s" % username, USERS],
+                                   args=[username], client=self.r_server))
+
+  #
+  # queries
+  #
+
+  def __names(self, registry, prefix):
+    # every name in a registry, read incrementally with SSCAN; until the
+    # registries have been built, fall back to SCANning the records
+    if not self.indexes_built:
+      self.indexes_built = self.r_server.exists(INDEXES_BUILT)
+    if self.indexes_built:
+      return self.r_server.sscan_iter(registry, count=self.scan_count)
+    return (key[len(prefix):] for key in
+            self.r_server.scan_iter(prefix + "*", count=self.scan_count))
+
+  def project_names(self):
+    return list(self.__names(PROJECTS, "project_"))
+
+  def project_host_counts(self):
+    projects = self.project_names()
+    pipe = self.r_server.pipeline(transaction=False)
+    for project in projects:
+      pipe.scard(PROJECT_HOSTS % project)
+    return dict(zip(projects, pipe.execute()))
+
+  def host_names(self, project=None, tag=None):
+    if tag:
+      # hosts with that tag, limited to the project if one was given
+      if project:
+        hostnames = self.r_server.sinter(TAG_HOSTS % tag,
+                                         PROJECT_HOSTS % project)
+      else:
+        hostnames = self.r_server.smembers(TAG_HOSTS % tag)
+
+      if not self.r_server.exists(TAGS_MIGRATED):
+        legacy = self.__legacy_tagged_hosts(tag)
+        if project:
+          legacy &= self.r_server.smembers(PROJECT_HOSTS % project)
+        hostnames |= legacy
+
+      return hostnames
+    elif project:
+      # only the hosts in that project
+      return self.r_server.smembers(PROJECT_HOSTS % project)
+    else:
+      # all hosts
+      return self.__names(HOSTS, "host_")
+
+  def host_names_query(self, query):
+    # evaluated inside redis, in one MULTI: each operator stores its result
+    # in a scratch set, and only the final set comes back
+    if not self.indexes_built:
+      self.indexes_built = self.r_server.exists(INDEXES_BUILT)
+    if not self.indexes_built or not self.r_server.exists(TAGS_MIGRATED):
+      # the sets don't cover every host yet
+      return Storage.host_names_query(self, query)
+
+    pipe = self.r_server.pipeline(transaction=True)
+    scratch = []
+    key = self.__query_key(pipe, query, uuid.uuid4().hex, scratch)
+    pipe.smembers(key)
+    if scratch:
+      pipe.delete(*scratch)
+      return pipe.execute()[-2]
+    return pipe.execute()[-1]
+
+  def __query_key(self, pipe, expr, query_id, scratch):
+    # the key of a set holding what expr selects, queuing whatever
+    # commands make it
+    op = expr[0]
+    if op == "tag":
+      return TAG_HOSTS % expr[1]
+    elif op == "project":
+      return PROJECT_HOSTS % expr[1]
+    elif op == "available":
+      return AVAILABLE_HOSTS
+
+    if op == "not":
+      (positive, negated) = ([], [expr[1]])
+    elif op == "and":
+      (positive, negated) = host_query.split_and(expr[1])
+    else:
+      positive = expr[1]
+
+    keys = [self.__query_key(pipe, operand, query_id, scratch)
+            for operand in positive]
+    key = QUERY_TEMP % (query_id, len(scratch))
+    scratch.append(key)
+    if op == "or":
+      pipe.sunionstore(key, keys)
+      return key
+
+    # an "and" has at least two operands, so with fewer than two positive
+    # ones there's something to subtract
+    if len(keys) > 1:
+      pipe.sinterstore(key, keys)
+      source = key
+    else:
+      source = keys[0] if keys else HOSTS
+    excluded = [self.__query_key(pipe, operand, query_id, scratch)
+                for operand in negated]
+    if excluded:
+      pipe.sdiffstore(key, [source] + excluded)
+    return key
+
+  def host_names_page(self, project, tag, cursor, limit):
+    # the cursor is the redis SSCAN/SCAN cursor, prefixed with which of
+    # the two the iteration started with
+    if cursor:
+      try:
+        (kind, position) = cursor.split(":", 1)
+        position = int(position)
+      except ValueError:
+        raise ValueError("bad cursor %r" % cursor)
+    else:
+      if not self.indexes_built:
+        self.indexes_built = self.r_server.exists(INDEXES_BUILT)
+      migrated = not tag or self.r_server.exists(TAGS_MIGRATED)
+      (kind, position) = ("s" if self.indexes_built and migrated else "k", 0)
+
+    if kind == "s":
+      # walk the smallest index set that covers the filter, and check the
+      # other one for each name
+      if tag:
+        (key, check) = (TAG_HOSTS % tag,
+                        PROJECT_HOSTS % project if project else None)
+      elif project:
+        (key, check) = (PROJECT_HOSTS % project, None)
+      else:
+        (key, check) = (HOSTS, None)
+      (position, hostnames) = self.r_server.sscan(key, position, count=limit)
+
+      if check and hostnames:
+        pipe = self.r_server.pipeline(transaction=False)
+        for hostname in hostnames:
+          pipe.sismember(check, hostname)
+        hostnames = [hostname for (hostname, member)
+                     in zip(hostnames, pipe.execute()) if member]
+    elif kind == "k":
+      # registries or tag sets not built yet: walk the keyspace and check
+      # each record
+      (position, hkeys) = self.r_server.scan(position, match="host_*",
+                                             count=limit)
+      hostnames = [hkey[len("host_"):] for hkey in hkeys]
+      if (project or tag) and hostnames:
+        hostnames = self.__filter_hosts(hostnames, project, tag)
+    else:
+      raise ValueError("bad cursor %r" % cursor)
+
+    return (hostnames, "%s:%d" % (kind, position) if position else "")
+
+  def __filter_hosts(self, hostnames, project, tag):
+    pipe = self.r_server.pipeline(transaction=False)
+    for hostname in hostnames:
+      pipe.hmget("host_%s" % hostname, "assigned_project", "tags")
+      pipe.smembers(HOST_TAGS % hostname)
+    replies = pipe.execute()
+
+    matching = []
+    for (j, hostname) in enumerate(hostnames):
+      ((assigned, old_tags), tags) = (replies[2*j], replies[2*j + 1])
+      if project and assigned != project:
+        continue
+      if tag and tag not in tags | split_legacy_tags(old_tags):
+        continue
+      matching.append(hostname)
+    return matching
+
+  def __legacy_tagged_hosts(self, tag):
+    # hosts whose tags are still in the old string field; only consulted
+    # until migrate_tags() has finished
+    hostnames = set()
+    for hkey in self.r_server.scan_iter("host_*", count=self.scan_count):
+      if tag in split_legacy_tags(self.r_server.hget(hkey, "tags")):
+        hostnames.add(hkey[len("host_"):])
+    return hostnames
+
+  def hosts(self, hostnames, fields=None):
+    hosts = []
+
+    # only the hash fields asked for (name tells us the host exists, and
+    # "tags" is the old string field), and the tag set only if tags are
+    fields = HOST_FIELDS if fields is None else fields
+    hfields = ["name"] + [field for field in fields if field != "name"]
+    with_tags = "tags" in fields
+    replies_per_host = 2 if with_tags else 1
+
+    # one pipelined round trip per chunk
+    hostnames = list(hostnames)
+    for i in xrange(0, len(hostnames), self.materialize_chunk):
+      chunk = hostnames[i:i + self.materialize_chunk]
+
+      pipe = self.r_server.pipeline(transaction=False)
+      for hostname in chunk:
+        pipe.hmget("host_%s" % hostname, hfields)
+        if with_tags:
+          pipe.smembers(HOST_TAGS % hostname)
+      replies = pipe.execute()
+
+      for j, hostname in enumerate(chunk):
+        record = dict(zip(hfields, replies[replies_per_host*j]))
+        if record["name"] is None:
+          # removed since the caller listed it
+          continue
+
+        host = Host()
+
+        host.name = record["name"]
+        if "status" in record:
+          status = int(record["status"] or HostStatus.UNKNOWN)
+          if status in HostStatus._VALUES_TO_NAMES:
+            host.status = status
+          else:
+            log.warning("bad status value %d in host %s", status, hostname)
+
+        host.owner = record.get("owner")
+        host.assigned_project = record.get("assigned_project")
+        if "netboot_enabled" in record:
+          host.netboot_enabled = record["netboot_enabled"] == str(True)
+        host.macaddr = record.get("macaddr")
+        if with_tags:
+          tags = replies[replies_per_host*j + 1]
+          tags |= split_legacy_tags(record["tags"])
+          host.tags = " ".join(sorted(tags))
+
+        hosts.append(host)
+
+    return hosts
+
+  def host_tags(self, hostname):
+    pipe = self.r_server.pipeline(transaction=False)
+    pipe.exists("host_%s" % hostname)
+    pipe.smembers(HOST_TAGS % hostname)
+    pipe.hget("host_%s" % hostname, "tags")
+    (exists, tags, old_tags) = pipe.execute()
+    if not exists:
+      return None
+    return tags | split_legacy_tags(old_tags)
+
+  def lookup(self, macaddr):
+    # resolve the macaddr through the host to its project's boot
+    # configuration in a single round trip
+    return self.__lookup_result(self.__lookup(self.r_server, macaddr))
+
+  def lookup_batch(self, macaddrs):
+    # every lookup script in one pipelined round trip
+    pipe = self.r_server.pipeline(transaction=False)
+    for macaddr in macaddrs:
+      self.__lookup(pipe, macaddr)
+    return [self.__lookup_result(reply) for reply in pipe.execute()]
+
+  def __lookup(self, client, macaddr):
+    return self.lookup_script(
+      keys=[MACADDR_INDEX],
+      args=[canonical_mac(macaddr), "host_", "project_", HostStatus.ASSIGNED],
+      client=client)
+
+  def __lookup_result(self, reply):
+    if reply is None:
+      return (None, None, None)
+    elif len(reply) == 1:
+      return (reply[0], None, None)
+    elif len(reply) == 2:
+      return (reply[0], reply[1], None)
+    return (reply[0], reply[1], tuple(reply[2:]))
+
+  def generation(self):
+    return int(self.r_server.get(GENERATION) or 0)
+
+  def changes(self, since_version, limit):
+    pipe = self.r_server.pipeline(transaction=False)
+    pipe.get(GENERATION)
+    pipe.execute_command("XRANGE", CHANGES, "-", "+", "COUNT", 1)
+    pipe.execute_command("XRANGE", CHANGES, "%d-0" % max(since_version + 1, 0),
+                         "+", "COUNT", limit)
+    (generation, oldest, entries) = pipe.execute()
+
+    generation = int(generation or 0)
+    oldest = stream_version(oldest[0][0]) if oldest else None
+    if not log_covers(since_version, generation, oldest):
+      return (generation, None)
+
+    changes = []
+    for (entry_id, fields) in entries:
+      args = dict(zip(fields[::2], fields[1::2]))
+      changes.append((stream_version(entry_id), args.pop("op"),
+                      args.pop("name"), args))
+    return (generation, changes)
+
+  #
+  # modifications
+  #
+
+  def record_change(self, op, name, args):
+    return self.__record_change(self.r_server, op, name, args)
+
+  def record_changes(self, changes):
+    if not changes:
+      return []
+    pipe = self.r_server.pipeline(transaction=False)
+    for (op, name, args) in changes:
+      self.__record_change(pipe, op, name, args)
+    return pipe.execute()
+
+  def __record_change(self, client, op, name, args):
+    fields = []
+    for field in sorted(args):
+      fields += [field, args[field]]
+    return self.record_change_script(
+      keys=[GENERATION, CHANGES],
+      args=[self.change_log_length, CHANGE_VERSIONS, op, name] + fields,
+      client=client)
+
+  def set_assignment(self, hostname, project, owner, status):
+    # one atomic script: project membership sets, tags and the host record
+    return bool(self.__set_assignment(self.r_server, hostname, project,
+                                      owner, status))
+
+  def set_assignment_batch(self, assignments, status):
+    pipe = self.r_server.pipeline(transaction=False)
+    for (hostname, project, owner) in assignments:
+      self.__set_assignment(pipe, hostname, project, owner, status)
+    return [bool(assigned) for assigned in pipe.execute()]
+
+  def __set_assignment(self, client, hostname, project, owner, status):
+    return self.assignment_script(
+      keys=["host_%s" % hostname, HOST_TAGS % hostname, AVAILABLE_HOSTS],
+      args=[hostname, project, owner, status, PROJECT_HOSTS % "",
+            TAG_HOSTS % "", HostStatus.AVAILABLE],
+      client=client)
+
+  def host_allocate(self, project, owner, count, query, status):
+    # one MULTI: narrow the available set down by the constraints, as
+    # host_names_query() does, then claim from it in one script
+    if not self.available_indexed:
+      self.available_indexed = self.r_server.exists(AVAILABLE_INDEXED)
+      if not self.available_indexed:
+        self.__rebuild_available()
+
+    pipe = self.r_server.pipeline(transaction=True)
+    scratch = []
+    key = self.__query_key(pipe, host_query.restrict_available(query),
+                           uuid.uuid4().hex, scratch)
+    self.allocate_script(
+      keys=[key, AVAILABLE_HOSTS],
+      args=[count, project, owner, status, PROJECT_HOSTS % "",
+            TAG_HOSTS % "", "host_", HOST_TAGS % "", HostStatus.AVAILABLE],
+      client=pipe)
+    if scratch:
+      pipe.delete(*scratch)
+      claimed = pipe.execute()[-2]
+    else:
+      claimed = pipe.execute()[-1]
+
+    if not isinstance(claimed, list):
+      raise NotEnoughHosts(claimed)
+    return claimed
+
+  def tag_add(self, hostname, tag):
+    # checks the host and tags it in one script, so that a concurrent
+    # host_remove can't leave the tag behind for a new host of that name
+    return bool(self.__tag_add(self.r_server, hostname, tag))
+
+  def tag_add_batch(self, tags):
+    # every tag_add script in one pipelined round trip
+    pipe = self.r_server.pipeline(transaction=False)
+    for (hostname, tag) in tags:
+      self.__tag_add(pipe, hostname, tag)
+    return [bool(tagged) for tagged in pipe.execute()]
+
+  def __tag_add(self, client, hostname, tag):
+    return self.tag_add_script(
+      keys=["host_%s" % hostname, HOST_TAGS % hostname, TAG_HOSTS % tag],
+      args=[hostname, tag],
+      client=client)
+
+  def tag_remove_all(self, hostname):
+    return bool(self.tag_remove_all_script(
+      keys=["host_%s" % hostname, HOST_TAGS % hostname],
+      args=[hostname, TAG_HOSTS % ""],
+      client=self.r_server))
+
+  #
+  # cache invalidation
+  #
+
+  def publish_invalidation(self, message):
+    self.r_server.publish(INVALIDATIONS, message)
+
+  def listen_invalidations(self, callback):
+    self.__listen_to(INVALIDATIONS, callback)
+
+  def listen_changes(self, callback):
+    self.__listen_to(CHANGE_VERSIONS,
+                     lambda version: callback(version and int(version)))
+
+  def __listen_to(self, channel, callback):
+    with self.listener_lock:
+      self.listeners.setdefault(channel, []).append(callback)
+      if self.listener is None:
+        self.listener = threading.Thread(target=self.__listen)
+        self.listener.daemon = True
+        self.listener.start()
+
+  def __notify(self, channel, message):
+    with self.listener_lock:
+      callbacks = list(self.listeners.get(channel, ()))
+    for callback in callbacks:
+      callback(message)
+
+  def __listen(self):
+    # one subscription to both channels, holding one of the pool's
+    # connections for good however many callbacks there are
+    pubsub = self.r_server.pubsub()
+    while True:
+      try:
+        if not pubsub.subscribed:
+          pubsub.subscribe(INVALIDATIONS, CHANGE_VERSIONS)
+        message = pubsub.get_message(timeout=1.0)
+      except (ConnectionError, TimeoutError) as ce:
+        # the pubsub reconnects and resubscribes on the next call
+        log.warning("lost the redis notification channels: %s", ce)
+        for channel in (INVALIDATIONS, CHANGE_VERSIONS):
+          self.__notify(channel, None)
+        time.sleep(1)
+        continue
+
+      if message is None:
+        continue
+      elif message["type"] == "subscribe":
+        # (re)subscribed: anything published while we weren't is lost
+        self.__notify(message["channel"], None)
+      elif message["type"] == "message":
+        self.__notify(message["channel"], message["data"])
+
+  #
+  # maintenance
+  #
+
+  def rebuild_indexes(self):
+    # rebuild the registries and index keys from the records, for
+    # databases created before they existed
+    log.debug("rebuild_indexes")
+
+    for (registry, prefix) in ((HOSTS, "host_"), (PROJECTS, "project_"),
+                               (USERS, "user_")):
+      self.__rebuild_registry(registry, prefix)
+
+    macs = {}
+    members = {}
+    for hkey in self.r_server.scan_iter("host_*", count=self.scan_count):
+      hostname = hkey[len("host_"):]
+      (macaddr, project) = self.r_server.hmget(hkey, "macaddr",
+                                               "assigned_project")
+      if project:
+        members.setdefault(project, []).append(hostname)
+      if not macaddr:
+        continue
+      mac = canonical_mac(macaddr)
+      if mac in macs:
+        log.warning("mac %s claimed by both %s and %s, keeping %s",
+                    mac, macs[mac], hostname, macs[mac])
+        continue
+      macs[mac] = hostname
+
+    # build the new index off to the side and swap it in atomically
+    tmpkey = MACADDR_INDEX + "_rebuild"
+    self.r_server.delete(tmpkey)
+    if macs:
+      self.r_server.hmset(tmpkey, macs)
+      self.r_server.rename(tmpkey, MACADDR_INDEX)
+    else:
+      self.r_server.delete(MACADDR_INDEX)
+    log.debug("  indexed %d macaddrs", len(macs))
+
+    pipe = self.r_server.pipeline()
+    for pkey in self.r_server.scan_iter(PROJECT_HOSTS % "*",
+                                        count=self.scan_count):
+      pipe.delete(pkey)
+    for project, hostnames in members.items():
+      pipe.sadd(PROJECT_HOSTS % project, *hostnames)
+    pipe.execute()
+    log.debug("  indexed %d projects", len(members))
+
+    tagged = {}
+    for tkey in self.r_server.scan_iter(HOST_TAGS % "*",
+                                        count=self.scan_count):
+      hostname = tkey[len(HOST_TAGS % ""):]
+      for tag in self.r_server.smembers(tkey):
+        tagged.setdefault(tag, []).append(hostname)
+
+    pipe = self.r_server.pipeline()
+    for tkey in self.r_server.scan_iter(TAG_HOSTS % "*",
+                                        count=self.scan_count):
+      pipe.delete(tkey)
+    for tag, hostnames in tagged.items():
+      pipe.sadd(TAG_HOSTS % tag, *hostnames)
+    pipe.execute()
+    log.debug("  indexed %d tags", len(tagged))
+
+    self.__rebuild_available()
+
+    self.r_server.set(INDEXES_BUILT, 1)
+    self.indexes_built = True
+    return True
+
+  def __rebuild_available(self):
+    # as __rebuild_registry() does, only add while scanning and then drop
+    # what's no longer available; host_allocate() skips any entry a
+    # concurrent assignment leaves stale
+    found = 0
+    for hkey in self.r_server.scan_iter("host_*", count=self.scan_count):
+      if self.__is_available(hkey):
+        self.r_server.sadd(AVAILABLE_HOSTS, hkey[len("host_"):])
+        found += 1
+
+    for hostname in self.r_server.sscan_iter(AVAILABLE_HOSTS,
+                                             count=self.scan_count):
+      if not self.__is_available("host_%s" % hostname):
+        self.r_server.srem(AVAILABLE_HOSTS, hostname)
+
+    log.debug("  indexed %d available hosts", found)
+    self.r_server.set(AVAILABLE_INDEXED, 1)
+    self.available_indexed = True
+
+  def __is_available(self, hkey):
+    status = self.r_server.hget(hkey, "status")
+    return bool(status) and int(status) == HostStatus.AVAILABLE
+
+  def __rebuild_registry(self, registry, prefix):
+    # only ever add while scanning, then drop the names whose record is
+    # gone; replacing the set wholesale could lose a concurrent add
+    found = 0
+    for key in self.r_server.scan_iter(prefix + "*", count=self.scan_count):
+      self.r_server.sadd(registry, key[len(prefix):])
+      found += 1
+
+    for name in self.r_server.sscan_iter(registry, count=self.scan_count):
+      if not self.r_server.exists(prefix + name):
+        self.r_server.srem(registry, name)
+
+    log.debug("  registered %d %s", found, registry)
+
+  def upgrade(self, batch_size=100):
+    # bring a database written by an older managerd up to date; safe to
+    # run while serving, and a no-op once done
+    migrated = self.migrate_tags(batch_size)
+    if self.r_server.exists(INDEXES_BUILT):
+      self.indexes_built = True
+      if not self.r_server.exists(AVAILABLE_INDEXED):
+        self.__rebuild_available()
+        return True
+      self.available_indexed = True
+      return migrated > 0
+    return self.rebuild_indexes()
+
+  def migrate_tags(self, batch_size=100):
+    # move the old space-separated "tags" hash field of every host into
+    # the tag sets.  This runs while managerd is serving: hosts are
+    # converted batch_size at a time, each batch under WATCH so that a
+    # concurrent tag_add/host_assign either lands before the batch is read
+    # or forces it to be redone.
+    if self.r_server.exists(TAGS_MIGRATED):
+      return 0
+
+    log.debug("migrate_tags")
+
+    migrated = 0
+    batch = []
+    for hkey in self.r_server.scan_iter("host_*", count=self.scan_count):
+      batch.append(hkey)
+      if len(batch) >= batch_size:
+        migrated += self.__migrate_tag_batch(batch)
+        batch = []
+    if batch:
+      migrated += self.__migrate_tag_batch(batch)
+
+    self.r_server.set(TAGS_MIGRATED, 1)
+    log.debug("  migrated tags of %d hosts", migrated)
+    return migrated
+
+  def __migrate_tag_batch(self, hkeys):
+    def migrate(pipe):
+      old_tags = [pipe.hget(hkey, "tags") for hkey in hkeys]
+
+      pipe.multi()
+      migrated = 0
+      for hkey, tags in zip(hkeys, old_tags):
+        if tags is None:
+          continue
+        hostname = hkey[len("host_"):]
+        tags = split_legacy_tags(tags)
+        if tags:
+          pipe.sadd(HOST_TAGS % hostname, *tags)
+        for tag in tags:
+          pipe.sadd(TAG_HOSTS % tag, hostname)
+        pipe.hdel(hkey, "tags")
+        migrated += 1
+      return migrated
+
+    return self.r_server.transaction(migrate, *hkeys,
+                                     value_from_callable=True)
@@ -0,0 +1,145 @@
+#
+# Per-RPC call and error counts, latency histograms and redis round trips,
+# for get_stats().
+#
+# instrument() replaces each of the handler's RPC methods with a wrapper
+# that times the call and files it under the RPC's name.  Latencies go
+# into a fixed histogram of log-spaced buckets, SUB_BUCKETS to every power
+# of two microseconds, so recording one costs a frexp() and a few adds
+# under the RPC's own lock, and the percentiles come out to within an
+# eighth however many calls there have been.
+#
+# Round trips are counted by redis_pool's connections calling
+# round_trip(), which charges them to the RPC running on that thread.
+# Should an RPC call another, that is one call, whose round trips include
+# the inner one's.  The wrapper also numbers the calls, for queued_logging
+# to tag their log lines with.
+#
+
+import itertools, math, threading, time
+
+SUB_BUCKETS = 8
+# 1us to about 2**28us (4.5 minutes); anything longer lands in the last
+BUCKETS = 28 * SUB_BUCKETS
+
+# the RPC in progress on each thread: whether there is one, its name, the
+# call's number and its round trips so far
+current = threading.local()
+
+# numbers the calls; next() on it is atomic
+call_numbers = itertools.count(1)
+
+def round_trip():
+  if getattr(current, "active", False):
+    current.round_trips += 1
+
+def bucket(seconds):
+  us = seconds * 1e6
+  if us < 1:
+    return 0
+  # us == mantissa * 2**exponent, with 0.5 <= mantissa < 1
+  (mantissa, exponent) = math.frexp(us)
+  index = ((exponent - 1) * SUB_BUCKETS +
+           int((mantissa - 0.5) * 2 * SUB_BUCKETS))
+  return min(index, BUCKETS - 1)
+
+def bucket_limit(index):
+  # the longest latency, in seconds, that bucket(index) holds
+  (power, sub) = divmod(index, SUB_BUCKETS)
+  return 2 ** power * (1 + float(sub + 1) / SUB_BUCKETS) / 1e6
+
+class MethodStats(object):
+  def __init__(self):
+    self.lock = threading.Lock()
+    self.reset()
+
+  def reset(self):
+    self.calls = 0
+    self.errors = 0
+    self.total = 0.0
+    self.max = 0.0
+    self.round_trips = 0
+    self.counts = [0] * BUCKETS
+
+  def record(self, elapsed, error, round_trips):
+    index = bucket(elapsed)
+    with self.lock:
+      self.calls += 1
+      if error:
+        self.errors += 1
+      self.total += elapsed
+      if elapsed > self.max:
+        self.max = elapsed
+      self.round_trips += round_trips
+      self.counts[index] += 1
+
+  def percentile(self, counts, calls, fraction):
+    # the bucket limit below which fraction of the calls fall
+    wanted = fraction * calls
+    seen = 0
+    for (index, count) in enumerate(counts):
+      seen += count
+      if seen >= wanted:
+        return bucket_limit(index)
+    return bucket_limit(BUCKETS - 1)
+
+  def summary(self, reset=False):
+    # (calls, errors, mean, p50, p95, p99, max, round trips per call),
+    # the latencies in seconds
+    with self.lock:
+      (calls, errors, total, longest, round_trips, counts) = (
+        self.calls, self.errors, self.total, self.max, self.round_trips,
+        self.counts)
+      if reset:
+        self.reset()
+    if not calls:
+      return (0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    # no percentile is reported beyond the longest call actually seen
+    return (calls, errors, total / calls,
+            min(self.percentile(counts, calls, 0.50), longest),
+            min(self.percentile(counts, calls, 0.95), longest),
+            min(self.percentile(counts, calls, 0.99), longest),
+            longest, float(round_trips) / calls)
+
+class RpcRecorder(object):
+  def __init__(self):
+    # RPC name -> MethodStats; filled in by instrument() and only read
+    # afterwards, so needing no lock of its own
+    self.methods = {}
+
+  def instrument(self, handler, names):
+    # wrap each of handler's methods named in names, on the instance
+    for name in names:
+      self.methods[name] = MethodStats()
+      setattr(handler, name, self.wrap(name, getattr(handler, name),
+                                       self.methods[name]))
+
+  def wrap(self, name, method, stats):
+    def instrumented(*args):
+      if getattr(current, "active", False):
+        # called from another RPC, which is timing it already
+        return method(*args)
+      current.active = True
+      current.rpc = name
+      current.call = next(call_numbers)
+      current.round_trips = 0
+      start = time.time()
+      error = True
+      try:
+        result = method(*args)
+        error = False
+        return result
+      finally:
+        current.active = False
+        current.rpc = current.call = None
+        stats.record(time.time() - start, error, current.round_trips)
+    return instrumented
+
+  def summaries(self, reset=False):
+    # name -> MethodStats.summary() for every RPC called at least once
+    summaries = {}
+    for (name, stats) in self.methods.items():
+      summary = stats.summary(reset)
+      if summary[0]:
+        summaries[name] = summary
+    return summaries
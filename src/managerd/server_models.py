@@ -0,0 +1,123 @@
+#
+# How managerd serves its thrift connections, chosen with --server_model.
+#
+#   threaded     a new thread for every connection (TThreadedServer); the
+#                default, but a burst of CLI runs or a reconnect storm
+#                from the tftpds can create hundreds of them
+#   threadpool   --workers threads, each serving one connection until it
+#                closes; further connections wait for a free thread, so
+#                there should be more workers than long-lived clients
+#                (tftpds, CLIs following changes or mappings)
+#   nonblocking  one thread select()s over every connection and hands each
+#                complete request to one of --workers threads, so idle
+#                connections cost no thread; needs --transport framed.
+#                A watch() holds its thread for as long as it waits, up to
+#                a minute, so only --max_watchers (half the workers by
+#                default) may wait at once; the rest answer straight away
+#                with no changes, leaving threads free for lookups
+#   processpool  --workers processes forked once the port is bound, which
+#                take turns accepting on it and each serve one connection
+#                until it closes.  Gets past the GIL, but every worker has
+#                its own storage connections, cache and change listener,
+#                so it needs --storage redis, the only engine that tells
+#                one managerd about another's writes
+#
+# With threadpool and processpool a client following changes holds a
+# worker for as long as it stays connected, whether it is in watch() or
+# not, so --workers has to cover those clients as well as the tftpds.
+#
+
+import sys, signal, threading, time
+
+from thrift.server import TServer
+
+SERVER_MODELS = ("threaded", "threadpool", "nonblocking", "processpool")
+
+# --workers when it isn't given
+DEFAULT_WORKERS = {
+  "threadpool": 32,
+  "nonblocking": 16,
+  "processpool": 4,
+}
+
+def add_arguments(parser):
+  parser.add_argument("--server_model", choices=SERVER_MODELS,
+                      default="threaded",
+                      help="how connections are served; see server_models.py")
+  parser.add_argument("--workers", type=int,
+                      help="threads (threadpool, nonblocking) or processes "
+                           "(processpool) serving requests; default %s" %
+                           ", ".join("%d for %s" % (DEFAULT_WORKERS[model],
+                                                    model)
+                                     for model in SERVER_MODELS
+                                     if model in DEFAULT_WORKERS))
+  parser.add_argument("--max_watchers", type=int,
+                      help="most watch() calls waiting for changes at once; "
+                           "the rest answer at once with none.  Default half "
+                           "of --workers for nonblocking, whose waiting "
+                           "watches each hold a worker, otherwise no limit")
+
+def check_arguments(parser, args):
+  # exits through parser.error() on a combination that can't work
+  if args.workers is None:
+    args.workers = DEFAULT_WORKERS.get(args.server_model)
+  elif args.workers < 1:
+    parser.error("--workers must be at least 1")
+  if args.max_watchers is None:
+    if args.server_model == "nonblocking":
+      args.max_watchers = args.workers // 2
+  elif args.max_watchers < 0:
+    parser.error("--max_watchers can't be negative")
+  if args.server_model == "nonblocking" and args.transport != "framed":
+    parser.error("--server_model nonblocking needs --transport framed")
+  if args.server_model == "processpool" and args.storage != "redis":
+    parser.error("--server_model processpool needs --storage redis")
+
+def make_server(model, workers, transport, make_processor, tfactory,
+                pfactory):
+  # make_processor() is called once here, or by a process pool once in
+  # each worker process after it is forked
+  if model == "threaded":
+    return TServer.TThreadedServer(make_processor(), transport, tfactory,
+                                   pfactory)
+  elif model == "threadpool":
+    # the workers never finish, so they mustn't keep managerd from exiting
+    server = TServer.TThreadPoolServer(make_processor(), transport, tfactory,
+                                       pfactory, daemon=True)
+    server.setNumThreads(workers)
+    return server
+  elif model == "nonblocking":
+    from thrift.server import TNonblockingServer
+    # frames messages itself, so there's no transport factory to give it
+    return TNonblockingServer.TNonblockingServer(make_processor(), transport,
+                                                 pfactory, threads=workers)
+  elif model == "processpool":
+    from thrift.server import TProcessPoolServer
+    server = TProcessPoolServer.TProcessPoolServer(None, transport, tfactory,
+                                                   pfactory)
+    server.setNumWorkers(workers)
+    def post_fork():
+      server.processor = make_processor()
+    server.setPostForkCallback(post_fork)
+    return server
+  raise ValueError("unknown server model %r" % model)
+
+def serve(model, server):
+  # until interrupted.  A process pool's parent waits for its workers in a
+  # way no signal can break into, and killing it alone leaves them
+  # running, so we wait for it here and take them down with it.
+  if model != "processpool":
+    server.serve()
+    return
+  # the workers inherit this, and exit quietly on SystemExit
+  signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+  thread = threading.Thread(target=server.serve)
+  thread.daemon = True
+  thread.start()
+  try:
+    while thread.is_alive():
+      time.sleep(1)
+  finally:
+    server.isRunning.value = False
+    for worker in server.workers:
+      worker.terminate()
@@ -0,0 +1,446 @@
+#
+# The sqlite storage engine: a single database file, for small sites that
+# don't want to run a redis daemon.
+#
+# The indexes mirror the redis ones: the unique macaddr column serves
+# lookup(), and hosts are found by project and by tag without a scan.
+#
+
+import sqlite3, threading, json
+
+from ucsd.ttypes import *
+
+import host_query
+from storage import *
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hosts (
+  name TEXT PRIMARY KEY,
+  status INTEGER NOT NULL,
+  owner TEXT NOT NULL DEFAULT '',
+  assigned_project TEXT NOT NULL DEFAULT '',
+  netboot_enabled INTEGER NOT NULL,
+  macaddr TEXT NOT NULL,
+  -- canonical_mac(macaddr)
+  mac TEXT NOT NULL UNIQUE
+);
+CREATE INDEX IF NOT EXISTS hosts_by_project ON hosts (assigned_project);
+-- for host_allocate() to find the available hosts
+CREATE INDEX IF NOT EXISTS hosts_by_status ON hosts (status, name);
+
+CREATE TABLE IF NOT EXISTS host_tags (
+  host TEXT NOT NULL REFERENCES hosts (name) ON DELETE CASCADE,
+  tag TEXT NOT NULL,
+  PRIMARY KEY (host, tag)
+);
+CREATE INDEX IF NOT EXISTS host_tags_by_tag ON host_tags (tag, host);
+
+CREATE TABLE IF NOT EXISTS projects (
+  name TEXT PRIMARY KEY,
+  nfsserver TEXT NOT NULL,
+  nfsroot TEXT NOT NULL,
+  kernel TEXT NOT NULL,
+  initrd TEXT NOT NULL,
+  params TEXT
+);
+
+CREATE TABLE IF NOT EXISTS users (
+  name TEXT PRIMARY KEY,
+  fullname TEXT
+);
+
+-- single values: the inventory generation
+CREATE TABLE IF NOT EXISTS counters (
+  name TEXT PRIMARY KEY,
+  value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO counters (name, value) VALUES ('generation', 0);
+
+-- the latest changes; args is a JSON object
+CREATE TABLE IF NOT EXISTS changes (
+  version INTEGER PRIMARY KEY,
+  op TEXT NOT NULL,
+  name TEXT NOT NULL,
+  args TEXT NOT NULL
+);
+"""
+
+
+def decode_args(args):
+  # json hands back unicode, thrift wants str
+  return dict((field.encode("utf-8"), value.encode("utf-8"))
+              for (field, value) in json.loads(args).items())
+
+def query_sql(expr, values):
+  # a SELECT of the hostnames a host_query expression selects, as
+  # INTERSECT/UNION/EXCEPT of the index lookups, appending its parameters
+  # to values
+  op = expr[0]
+  if op == "tag":
+    values.append(expr[1])
+    return "SELECT host FROM host_tags WHERE tag = ?"
+  elif op == "project":
+    values.append(expr[1])
+    return "SELECT name FROM hosts WHERE assigned_project = ?"
+  elif op == "available":
+    values.append(HostStatus.AVAILABLE)
+    return "SELECT name FROM hosts WHERE status = ?"
+  elif op == "not":
+    return "SELECT name FROM hosts EXCEPT " + query_operand(expr[1], values)
+  elif op == "or":
+    return " UNION ".join(query_operand(operand, values)
+                          for operand in expr[1])
+
+  # compound operators associate left to right, so the subtractions
+  # apply to the whole intersection
+  (positive, negated) = host_query.split_and(expr[1])
+  if positive:
+    sql = " INTERSECT ".join(query_operand(operand, values)
+                             for operand in positive)
+  else:
+    sql = "SELECT name FROM hosts"
+  for operand in negated:
+    sql += " EXCEPT " + query_operand(operand, values)
+  return sql
+
+def query_operand(expr, values):
+  # compounds can't be nested directly, only as subqueries
+  if expr[0] in host_query.LEAVES:
+    return query_sql(expr, values)
+  return "SELECT * FROM (%s)" % query_sql(expr, values)
+
+class SqliteStorage(Storage):
+  def __init__(self, path, change_log_length=10000):
+    self.change_log_length = change_log_length
+
+    # one connection shared by every handler thread; the lock serializes
+    # them, which also makes each call a single transaction
+    self.lock = threading.Lock()
+    self.db = sqlite3.connect(path, check_same_thread=False)
+    self.db.text_factory = str
+    self.db.execute("PRAGMA foreign_keys = ON")
+    if path != ":memory:":
+      self.db.execute("PRAGMA journal_mode = WAL")
+    with self.db:
+      self.db.executescript(SCHEMA)
+
+  #
+  # hosts, projects and users
+  #
+
+  def host_add(self, hostname, macaddr, status, netboot_enabled):
+    return self.host_add_batch([(hostname, macaddr)], status,
+                               netboot_enabled)[0]
+
+  def host_add_batch(self, hosts, status, netboot_enabled):
+    # one transaction; a failed INSERT only undoes itself
+    results = []
+    with self.lock:
+      with self.db:
+        for (hostname, macaddr) in hosts:
+          if self.__exists("hosts", hostname):
+            results.append(EXISTS)
+            continue
+          try:
+            self.db.execute(
+              "INSERT INTO hosts (name, status, netboot_enabled, macaddr, "
+              "mac) VALUES (?, ?, ?, ?, ?)",
+              (hostname, status, netboot_enabled, macaddr,
+               canonical_mac(macaddr)))
+            results.append(ADDED)
+          except sqlite3.IntegrityError:
+            results.append(MACADDR_TAKEN)
+    return results
+
+  def host_remove(self, hostname):
+    # tags go with it, by ON DELETE CASCADE
+    return self.__delete("hosts", hostname)
+
+  def host_exists(self, hostname):
+    with self.lock:
+      return self.__exists("hosts", hostname)
+
+  def project_add(self, name, nfsserver, nfsroot, kernel, initrd, params):
+    return self.__insert(
+      "INSERT INTO projects (name, nfsserver, nfsroot, kernel, initrd, "
+      "params) VALUES (?, ?, ?, ?, ?, ?)",
+      (name, nfsserver, nfsroot, kernel, initrd, params))
+
+  def project_remove(self, name):
+    return self.__delete("projects", name)
+
+  def user_add(self, username, fullname):
+    return self.__insert("INSERT INTO users (name, fullname) VALUES (?, ?)",
+                         (username, fullname))
+
+  def user_remove(self, username):
+    return self.__delete("users", username)
+
+  #
+  # queries
+  #
+
+  def project_names(self):
+    return [name for (name,) in self.__query("SELECT name FROM projects")]
+
+  def project_host_counts(self):
+    return dict(self.__query(
+      "SELECT p.name, COUNT(h.name) FROM projects p "
+      "LEFT JOIN hosts h ON h.assigned_project = p.name GROUP BY p.name"))
+
+  def host_names(self, project=None, tag=None):
+    if tag and project:
+      rows = self.__query(
+        "SELECT h.name FROM hosts h JOIN host_tags t ON t.host = h.name "
+        "WHERE t.tag = ? AND h.assigned_project = ?", (tag, project))
+    elif tag:
+      rows = self.__query("SELECT host FROM host_tags WHERE tag = ?", (tag,))
+    elif project:
+      rows = self.__query("SELECT name FROM hosts WHERE assigned_project = ?",
+                          (project,))
+    else:
+      rows = self.__query("SELECT name FROM hosts")
+    return [name for (name,) in rows]
+
+  def host_names_query(self, query):
+    values = []
+    sql = query_sql(query, values)
+    return [name for (name,) in self.__query(sql, values)]
+
+  def host_names_page(self, project, tag, cursor, limit):
+    # keyset pagination on the primary key: the cursor is the last name
+    # returned
+    if tag and project:
+      rows = self.__query(
+        "SELECT h.name FROM hosts h JOIN host_tags t ON t.host = h.name "
+        "WHERE t.tag = ? AND h.assigned_project = ? AND h.name > ? "
+        "ORDER BY h.name LIMIT ?", (tag, project, cursor, limit))
+    elif tag:
+      rows = self.__query(
+        "SELECT host FROM host_tags WHERE tag = ? AND host > ? "
+        "ORDER BY host LIMIT ?", (tag, cursor, limit))
+    elif project:
+      rows = self.__query(
+        "SELECT name FROM hosts WHERE assigned_project = ? AND name > ? "
+        "ORDER BY name LIMIT ?", (project, cursor, limit))
+    else:
+      rows = self.__query(
+        "SELECT name FROM hosts WHERE name > ? ORDER BY name LIMIT ?",
+        (cursor, limit))
+
+    hostnames = [name for (name,) in rows]
+    return (hostnames, hostnames[-1] if len(hostnames) == limit else "")
+
+  def hosts(self, hostnames, fields=None):
+    hostnames = list(hostnames)
+
+    # only the columns asked for; name comes first, to match rows up by
+    columns = ["name"] + [field for field in fields or HOST_FIELDS
+                          if field not in ("name", "tags")]
+    with_tags = fields is None or "tags" in fields
+
+    # fetch the records and tags in bounded batches, staying under
+    # sqlite's limit on bound parameters
+    records = []
+    tags = {}
+    for i in xrange(0, len(hostnames), 500):
+      chunk = hostnames[i:i + 500]
+      marks = ", ".join("?" * len(chunk))
+      with self.lock:
+        records.extend(self.db.execute(
+          "SELECT %s FROM hosts WHERE name IN (%s)" % (", ".join(columns),
+                                                       marks),
+          chunk))
+        if with_tags:
+          for (host, tag) in self.db.execute(
+              "SELECT host, tag FROM host_tags WHERE host IN (%s)" % marks,
+              chunk):
+            tags.setdefault(host, []).append(tag)
+
+    # keep the caller's order
+    by_name = dict((record[0], record) for record in records)
+
+    hosts = []
+    for hostname in hostnames:
+      record = by_name.get(hostname)
+      if record is None:
+        continue
+
+      host = Host(**dict(zip(columns, record)))
+      if host.netboot_enabled is not None:
+        host.netboot_enabled = bool(host.netboot_enabled)
+      if with_tags:
+        host.tags = " ".join(sorted(tags.get(hostname, ())))
+      hosts.append(host)
+    return hosts
+
+  def host_tags(self, hostname):
+    with self.lock:
+      if not self.__exists("hosts", hostname):
+        return None
+      return set(tag for (tag,) in self.db.execute(
+        "SELECT tag FROM host_tags WHERE host = ?", (hostname,)))
+
+  def lookup(self, macaddr):
+    return self.lookup_batch([macaddr])[0]
+
+  def lookup_batch(self, macaddrs):
+    macs = [canonical_mac(macaddr) for macaddr in macaddrs]
+
+    # one query per bounded batch, as in hosts()
+    rows = {}
+    for i in xrange(0, len(macs), 500):
+      chunk = macs[i:i + 500]
+      for row in self.__query(
+          "SELECT h.mac, h.name, h.status, h.assigned_project, p.name, "
+          "p.kernel, p.initrd, p.nfsserver, p.nfsroot, p.params FROM hosts h "
+          "LEFT JOIN projects p ON p.name = h.assigned_project "
+          "WHERE h.mac IN (%s)" % ", ".join("?" * len(chunk)), chunk):
+        rows[row[0]] = row[1:]
+
+    results = []
+    for mac in macs:
+      row = rows.get(mac)
+      if row is None:
+        results.append((None, None, None))
+        continue
+
+      (host, status, project, found) = row[:4]
+      if status != HostStatus.ASSIGNED:
+        results.append((host, None, None))
+      elif found is None:
+        results.append((host, project, None))
+      else:
+        results.append((host, project, tuple(row[4:])))
+    return results
+
+  def generation(self):
+    return self.__query(
+      "SELECT value FROM counters WHERE name = 'generation'")[0][0]
+
+  def changes(self, since_version, limit):
+    with self.lock:
+      (generation, oldest) = self.db.execute(
+        "SELECT value, (SELECT MIN(version) FROM changes) FROM counters "
+        "WHERE name = 'generation'").fetchone()
+      if not log_covers(since_version, generation, oldest):
+        return (generation, None)
+
+      return (generation, [
+        (version, op, name, decode_args(args))
+        for (version, op, name, args) in self.db.execute(
+          "SELECT version, op, name, args FROM changes WHERE version > ? "
+          "ORDER BY version LIMIT ?", (since_version, limit))])
+
+  #
+  # modifications
+  #
+
+  def record_change(self, op, name, args):
+    return self.record_changes([(op, name, args)])[0]
+
+  def record_changes(self, changes):
+    if not changes:
+      return []
+    with self.lock:
+      with self.db:
+        (version,) = self.db.execute("SELECT value FROM counters "
+                                     "WHERE name = 'generation'").fetchone()
+        versions = range(version + 1, version + 1 + len(changes))
+        self.db.executemany(
+          "INSERT INTO changes (version, op, name, args) VALUES (?, ?, ?, ?)",
+          [(v, op, name, json.dumps(args))
+           for (v, (op, name, args)) in zip(versions, changes)])
+        self.db.execute("UPDATE counters SET value = ? "
+                        "WHERE name = 'generation'", (versions[-1],))
+        self.db.execute("DELETE FROM changes WHERE version <= ?",
+                        (versions[-1] - self.change_log_length,))
+      return versions
+
+  def set_assignment(self, hostname, project, owner, status):
+    return self.set_assignment_batch([(hostname, project, owner)], status)[0]
+
+  def set_assignment_batch(self, assignments, status):
+    results = []
+    with self.lock:
+      with self.db:
+        for (hostname, project, owner) in assignments:
+          results.append(self.__assign(hostname, project, owner, status))
+    return results
+
+  def host_allocate(self, project, owner, count, query, status):
+    # picked and assigned in the one transaction
+    values = []
+    sql = query_sql(host_query.restrict_available(query), values)
+    with self.lock:
+      with self.db:
+        claimed = [name for (name,) in self.db.execute(
+          "SELECT * FROM (%s) LIMIT ?" % sql, values + [count])]
+        if len(claimed) < count:
+          raise NotEnoughHosts(len(claimed))
+        for hostname in claimed:
+          self.__assign(hostname, project, owner, status)
+    return claimed
+
+  def tag_add(self, hostname, tag):
+    return self.tag_add_batch([(hostname, tag)])[0]
+
+  def tag_add_batch(self, tags):
+    results = []
+    with self.lock:
+      with self.db:
+        for (hostname, tag) in tags:
+          if not self.__exists("hosts", hostname):
+            results.append(False)
+            continue
+          self.db.execute(
+            "INSERT OR IGNORE INTO host_tags (host, tag) VALUES (?, ?)",
+            (hostname, tag))
+          results.append(True)
+    return results
+
+  def tag_remove_all(self, hostname):
+    with self.lock:
+      if not self.__exists("hosts", hostname):
+        return False
+      with self.db:
+        self.db.execute("DELETE FROM host_tags WHERE host = ?", (hostname,))
+      return True
+
+  #
+  # helpers
+  #
+
+  def __exists(self, table, name):
+    # expects self.lock to be held
+    return self.db.execute("SELECT 1 FROM %s WHERE name = ?" % table,
+                           (name,)).fetchone() is not None
+
+  def __assign(self, hostname, project, owner, status):
+    # expects self.lock to be held, inside a transaction
+    updated = self.db.execute(
+      "UPDATE hosts SET assigned_project = ?, owner = ?, status = ? "
+      "WHERE name = ?", (project, owner, status, hostname)).rowcount
+    # a reassigned host starts out untagged
+    self.db.execute("DELETE FROM host_tags WHERE host = ?", (hostname,))
+    return updated > 0
+
+  def __insert(self, sql, values):
+    with self.lock:
+      try:
+        with self.db:
+          self.db.execute(sql, values)
+      except sqlite3.IntegrityError:
+        # the name is taken
+        return False
+      return True
+
+  def __delete(self, table, name):
+    with self.lock:
+      with self.db:
+        return self.db.execute("DELETE FROM %s WHERE name = ?" % table,
+                               (name,)).rowcount > 0
+
+  def __query(self, sql, values=()):
+    with self.lock:
+      return self.db.execute(sql, values).fetchall()
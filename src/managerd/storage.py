@@ -0,0 +1,249 @@
+#
+# The storage interface behind ClusterManagerHandler.
+#
+# The handler does the RPC-level work (argument checking, debug output,
+# building BootConfigs) and leaves every read and write of hosts,
+# projects, users, tags and their indexes to one of these engines:
+#
+#   redis   redis_storage.RedisStorage, the production engine
+#   memory  memory_storage.MemoryStorage, in-process dicts and sets, for
+#           tests and for benchmarking RPC logic without a network
+#   sqlite  sqlite_storage.SqliteStorage, an embedded database file for
+#           small sites that don't want to run a redis daemon
+#
+# Each call is atomic with respect to the others, as the redis engine's
+# Lua scripts are.
+#
+
+import re
+
+from ucsd.ttypes import Host, HostStatus
+
+import host_query
+
+# host_add() results
+ADDED = 1
+EXISTS = 0
+MACADDR_TAKEN = -1
+
+class NotEnoughHosts(Exception):
+  # raised by host_allocate() when fewer than the hosts asked for match
+  def __init__(self, available):
+    Exception.__init__(self, "only %d hosts available" % available)
+    self.available = available
+
+def log_covers(since_version, generation, oldest_version):
+  # whether a change log whose oldest entry is oldest_version (None if
+  # empty) still holds every change after since_version
+  if since_version > generation:
+    # from a database that has since been reset
+    return False
+  elif since_version == generation:
+    return True
+  return oldest_version is not None and oldest_version <= since_version + 1
+
+# every Host field, in thrift order; a projection is a subset of these
+HOST_FIELDS = tuple(spec[2] for spec in Host.thrift_spec if spec)
+
+def project_host(host, fields):
+  # a copy of host with only fields set; the cache's records are shared
+  projected = Host(name=host.name)
+  for field in fields:
+    setattr(projected, field, getattr(host, field))
+  return projected
+
+def canonical_mac(macaddr):
+  return macaddr.strip().lower()
+
+def split_legacy_tags(tags):
+  # the old "tags" hash field; tag_add joined with spaces while get_tags
+  # split on commas, so accept either
+  if not tags:
+    return set()
+  return set(t for t in re.split(r'[\s,]+', tags) if t)
+
+class Storage(object):
+  #
+  # hosts, projects and users
+  #
+
+  def host_add(self, hostname, macaddr, status, netboot_enabled):
+    # returns ADDED, EXISTS or MACADDR_TAKEN
+    raise NotImplementedError
+
+  def host_add_batch(self, hosts, status, netboot_enabled):
+    # host_add() for each (hostname, macaddr), in order; engines that can
+    # should do the lot in one round trip or transaction
+    return [self.host_add(hostname, macaddr, status, netboot_enabled)
+            for (hostname, macaddr) in hosts]
+
+  def host_remove(self, hostname):
+    raise NotImplementedError
+
+  def host_exists(self, hostname):
+    raise NotImplementedError
+
+  def project_add(self, name, nfsserver, nfsroot, kernel, initrd, params):
+    raise NotImplementedError
+
+  def project_remove(self, name):
+    raise NotImplementedError
+
+  def user_add(self, username, fullname):
+    raise NotImplementedError
+
+  def user_remove(self, username):
+    raise NotImplementedError
+
+  #
+  # queries
+  #
+
+  def project_names(self):
+    raise NotImplementedError
+
+  def project_host_counts(self):
+    # {project: number of hosts assigned to it} for every project
+    raise NotImplementedError
+
+  def host_names(self, project=None, tag=None):
+    # names of the hosts in project and/or carrying tag; all hosts if
+    # neither is given
+    raise NotImplementedError
+
+  def host_names_query(self, query):
+    # names of the hosts a host_query.parse() expression selects; engines
+    # that can should evaluate it on their indexes without fetching them
+    def names(kind, name):
+      if kind == "available":
+        every = self.hosts(self.host_names(), frozenset(["name", "status"]))
+        return set(host.name for host in every
+                   if host.status == HostStatus.AVAILABLE)
+      return set(self.host_names(**{kind: name}))
+    return host_query.evaluate(query, names,
+                               lambda: set(self.host_names()))
+
+  def host_names_page(self, project, tag, cursor, limit):
+    # (names, next cursor): about limit of the names host_names() would
+    # give, starting from cursor ("" for the first page).  The next cursor
+    # is "" once there are no more.  Hosts that exist throughout are
+    # returned at least once; ValueError if the cursor is bad.
+    raise NotImplementedError
+
+  def hosts(self, hostnames, fields=None):
+    # Host records for those names, skipping any that no longer exist.
+    # Given fields (a set of HOST_FIELDS, always including name), only
+    # those are read and set; the rest are left None.
+    raise NotImplementedError
+
+  def host_tags(self, hostname):
+    # the host's tags, or None if there is no such host
+    raise NotImplementedError
+
+  def lookup(self, macaddr):
+    # (host, project, (kernel, initrd, nfsserver, nfsroot, params)),
+    # with host None if no host has macaddr, project None if the host
+    # isn't assigned, and the boot configuration None if its project
+    # doesn't exist
+    raise NotImplementedError
+
+  def lookup_batch(self, macaddrs):
+    # lookup() for each macaddr, in order; engines that can should do the
+    # lot in one round trip
+    return [self.lookup(macaddr) for macaddr in macaddrs]
+
+  def generation(self):
+    # the inventory generation: the version of the latest change
+    raise NotImplementedError
+
+  def changes(self, since_version, limit):
+    # (generation, changes), where changes are the first limit changes
+    # after since_version as (version, op, name, args) tuples, or None if
+    # the log no longer reaches back that far
+    raise NotImplementedError
+
+  #
+  # modifications
+  #
+
+  def record_change(self, op, name, args):
+    # bump the generation and append the change to the capped change log,
+    # atomically, returning its version.  Called once a change has been
+    # made, never before, so that a client which has seen version N has
+    # seen every change up to it.
+    raise NotImplementedError
+
+  def record_changes(self, changes):
+    # record_change() for each (op, name, args)
+    return [self.record_change(op, name, args)
+            for (op, name, args) in changes]
+
+  def set_assignment(self, hostname, project, owner, status):
+    # move the host into project (or out of any, with an empty project)
+    # and clear its tags; False if there is no such host
+    raise NotImplementedError
+
+  def set_assignment_batch(self, assignments, status):
+    # set_assignment() for each (hostname, project, owner)
+    return [self.set_assignment(hostname, project, owner, status)
+            for (hostname, project, owner) in assignments]
+
+  def host_allocate(self, project, owner, count, query, status):
+    # atomically set_assignment() count of the AVAILABLE hosts selected by
+    # query (a host_query.parse() expression, or None for any), returning
+    # their names.  If fewer than count match, none are assigned and
+    # NotEnoughHosts says how many do.  Engines keep an index of the
+    # available hosts, so that claiming costs about count, not the
+    # inventory.
+    raise NotImplementedError
+
+  def tag_add(self, hostname, tag):
+    raise NotImplementedError
+
+  def tag_add_batch(self, tags):
+    # tag_add() for each (hostname, tag)
+    return [self.tag_add(hostname, tag) for (hostname, tag) in tags]
+
+  def tag_remove_all(self, hostname):
+    raise NotImplementedError
+
+  #
+  # maintenance; engines without older on-disk formats have nothing to do
+  #
+
+  def migrate_tags(self, batch_size=100):
+    return 0
+
+  def rebuild_indexes(self):
+    return True
+
+  def upgrade(self, batch_size=100):
+    # True if anything was rewritten
+    return False
+
+  def pool_stats(self):
+    return {}
+
+  def uncached(self):
+    # the engine itself, for reads that have to be at least as current as
+    # a generation just read; a cache returns the engine behind it
+    return self
+
+  #
+  # cache invalidation and change notification between managerd instances
+  # sharing the storage; engines private to one process don't need any
+  #
+
+  def publish_invalidation(self, message):
+    pass
+
+  def listen_invalidations(self, callback):
+    # arrange for callback(message) to be called with every message
+    # published by any managerd, and callback(None) whenever some may
+    # have been missed
+    pass
+
+  def listen_changes(self, callback):
+    # arrange for callback(version) to be called as any managerd records a
+    # change, and callback(None) whenever some may have been missed
+    pass
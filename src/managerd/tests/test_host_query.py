@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+# Tests of host_query's parser and evaluator.  Run from src/managerd with
+# python -m unittest discover tests
+
+import sys, os, unittest
+dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(dir, '..'))
+
+import host_query
+from host_query import parse
+
+class ParseTest(unittest.TestCase):
+  def test_names(self):
+    self.assertEqual(parse("rack12"), ("tag", "rack12"))
+    self.assertEqual(parse("tag:rack12"), ("tag", "rack12"))
+    self.assertEqual(parse("project:proj1"), ("project", "proj1"))
+    # only tag: and project: are prefixes
+    self.assertEqual(parse("zone:a"), ("tag", "zone:a"))
+    self.assertEqual(parse("tag:project:x"), ("tag", "project:x"))
+
+  def test_precedence(self):
+    # ! binds tightest, then &, then |
+    self.assertEqual(parse("a | b & !c"),
+                     ("or", (("tag", "a"),
+                             ("and", (("tag", "b"),
+                                      ("not", ("tag", "c")))))))
+    self.assertEqual(parse("(a | b) & c"),
+                     ("and", (("or", (("tag", "a"), ("tag", "b"))),
+                              ("tag", "c"))))
+
+  def test_whitespace(self):
+    self.assertEqual(parse("a&!b"), parse("  a &  ! b  "))
+
+  def test_flattening(self):
+    self.assertEqual(parse("a & (b & c)"),
+                     ("and", (("tag", "a"), ("tag", "b"), ("tag", "c"))))
+    self.assertEqual(parse("a | a | b"),
+                     ("or", (("tag", "a"), ("tag", "b"))))
+    self.assertEqual(parse("a & a"), ("tag", "a"))
+    self.assertEqual(parse("!!a"), ("tag", "a"))
+
+  def test_hashable(self):
+    # the cache keys on parsed queries
+    self.assertEqual(hash(parse("a & !(b | c)")),
+                     hash(parse("a&!(b|c)")))
+
+  def check_error(self, text):
+    self.assertRaises(ValueError, parse, text)
+
+  def test_errors(self):
+    for text in ["", "   ", "a &", "& a", "a | | b", "(a", "a)", "()",
+                 "a b", "!", "project:", "tag:"]:
+      self.check_error(text)
+
+  def test_limits(self):
+    self.assertEqual(parse("(" * host_query.MAX_DEPTH + "a" +
+                           ")" * host_query.MAX_DEPTH), ("tag", "a"))
+    self.check_error("(" * (host_query.MAX_DEPTH + 2) + "a" +
+                     ")" * (host_query.MAX_DEPTH + 2))
+    self.check_error("!" * (host_query.MAX_DEPTH + 2) + "a")
+    names = ["t%d" % i for i in range(host_query.MAX_NAMES + 1)]
+    parse(" | ".join(names[:-1]))
+    self.check_error(" | ".join(names))
+
+  def test_restrict_available(self):
+    self.assertEqual(host_query.restrict_available(None),
+                     host_query.AVAILABLE)
+    self.assertEqual(host_query.restrict_available(parse("a & b")),
+                     ("and", (host_query.AVAILABLE, ("tag", "a"),
+                              ("tag", "b"))))
+
+class EvaluateTest(unittest.TestCase):
+  HOSTS = {
+    "n1": ("proj1", ["rack1", "gpu"]),
+    "n2": ("proj1", ["rack1"]),
+    "n3": ("proj2", ["rack2", "gpu"]),
+    "n4": ("", ["rack2", "degraded"]),
+  }
+
+  def names(self, kind, name):
+    if kind == "project":
+      return set(host for (host, (project, tags)) in self.HOSTS.items()
+                 if project == name)
+    elif kind == "available":
+      return set(host for (host, (project, tags)) in self.HOSTS.items()
+                 if not project)
+    return set(host for (host, (project, tags)) in self.HOSTS.items()
+               if name in tags)
+
+  def select(self, query):
+    return host_query.evaluate(parse(query), self.names,
+                               lambda: set(self.HOSTS))
+
+  def test_evaluate(self):
+    self.assertEqual(self.select("gpu"), set(["n1", "n3"]))
+    self.assertEqual(self.select("project:proj1 & !gpu"), set(["n2"]))
+    self.assertEqual(self.select("rack2 | project:proj1"),
+                     set(["n1", "n2", "n3", "n4"]))
+    self.assertEqual(self.select("!gpu & !degraded"), set(["n2"]))
+    self.assertEqual(self.select("!(rack1 | rack2)"), set())
+    self.assertEqual(self.select("nosuchtag"), set())
+    self.assertEqual(self.select("!nosuchtag"), set(self.HOSTS))
+
+  def test_available(self):
+    self.assertEqual(
+      host_query.evaluate(host_query.restrict_available(parse("rack2")),
+                          self.names, lambda: set(self.HOSTS)),
+      set(["n4"]))
+
+if __name__ == "__main__":
+  unittest.main()
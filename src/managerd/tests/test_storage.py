@@ -0,0 +1,364 @@
+#!/usr/bin/env python
+
+# The storage contract (storage.py), checked against every engine: the
+# memory and sqlite engines always, CachedStorage in front of the memory
+# engine, and the redis engine if a redis server answers on localhost.
+# Run from src/managerd with
+#
+#   python -m unittest discover tests
+#
+# The redis tests FLUSH the database they use, db 15 unless
+# MANAGERD_TEST_REDIS_DB says otherwise.
+
+import sys, os, shutil, tempfile, unittest
+dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(dir, '..'))
+sys.path.append(os.path.join(dir, '../gen-py'))
+
+from ucsd.ttypes import *
+
+import host_query
+import managerd
+from storage import *
+from cached_storage import CachedStorage
+from memory_storage import MemoryStorage
+from sqlite_storage import SqliteStorage
+
+REDIS_DB = int(os.environ.get("MANAGERD_TEST_REDIS_DB", 15))
+
+def redis_available():
+  try:
+    import redis
+    return redis.Redis(db=REDIS_DB, socket_connect_timeout=1).ping()
+  except Exception:
+    return False
+
+def macaddr(i):
+  return "02:00:00:00:%02x:%02x" % ((i >> 8) & 0xff, i & 0xff)
+
+class StorageContract(object):
+  # mixed into a TestCase per engine, which provides make_store()
+
+  def setUp(self):
+    self.store = self.make_store()
+    self.store.upgrade()
+
+  def add_hosts(self, count, status=HostStatus.AVAILABLE):
+    for i in range(count):
+      self.assertEqual(self.store.host_add("node%d" % i, macaddr(i), status,
+                                           True), ADDED)
+
+  def names(self, **kwargs):
+    return sorted(self.store.host_names(**kwargs))
+
+  #
+  # hosts, projects and users
+  #
+
+  def test_host_add(self):
+    self.assertEqual(self.store.host_add("node0", macaddr(0),
+                                         HostStatus.AVAILABLE, True), ADDED)
+    self.assertTrue(self.store.host_exists("node0"))
+    self.assertFalse(self.store.host_exists("node1"))
+    self.assertEqual(self.store.host_add("node0", macaddr(1),
+                                         HostStatus.AVAILABLE, True), EXISTS)
+    # macaddrs are compared canonically
+    self.assertEqual(self.store.host_add("node1",
+                                         " " + macaddr(0).upper() + " ",
+                                         HostStatus.AVAILABLE, True),
+                     MACADDR_TAKEN)
+    self.assertEqual(self.names(), ["node0"])
+
+  def test_host_add_batch(self):
+    results = self.store.host_add_batch(
+      [("node0", macaddr(0)), ("node1", macaddr(1)), ("node0", macaddr(2)),
+       ("node2", macaddr(1))], HostStatus.AVAILABLE, True)
+    self.assertEqual(results, [ADDED, ADDED, EXISTS, MACADDR_TAKEN])
+    self.assertEqual(self.names(), ["node0", "node1"])
+
+  def test_host_remove(self):
+    self.add_hosts(2)
+    self.store.project_add("proj", "nfs", "/root/proj", "k", "i", "p")
+    self.store.set_assignment("node0", "proj", "user", HostStatus.ASSIGNED)
+    self.store.tag_add("node0", "rack1")
+
+    self.assertTrue(self.store.host_remove("node0"))
+    self.assertFalse(self.store.host_remove("node0"))
+    self.assertFalse(self.store.host_exists("node0"))
+    self.assertEqual(self.names(), ["node1"])
+    self.assertEqual(self.names(project="proj"), [])
+    self.assertEqual(self.names(tag="rack1"), [])
+    self.assertEqual(self.store.project_host_counts(), {"proj": 0})
+    self.assertEqual(self.store.lookup(macaddr(0)), (None, None, None))
+
+    # the macaddr is free again, and the name comes back without its tags
+    self.assertEqual(self.store.host_add("node0", macaddr(0),
+                                         HostStatus.AVAILABLE, True), ADDED)
+    self.assertEqual(self.store.host_tags("node0"), set())
+
+  def test_projects(self):
+    self.assertTrue(self.store.project_add("proj", "nfs", "/root/proj", "k",
+                                           "i", "p"))
+    self.assertFalse(self.store.project_add("proj", "nfs", "/root/other",
+                                            "k", "i", "p"))
+    self.assertTrue(self.store.project_add("other", "nfs", "/root/other",
+                                           "k", "i", "p"))
+    self.assertEqual(sorted(self.store.project_names()), ["other", "proj"])
+    self.assertTrue(self.store.project_remove("other"))
+    self.assertFalse(self.store.project_remove("other"))
+    self.assertEqual(list(self.store.project_names()), ["proj"])
+
+  def test_users(self):
+    self.assertTrue(self.store.user_add("alice", "Alice"))
+    self.assertFalse(self.store.user_add("alice", "Alice"))
+    self.assertTrue(self.store.user_remove("alice"))
+    self.assertFalse(self.store.user_remove("alice"))
+
+  #
+  # assignment and lookup
+  #
+
+  def test_set_assignment(self):
+    self.add_hosts(3)
+    self.store.project_add("proj", "nfs", "/root/proj", "k", "i", "p")
+    self.store.project_add("other", "nfs", "/root/other", "k", "i", "p")
+    self.store.tag_add("node0", "rack1")
+
+    self.assertTrue(self.store.set_assignment("node0", "proj", "user",
+                                              HostStatus.ASSIGNED))
+    self.assertTrue(self.store.set_assignment("node1", "proj", "user",
+                                              HostStatus.ASSIGNED))
+    self.assertFalse(self.store.set_assignment("nosuch", "proj", "user",
+                                               HostStatus.ASSIGNED))
+    self.assertEqual(self.names(project="proj"), ["node0", "node1"])
+    self.assertEqual(self.store.project_host_counts(),
+                     {"proj": 2, "other": 0})
+    # a reassigned host starts out untagged
+    self.assertEqual(self.store.host_tags("node0"), set())
+    self.assertEqual(self.names(tag="rack1"), [])
+
+    # moving and releasing
+    self.store.set_assignment("node1", "other", "user", HostStatus.ASSIGNED)
+    self.store.set_assignment("node0", "", "", HostStatus.AVAILABLE)
+    self.assertEqual(self.store.project_host_counts(),
+                     {"proj": 0, "other": 1})
+    [host] = self.store.hosts(["node1"])
+    self.assertEqual((host.assigned_project, host.owner, host.status),
+                     ("other", "user", HostStatus.ASSIGNED))
+
+  def test_set_assignment_batch(self):
+    self.add_hosts(2)
+    self.store.project_add("proj", "nfs", "/root/proj", "k", "i", "p")
+    self.assertEqual(self.store.set_assignment_batch(
+      [("node0", "proj", "user"), ("nosuch", "proj", "user"),
+       ("node1", "proj", "user")], HostStatus.ASSIGNED), [True, False, True])
+    self.assertEqual(self.names(project="proj"), ["node0", "node1"])
+
+  def test_lookup(self):
+    self.add_hosts(2)
+    self.store.project_add("proj", "nfs", "/root/proj", "vmlinuz", "initrd",
+                           "console=ttyS0")
+    self.assertEqual(self.store.lookup(macaddr(9)), (None, None, None))
+    self.assertEqual(self.store.lookup(macaddr(0)), ("node0", None, None))
+
+    self.store.set_assignment("node0", "proj", "user", HostStatus.ASSIGNED)
+    self.assertEqual(self.store.lookup(macaddr(0).upper()),
+                     ("node0", "proj", ("vmlinuz", "initrd", "nfs",
+                                        "/root/proj", "console=ttyS0")))
+    self.store.set_assignment("node1", "gone", "user", HostStatus.ASSIGNED)
+    self.assertEqual(self.store.lookup(macaddr(1)), ("node1", "gone", None))
+
+    self.assertEqual(self.store.lookup_batch([macaddr(1), macaddr(9),
+                                              macaddr(0)]),
+                     [self.store.lookup(macaddr(1)), (None, None, None),
+                      self.store.lookup(macaddr(0))])
+
+  def test_lookup_unset_params(self):
+    # thrift hands an unset params to project_add as None; every engine
+    # must give back the same '' for it
+    handler = managerd.ClusterManagerHandler(self.store, record_stats=False)
+    self.add_hosts(1)
+    self.assertTrue(handler.project_add("proj", "nfs", "/root/proj",
+                                        "vmlinuz", "initrd", None))
+    self.store.set_assignment("node0", "proj", "user", HostStatus.ASSIGNED)
+    self.assertEqual(self.store.lookup(macaddr(0)),
+                     ("node0", "proj", ("vmlinuz", "initrd", "nfs",
+                                        "/root/proj", "")))
+    self.assertEqual(handler.lookup(macaddr(0)).parameters, "")
+
+  def test_host_allocate(self):
+    self.add_hosts(4)
+    self.store.project_add("proj", "nfs", "/root/proj", "k", "i", "p")
+    for i in range(4):
+      self.store.tag_add("node%d" % i, "gpu" if i % 2 else "cpu")
+
+    claimed = self.store.host_allocate("proj", "user", 2, None,
+                                       HostStatus.ASSIGNED)
+    self.assertEqual(len(claimed), 2)
+    self.assertEqual(sorted(claimed), self.names(project="proj"))
+
+    # the rest, all or nothing
+    try:
+      self.store.host_allocate("proj", "user", 3, None, HostStatus.ASSIGNED)
+      self.fail("allocated more hosts than are available")
+    except NotEnoughHosts as e:
+      self.assertEqual(e.available, 2)
+    self.assertEqual(len(self.names(project="proj")), 2)
+
+    # constrained by a query, from what's left
+    free = set("node%d" % i for i in range(4)) - set(claimed)
+    gpus = set(name for name in free if int(name[4:]) % 2)
+    query = host_query.parse("gpu")
+    if gpus:
+      self.assertEqual(set(self.store.host_allocate(
+        "proj", "user", len(gpus), query, HostStatus.ASSIGNED)), gpus)
+    self.assertRaises(NotEnoughHosts, self.store.host_allocate, "proj",
+                      "user", 1, query, HostStatus.ASSIGNED)
+
+  #
+  # tags and queries
+  #
+
+  def test_tags(self):
+    self.add_hosts(3)
+    self.assertTrue(self.store.tag_add("node0", "rack1"))
+    self.assertTrue(self.store.tag_add("node0", "rack1"))
+    self.assertTrue(self.store.tag_add("node0", "gpu"))
+    self.assertFalse(self.store.tag_add("nosuch", "rack1"))
+    self.assertEqual(self.store.tag_add_batch(
+      [("node1", "rack1"), ("nosuch", "gpu"), ("node2", "rack2")]),
+      [True, False, True])
+
+    self.assertEqual(self.store.host_tags("node0"), set(["rack1", "gpu"]))
+    self.assertEqual(self.store.host_tags("nosuch"), None)
+    self.assertEqual(self.names(tag="rack1"), ["node0", "node1"])
+    [host] = self.store.hosts(["node0"])
+    self.assertEqual(host.tags, "gpu rack1")
+
+    self.assertTrue(self.store.tag_remove_all("node0"))
+    self.assertFalse(self.store.tag_remove_all("nosuch"))
+    self.assertEqual(self.store.host_tags("node0"), set())
+    self.assertEqual(self.names(tag="rack1"), ["node1"])
+    self.assertEqual(self.names(tag="gpu"), [])
+
+  def test_host_names_query(self):
+    self.add_hosts(4)
+    self.store.project_add("proj", "nfs", "/root/proj", "k", "i", "p")
+    self.store.set_assignment("node0", "proj", "user", HostStatus.ASSIGNED)
+    self.store.set_assignment("node1", "proj", "user", HostStatus.ASSIGNED)
+    self.store.tag_add("node0", "gpu")
+    self.store.tag_add("node2", "gpu")
+    self.store.tag_add("node3", "degraded")
+
+    def select(text):
+      return sorted(self.store.host_names_query(host_query.parse(text)))
+    self.assertEqual(select("gpu"), ["node0", "node2"])
+    self.assertEqual(select("project:proj & !gpu"), ["node1"])
+    self.assertEqual(select("gpu | degraded"), ["node0", "node2", "node3"])
+    self.assertEqual(select("!gpu & !degraded"), ["node1"])
+    self.assertEqual(select("nosuch"), [])
+
+  #
+  # records and paging
+  #
+
+  def test_hosts(self):
+    self.add_hosts(2)
+    hosts = self.store.hosts(["node1", "nosuch", "node0"])
+    self.assertEqual([host.name for host in hosts], ["node1", "node0"])
+    self.assertEqual((hosts[0].macaddr, hosts[0].status),
+                     (macaddr(1), HostStatus.AVAILABLE))
+
+    [host] = self.store.hosts(["node0"], frozenset(["name", "status"]))
+    self.assertEqual((host.name, host.status, host.macaddr, host.tags),
+                     ("node0", HostStatus.AVAILABLE, None, None))
+
+  def test_host_names_page(self):
+    self.add_hosts(10)
+    self.store.project_add("proj", "nfs", "/root/proj", "k", "i", "p")
+    for i in range(0, 10, 2):
+      self.store.set_assignment("node%d" % i, "proj", "user",
+                                HostStatus.ASSIGNED)
+
+    def every_page(project, tag, limit):
+      names = []
+      cursor = ""
+      for page in range(100):
+        (hostnames, cursor) = self.store.host_names_page(project, tag,
+                                                         cursor, limit)
+        names.extend(hostnames)
+        if not cursor:
+          return names
+      self.fail("paging never finished")
+
+    # hosts may be returned more than once, but none may be missed
+    self.assertEqual(sorted(set(every_page(None, None, 3))), self.names())
+    self.assertEqual(sorted(set(every_page("proj", None, 2))),
+                     self.names(project="proj"))
+    self.assertEqual(every_page("nosuch", None, 3), [])
+
+  #
+  # the change log
+  #
+
+  def test_changes(self):
+    generation = self.store.generation()
+    first = self.store.record_change("host_add", "node0",
+                                     {"macaddr": macaddr(0)})
+    second = self.store.record_change("host_remove", "node0", {})
+    [third] = self.store.record_changes([("project_add", "proj", {})])
+    self.assertTrue(generation < first < second < third)
+    self.assertEqual(self.store.generation(), third)
+
+    (current, changes) = self.store.changes(generation, 10)
+    self.assertEqual(current, third)
+    self.assertEqual([change[:3] for change in changes],
+                     [(first, "host_add", "node0"),
+                      (second, "host_remove", "node0"),
+                      (third, "project_add", "proj")])
+    self.assertEqual(changes[0][3], {"macaddr": macaddr(0)})
+
+    (current, changes) = self.store.changes(first, 1)
+    self.assertEqual([change[0] for change in changes], [second])
+    self.assertEqual(self.store.changes(third, 10), (third, []))
+    # from a database that has since been reset
+    self.assertEqual(self.store.changes(third + 100, 10), (third, None))
+
+class MemoryStorageTest(StorageContract, unittest.TestCase):
+  def make_store(self):
+    return MemoryStorage()
+
+  def test_log_overflow(self):
+    store = MemoryStorage(change_log_length=2)
+    versions = [store.record_change("host_add", "node%d" % i, {})
+                for i in range(4)]
+    self.assertEqual(store.changes(versions[0], 10), (versions[3], None))
+    (current, changes) = store.changes(versions[1], 10)
+    self.assertEqual([change[0] for change in changes], versions[2:])
+
+class CachedStorageTest(StorageContract, unittest.TestCase):
+  def make_store(self):
+    return CachedStorage(MemoryStorage())
+
+class SqliteStorageTest(StorageContract, unittest.TestCase):
+  def make_store(self):
+    self.dir = tempfile.mkdtemp()
+    return SqliteStorage(os.path.join(self.dir, "managerd.db"))
+
+  def tearDown(self):
+    shutil.rmtree(self.dir)
+
+@unittest.skipUnless(redis_available(),
+                     "no redis server on localhost")
+class RedisStorageTest(StorageContract, unittest.TestCase):
+  def make_store(self):
+    from redis_storage import RedisStorage
+    store = RedisStorage("localhost", db=REDIS_DB)
+    store.r_server.flushdb()
+    return store
+
+  def tearDown(self):
+    self.store.r_server.flushdb()
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,63 @@
+#
+# The thrift protocol and transport that managerd and its clients talk
+# over, chosen with --protocol and --transport.  Both ends have to agree.
+#
+#   binary       TBinaryProtocol, written in Python; the default
+#   accelerated  the same bytes on the wire as binary, but (de)serialized
+#                by the fastbinary C extension when thrift was built with
+#                it, and by the Python code otherwise
+#   compact      TCompactProtocol: varints and packed field headers, so
+#                smaller messages, at more CPU in Python
+#   json         TJSONProtocol, for debugging with ordinary tools; the
+#                largest and slowest, and only in thrift 0.9.1 and later
+#
+#   buffered     TBufferedTransport; the default
+#   framed       TFramedTransport, which prefixes each message with its
+#                length, as non-blocking servers need
+#
+
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+
+from ucsd import ClusterManager
+
+PROTOCOLS = ("binary", "accelerated", "compact", "json")
+TRANSPORTS = ("buffered", "framed")
+
+def protocol_factory(name):
+  if name == "binary":
+    return TBinaryProtocol.TBinaryProtocolFactory()
+  elif name == "accelerated":
+    return TBinaryProtocol.TBinaryProtocolAcceleratedFactory()
+  elif name == "compact":
+    from thrift.protocol import TCompactProtocol
+    return TCompactProtocol.TCompactProtocolFactory()
+  elif name == "json":
+    from thrift.protocol import TJSONProtocol
+    return TJSONProtocol.TJSONProtocolFactory()
+  raise ValueError("unknown thrift protocol %r" % name)
+
+def transport_factory(name):
+  if name == "buffered":
+    return TTransport.TBufferedTransportFactory()
+  elif name == "framed":
+    return TTransport.TFramedTransportFactory()
+  raise ValueError("unknown thrift transport %r" % name)
+
+def add_arguments(parser):
+  # the same options for managerd and every client, since they must match
+  parser.add_argument("--protocol", choices=PROTOCOLS, default="binary",
+                      help="thrift protocol between managerd and clients")
+  parser.add_argument("--transport", choices=TRANSPORTS, default="buffered",
+                      help="thrift transport between managerd and clients")
+
+def client(host, port, protocol="binary", transport="buffered", timeout=None):
+  # (transport, ClusterManager.Client), not yet opened.  timeout, in
+  # seconds, bounds each socket operation; by default they wait forever.
+  socket = TSocket.TSocket(host, port)
+  if timeout:
+    socket.setTimeout(timeout * 1000)
+  trans = transport_factory(transport).getTransport(socket)
+  proto = protocol_factory(protocol).getProtocol(trans)
+  return (trans, ClusterManager.Client(proto))
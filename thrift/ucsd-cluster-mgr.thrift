@@ -16,16 +16,23 @@ enum HostStatus {
 	AVAILABLE = 2
 }
 
+# only name is always set: host queries given a list of fields leave the
+# others out
 struct Host {
 	1: required string name,
-	2: required HostStatus status,
-	3: required string owner,
-	4: required string assigned_project,
-	5: required bool netboot_enabled,
-	6: required string macaddr
-	7: required string tags
+	2: optional HostStatus status,
+	3: optional string owner,
+	4: optional string assigned_project,
+	5: optional bool netboot_enabled,
+	6: optional string macaddr
+	7: optional string tags
 }
 
+# field lists for the host queries, for callers that don't need whole
+# records
+const list<string> NAMES_ONLY = ["name"]
+const list<string> MAPPING_FIELDS = ["name", "assigned_project", "tags"]
+
 struct Project {
 	1: required string name,
   2: required string nfsserver,
@@ -49,6 +56,86 @@ struct BootConfig {
   6: required string parameters
 }
 
+# restricts the hosts get_hosts_page() returns; either or both may be set
+struct HostFilter {
+  1: string project,
+  2: string tag
+}
+
+# one page of get_hosts_page(); pass cursor back for the next, unless it is
+# empty, which means there are no more
+struct HostsPage {
+  1: required list<Host> hosts,
+  2: required string cursor
+}
+
+# items of the batch calls
+struct HostSpec {
+  1: required string host,
+  2: required string macaddr
+}
+
+struct Assignment {
+  1: required string host,
+  2: required string project,
+  3: string user
+}
+
+struct HostTag {
+  1: required string host,
+  2: required string tag
+}
+
+# the answer to get_hosts_if_changed(); hosts is only set if the inventory
+# has changed since the generation the client gave
+struct HostsUpdate {
+  1: required i64 generation,
+  2: optional list<Host> hosts
+}
+
+# one change to the inventory, as logged for get_changes(): op is the
+# name of the RPC that made it (or an op the client should treat as
+# "resync"), name the host, project or user it was made to, and args the
+# RPC's other arguments
+struct Change {
+  1: required i64 version,
+  2: required string op,
+  3: required string name,
+  4: required map<string,string> args
+}
+
+# a page of get_changes(): pass version back as since_version for the next
+# one.  If resync_required is set the log no longer reaches back to
+# since_version; reload everything and continue from version.
+struct ChangesPage {
+  1: required i64 version,
+  2: required list<Change> changes,
+  3: required bool more,
+  4: required bool resync_required
+}
+
+# restricts the changes watch() returns; unset fields match any change
+struct ChangeFilter {
+  1: list<string> ops,
+  # the host, project or user changed
+  2: list<string> names
+}
+
+# how one RPC has fared since managerd started, or since get_stats() was
+# last asked to reset: its calls, those that raised, latencies in
+# milliseconds (the percentiles to within an eighth) and the average
+# redis round trips per call
+struct RpcStats {
+  1: required i64 calls,
+  2: required i64 errors,
+  3: required double mean_ms,
+  4: required double p50_ms,
+  5: required double p95_ms,
+  6: required double p99_ms,
+  7: required double max_ms,
+  8: required double redis_round_trips
+}
+
 #
 # Exceptions
 #
@@ -70,6 +157,12 @@ exception BadHostException {
 exception BadUserException {
 }
 
+# host_allocate() found fewer matching AVAILABLE hosts than it was asked for
+exception NotEnoughHostsException {
+	1: i32 requested,
+	2: i32 available
+}
+
 service ClusterManager {
 	#
 	# log-in / authentication
@@ -83,9 +176,27 @@ service ClusterManager {
 
 	void ping(),
 
+	# managerd's redis connection pool: size, utilization, time spent
+	# waiting for a free connection
+	map<string,double> get_pool_stats(),
+
+	# managerd's read cache: size, hits and misses, invalidations
+	map<string,double> get_cache_stats(),
+
+	# serve every read from storage rather than the cache, for debugging
+	void set_cache_bypass(1:required bool bypass),
+
+	# RpcStats for every RPC this managerd has served, by name; reset
+	# starts the counts afresh after reading them
+	map<string,RpcStats> get_stats(1:bool reset),
+
 	bool host_add(1:required string host, 2:required string macaddr),
 	bool host_remove(1:required string host),
 
+	# host_add() for every host in one call; the result says, for each in
+	# turn, whether it was added
+	list<bool> host_add_batch(1:required list<HostSpec> hosts),
+
 	bool project_add(1:required string name,
                    2:required string nfsserver,
                    3:required string rootpath,
@@ -106,15 +217,65 @@ service ClusterManager {
 
 	list<string> get_projects(),
 
+	# number of hosts currently assigned to each project
+	map<string,i32> get_project_host_counts(),
+
 	# project and/or tag can be specified to restrict the hosts returned
 	#  if you specify a tag, but no project, you get a client exception
 	#
-	list<Host> get_hosts(1:string project, 2:string tag)
+	# fields names the Host fields to return (name is always included),
+	# e.g. NAMES_ONLY; all of them if it is empty or unset.  The host
+	# queries below take it too.
+	#
+	list<Host> get_hosts(1:string project, 2:string tag,
+	                     3:list<string> fields)
 		throws (1:ClientError clix, 2:BadProjectException prjx),
 
+	# get_hosts() for the hosts a query selects, e.g.
+	#   project:proj1 & (rack12 | rack13) & !degraded
+	# A bare name is a tag and project:NAME the hosts in a project; !
+	# binds tightest, then &, then |.  ClientError if it doesn't parse.
+	list<Host> get_hosts_query(1:required string query,
+	                           2:list<string> fields)
+		throws (1:ClientError clix),
+
+	# bumped by every change to hosts, projects, users or tags
+	i64 get_generation(),
+
+	# get_hosts(project, tag), but only if anything has changed since
+	# since_generation; pollers pass back the generation they last got
+	HostsUpdate get_hosts_if_changed(1:required i64 since_generation,
+	                                 2:string project, 3:string tag,
+	                                 4:list<string> fields)
+		throws (1:ClientError clix),
+
+	# the changes made after since_version, oldest first, at most limit
+	# (or a server-set maximum) of them
+	ChangesPage get_changes(1:required i64 since_version, 2:i32 limit)
+		throws (1:ClientError clix),
+
+	# get_changes() for the changes matching filter, waiting up to
+	# timeout_ms (capped by the server) for one if there are none yet.
+	# version skips past the changes that didn't match, so pass it back
+	# as since_version for the next call; an empty page means none
+	# happened in time.  Use it instead of polling get_hosts() or
+	# get_hosts_if_changed(), e.g. with since_version set to
+	# get_generation().
+	ChangesPage watch(1:required i64 since_version, 2:i32 timeout_ms,
+	                  3:ChangeFilter filter),
+
 	list<string> get_tags(1:required string host)
 		throws (1:BadHostException hostx),
 
+	# get_hosts(), a page at a time: start with an empty cursor, and keep
+	# passing back the one returned until it comes back empty.  A page
+	# holds about limit hosts (capped by the server) and may even be empty
+	# part way through.  Hosts that exist for the whole walk are returned
+	# at least once.
+	HostsPage get_hosts_page(1:HostFilter filter, 2:string cursor,
+	                         3:i32 limit, 4:list<string> fields)
+		throws (1:ClientError clix),
+
 	#
 	# project/host/tag modification methods
 	#
@@ -126,12 +287,32 @@ service ClusterManager {
 			2:BadProjectException projx,
 			3:BadUserException userx),
 
+	# atomically host_assign() count AVAILABLE hosts to project (and user),
+	# returning them; all or none.  constraints, if set, is a
+	# get_hosts_query() expression the hosts must match, e.g.
+	# "rack12 & !degraded".
+	list<Host> host_allocate(1:required string project,
+	                         2:required i32 count,
+	                         3:string constraints,
+	                         4:string user)
+		throws (1:ClientError clix,
+			2:BadProjectException projx,
+			3:NotEnoughHostsException availx),
+
+	# host_assign() for every assignment in one call; the result says,
+	# for each in turn, whether the host existed and was assigned
+	list<bool> host_assign_batch(1:required list<Assignment> assignments),
+
 	void host_release(1:required string host)
 		throws (1:BadHostException hostx),
 
 	void tag_add(1:required string host, 2:required string tag)
 		throws (1:BadHostException hostx),
 
+	# tag_add() for every host/tag pair in one call; the result says, for
+	# each in turn, whether the host existed and was tagged
+	list<bool> tag_add_batch(1:required list<HostTag> tags),
+
 	void tag_removeAll(1:required string host)
 		throws (1:BadHostException hostx),
 
@@ -139,5 +320,9 @@ service ClusterManager {
   # lookup method used by the tftp server
   #
   BootConfig lookup(1:required string macaddr)
-    throws (1:BadHostException hostx)
+    throws (1:BadHostException hostx),
+
+  # lookup() for every macaddr in one call, e.g. for a rack booting at
+  # once; only the macaddrs that lookup() would answer for are in the map
+  map<string,BootConfig> lookup_batch(1:required list<string> macaddrs)
 }